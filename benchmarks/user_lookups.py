@@ -0,0 +1,135 @@
+"""
+Latency of FirebaseUserRepository.get_user / get_user_by_email against a fake
+Firebase backend where every Auth and Firestore call sleeps for a fixed
+latency. The serial baseline reproduces the previous implementation (Auth,
+then Firestore).
+
+    python -m benchmarks.user_lookups [--latency-ms 30] [--calls 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import types
+from types import SimpleNamespace
+
+
+class FakeDocument:
+    def __init__(self, user_id: str, latency: float):
+        self.id = user_id
+        self.exists = True
+        self._latency = latency
+
+    def get(self):
+        time.sleep(self._latency)
+        return self
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "email": f"{self.id}@example.com", "alias": self.id}
+
+
+class FakeQuery:
+    def __init__(self, email: str, latency: float):
+        self._email = email
+        self._latency = latency
+
+    def where(self, filter=None):
+        return self
+
+    def limit(self, count: int):
+        return self
+
+    def stream(self):
+        time.sleep(self._latency)
+        yield FakeDocument(self._email.split("@")[0], self._latency)
+
+
+class FakeCollection:
+    def __init__(self, latency: float):
+        self._latency = latency
+
+    def document(self, user_id: str) -> FakeDocument:
+        return FakeDocument(user_id, self._latency)
+
+    def where(self, filter=None) -> FakeQuery:
+        return FakeQuery(filter.value, self._latency)
+
+
+def install_fake_firebase(latency: float):
+    def user_record(user_id: str):
+        time.sleep(latency)
+        return SimpleNamespace(
+            uid=user_id, email=f"{user_id}@example.com", display_name=user_id
+        )
+
+    module = types.ModuleType("src.infrastructure.db.firebase")
+    module.auth_client = SimpleNamespace(
+        get_user=user_record,
+        get_user_by_email=lambda email: user_record(email.split("@")[0]),
+    )
+    module.db = SimpleNamespace(collection=lambda name: FakeCollection(latency))
+    sys.modules["src.infrastructure.db.firebase"] = module
+    return module
+
+
+def serial_get_user(firebase, user_id: str):
+    user_record = firebase.auth_client.get_user(user_id)
+    doc = firebase.db.collection("users").document(user_id).get()
+    return user_record, doc.to_dict()
+
+
+def serial_get_user_by_email(firebase, email: str):
+    user_record = firebase.auth_client.get_user_by_email(email)
+    doc = firebase.db.collection("users").document(user_record.uid).get()
+    return user_record, doc.to_dict()
+
+
+def measure(call, calls: int) -> float:
+    samples = []
+    for number in range(calls):
+        started = time.perf_counter()
+        call(f"user{number}")
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency-ms", type=float, default=30)
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    firebase = install_fake_firebase(args.latency_ms / 1000)
+    from src.infrastructure.repositories.firebase_user_repository import (
+        FirebaseUserRepository,
+    )
+
+    repository = FirebaseUserRepository()
+    cases = [
+        ("get_user (serial)", lambda uid: serial_get_user(firebase, uid)),
+        ("get_user", repository.get_user),
+        ("get_user_async", lambda uid: asyncio.run(repository.get_user_async(uid))),
+        (
+            "get_user_by_email (serial)",
+            lambda uid: serial_get_user_by_email(firebase, f"{uid}@example.com"),
+        ),
+        (
+            "get_user_by_email",
+            lambda uid: repository.get_user_by_email(f"{uid}@example.com"),
+        ),
+        (
+            "get_user_by_email_async",
+            lambda uid: asyncio.run(
+                repository.get_user_by_email_async(f"{uid}@example.com")
+            ),
+        ),
+    ]
+    print(f"simulated latency per call: {args.latency_ms:.0f} ms")
+    for name, call in cases:
+        print(f"{name:<30} median {measure(call, args.calls):7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
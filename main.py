@@ -1,10 +1,24 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Iterator, Literal
+from fastapi import Depends, FastAPI, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from strawberry.fastapi import GraphQLRouter
 from src.interface.graphql.schema import schema
 from src.interface.graphql.context import get_context
+from src.adapters.firebase_adapter import firebase_adapter
+import json
+import msgpack
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    firebase_adapter.start()
+    yield
+    await firebase_adapter.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -20,3 +34,52 @@ app.include_router(graphql_app, prefix="/graphql")
 @app.get("/")
 def read_root():
     return {"message": "Welcome to the Authentication Service!"}
+
+
+@app.get("/metrics")
+def read_metrics():
+    return firebase_adapter.stats()
+
+
+def _ndjson_chunks(pages: Iterator[list[dict]]) -> Iterator[bytes]:
+    for users in pages:
+        yield "".join(json.dumps(user) + "\n" for user in users).encode()
+
+
+def _msgpack_chunks(pages: Iterator[list[dict]]) -> Iterator[bytes]:
+    packer = msgpack.Packer()
+    for users in pages:
+        yield b"".join(packer.pack(user) for user in users)
+
+
+async def require_verified_token(
+    authorization: str | None = Header(default=None),
+) -> dict:
+    """Verify the request's Bearer token; anything else is a 401."""
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=401,
+            detail="Authorization required",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    try:
+        return await firebase_adapter.token_repository.verify_token_async(token)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=401, detail=str(e), headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+@app.get("/users/export")
+def export_users(
+    export_format: Literal["ndjson", "msgpack"] = Query("ndjson", alias="format"),
+    verified_token: dict = Depends(require_verified_token),
+):
+    """Stream every user, one Auth page at a time, as NDJSON or msgpack."""
+    pages = firebase_adapter.user_use_cases.export_users()
+    if export_format == "msgpack":
+        return StreamingResponse(
+            _msgpack_chunks(pages), media_type="application/x-msgpack"
+        )
+    return StreamingResponse(_ndjson_chunks(pages), media_type="application/x-ndjson")
@@ -1,14 +1,131 @@
 from ..infrastructure.repositories.firebase_user_repository import (
     FirebaseUserRepository,
 )
+from ..infrastructure.repositories.caching_user_repository import (
+    CachingUserRepository,
+)
 from ..infrastructure.repositories.token_auth_repository import TokenAuthRepository
+from ..infrastructure.cache.user_change_feed import UserChangeFeed
+from ..infrastructure.db.firebase import db
+from ..infrastructure.rest.http_client import (
+    close_async_http_client,
+    close_http_client,
+)
+from ..infrastructure.rest.firebase_auth_api import (
+    identity_toolkit_breaker,
+    secure_token_breaker,
+)
 from ..application.user_use_cases import UserUseCases
 from ..application.token_use_cases import TokenUseCases
+from ..application.password_reset_dispatcher import PasswordResetDispatcher
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+password_reset_workers = int(os.getenv("PASSWORD_RESET_WORKERS", "4"))
+password_reset_max_attempts = int(os.getenv("PASSWORD_RESET_MAX_ATTEMPTS", "3"))
+password_reset_dedupe = float(os.getenv("PASSWORD_RESET_DEDUPE_SECONDS", "60"))
+password_reset_queue_size = int(os.getenv("PASSWORD_RESET_QUEUE_SIZE", "10000"))
+user_email_precheck = os.getenv("USER_EMAIL_PRECHECK", "false").lower() == "true"
+user_change_feed_enabled = (
+    os.getenv("USER_CHANGE_FEED_ENABLED", "false").lower() == "true"
+)
+# Sin el feed, una réplica no se entera de los cambios hechos en otra y
+# serviría perfiles viejos durante todo el TTL: la cache va apagada por defecto.
+user_cache_enabled = (
+    os.getenv("USER_CACHE_ENABLED", str(user_change_feed_enabled)).lower() == "true"
+)
+user_cache_max_entries = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+user_cache_ttl = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+user_change_feed_collection = os.getenv("USER_CHANGE_FEED_COLLECTION", "user_changes")
 
 
 class FirebaseAdapter:
     def __init__(self):
-        self.user_repository = FirebaseUserRepository()
+        self.firebase_user_repository = FirebaseUserRepository()
+        self.user_repository = self.firebase_user_repository
+        self.user_cache = None
+        if user_cache_enabled:
+            self.user_cache = CachingUserRepository(
+                self.firebase_user_repository,
+                max_entries=user_cache_max_entries,
+                ttl=user_cache_ttl,
+            )
+            self.user_repository = self.user_cache
+            self.firebase_user_repository.add_change_listener(
+                self.user_cache.invalidate
+            )
         self.token_repository = TokenAuthRepository()
-        self.user_use_cases = UserUseCases(self.user_repository)
+        self.password_reset_dispatcher = PasswordResetDispatcher(
+            self.user_repository,
+            workers=password_reset_workers,
+            max_attempts=password_reset_max_attempts,
+            dedupe_seconds=password_reset_dedupe,
+            max_queue_size=password_reset_queue_size,
+        )
+        self.user_use_cases = UserUseCases(
+            self.user_repository,
+            self.password_reset_dispatcher,
+            email_precheck=user_email_precheck,
+        )
         self.token_use_cases = TokenUseCases(self.token_repository)
+        # Cambios hechos por este servicio invalidan el estado de revocación
+        self.firebase_user_repository.add_change_listener(
+            self.token_repository.invalidate_user
+        )
+        # Cambios hechos por otras réplicas llegan por el feed de Firestore
+        self.user_change_feed = None
+        if user_change_feed_enabled:
+            self.user_change_feed = UserChangeFeed(
+                db, collection=user_change_feed_collection
+            )
+            self.firebase_user_repository.add_change_listener(
+                self.user_change_feed.publish, self.user_change_feed.publish_many
+            )
+            if self.user_cache:
+                self.user_change_feed.subscribe(self.user_cache.invalidate)
+            self.user_change_feed.subscribe(self.token_repository.invalidate_user)
+
+    def start(self) -> None:
+        """Start background workers (key/revocation refresh, reset emails)."""
+        self.token_repository.verifier.key_cache.start()
+        if self.token_repository.revocation_cache:
+            self.token_repository.revocation_cache.start()
+        self.password_reset_dispatcher.start()
+        if self.user_change_feed:
+            self.user_change_feed.start()
+
+    async def stop(self) -> None:
+        self.token_repository.verifier.key_cache.stop()
+        if self.token_repository.revocation_cache:
+            self.token_repository.revocation_cache.stop()
+        self.password_reset_dispatcher.stop()
+        if self.user_change_feed:
+            self.user_change_feed.stop()
+        close_http_client()
+        await close_async_http_client()
+
+    def stats(self) -> dict:
+        """Counters of the caches and upstream circuit breakers, for /metrics."""
+        token_repository = self.token_repository
+        revocation_cache = token_repository.revocation_cache
+        return {
+            "token_cache": token_repository.cache_stats(),
+            "token_refresh": token_repository.refresh_stats(),
+            "public_keys": token_repository.verifier.key_cache.stats(),
+            "token_prefilter": token_repository.prefilter.stats(),
+            "revocation_cache": revocation_cache.stats() if revocation_cache else None,
+            "user_cache": self.user_cache.stats() if self.user_cache else None,
+            "user_change_feed": (
+                self.user_change_feed.stats() if self.user_change_feed else None
+            ),
+            "password_reset_queue": self.password_reset_dispatcher.stats(),
+            "circuit_breakers": {
+                breaker.name: breaker.stats()
+                for breaker in (identity_toolkit_breaker, secure_token_breaker)
+            },
+        }
+
+
+# Instancia compartida por todo el proceso (caches incluidas)
+firebase_adapter = FirebaseAdapter()
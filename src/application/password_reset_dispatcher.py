@@ -0,0 +1,157 @@
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable
+from ..domain.repositories.user_repository import UserRepository
+
+_STOP = object()
+
+
+class PasswordResetDispatcher:
+    """
+    Background queue for password reset emails. ``enqueue`` only records the
+    request; worker threads call Firebase with bounded concurrency, retry
+    transient failures with exponential backoff and skip repeat requests for
+    the same email made within ``dedupe_seconds``.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        workers: int = 4,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+        dedupe_seconds: float = 60.0,
+        max_queue_size: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.user_repository = user_repository
+        self.workers = workers
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.dedupe_seconds = dedupe_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._recent: dict[str, float] = {}
+        self._threads: list[threading.Thread] = []
+        self._latencies: deque[float] = deque(maxlen=1000)
+        self.in_flight = 0
+        self.enqueued = 0
+        self.deduplicated = 0
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self.last_error: str | None = None
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        for number in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name=f"password-reset-{number}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Let the workers drain what is already queued, then stop them."""
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def enqueue(self, email: str) -> bool:
+        """
+        Queue a reset email. Returns False when the same email was queued
+        within the dedupe window and the request was dropped.
+        """
+        key = email.strip().lower()
+        now = self._clock()
+        with self._lock:
+            last = self._recent.get(key)
+            if last is not None and now - last < self.dedupe_seconds:
+                self.deduplicated += 1
+                return False
+            try:
+                self._queue.put_nowait((email, now))
+            except queue.Full:
+                raise ValueError("Too many password reset requests, try again later")
+            self._recent[key] = now
+            self.enqueued += 1
+            if len(self._recent) > 2 * self._queue.maxsize:
+                self._prune(now)
+        return True
+
+    def _prune(self, now: float) -> None:
+        self._recent = {
+            key: queued_at
+            for key, queued_at in self._recent.items()
+            if now - queued_at < self.dedupe_seconds
+        }
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            email, enqueued_at = item
+            with self._lock:
+                self.in_flight += 1
+            try:
+                self._deliver(email)
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+                    self._latencies.append(self._clock() - enqueued_at)
+
+    def _deliver(self, email: str) -> None:
+        for attempt in range(self.max_attempts):
+            try:
+                self.user_repository.send_password_reset_email(email)
+                with self._lock:
+                    self.sent += 1
+                return
+            except ValueError as e:
+                # Rejected by Firebase (unknown email, bad request): not transient.
+                error = e
+                break
+            except Exception as e:
+                error = e
+                if attempt + 1 == self.max_attempts:
+                    break
+                with self._lock:
+                    self.retried += 1
+                self._sleep(self.retry_delay * 2**attempt)
+        with self._lock:
+            self.failed += 1
+            self.last_error = str(error)
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                "queue_depth": self._queue.qsize(),
+                "in_flight": self.in_flight,
+                "enqueued": self.enqueued,
+                "deduplicated": self.deduplicated,
+                "sent": self.sent,
+                "failed": self.failed,
+                "retried": self.retried,
+                "last_error": self.last_error,
+                "drain_latency_p50": _percentile(latencies, 0.50),
+                "drain_latency_p95": _percentile(latencies, 0.95),
+                "drain_latency_max": latencies[-1] if latencies else 0.0,
+            }
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[
+        min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    ]
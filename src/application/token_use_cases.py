@@ -1,3 +1,4 @@
+import asyncio
 from ..domain.repositories.token_repository import TokenRepository
 from ..domain.entities.token import Token
 from ..domain.entities.refresh_token import RefreshToken
@@ -6,13 +7,63 @@ from ..domain.entities.refresh_token import RefreshToken
 class TokenUseCases:
     """Use cases for managing tokens, coordinating between service and repository layers."""
 
-    def __init__(self, token_repository: TokenRepository):
+    def __init__(
+        self,
+        token_repository: TokenRepository,
+        max_workers: int = 8,
+        max_batch_size: int = 100,
+    ):
         self.token_repository = token_repository
+        self.max_workers = max_workers
+        self.max_batch_size = max_batch_size
 
     def verify_token(self, id_token: str) -> dict | None:
         token: Token = self.token_repository.verify_token(id_token)
         return token if token else None
 
+    async def verify_token_async(self, id_token: str) -> dict | None:
+        token: Token = await self.token_repository.verify_token_async(id_token)
+        return token if token else None
+
+    async def verify_tokens_async(self, id_tokens: list[str]) -> list[dict]:
+        """
+        Verify several tokens concurrently, at most ``max_workers`` at a time.
+        Returns one ``{"token": ..., "error": ...}`` entry per input, in the
+        same order.
+        """
+        return await self._gather_results(id_tokens, self.verify_token_async)
+
+    async def refresh_tokens_async(self, refresh_tokens: list[str]) -> list[dict]:
+        """
+        Refresh several tokens concurrently, at most ``max_workers`` upstream
+        requests at a time. Returns one ``{"token": ..., "error": ...}`` entry
+        per input, in the same order.
+        """
+        return await self._gather_results(refresh_tokens, self.refresh_token_async)
+
+    async def _gather_results(self, tokens: list[str], operation) -> list[dict]:
+        if len(tokens) > self.max_batch_size:
+            raise ValueError(
+                f"Too many tokens (maximum {self.max_batch_size} per request)"
+            )
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run(token: str) -> dict:
+            async with semaphore:
+                try:
+                    return {"token": await operation(token), "error": None}
+                except Exception as e:
+                    # Upstream outages (not ValueErrors) also fail one item only.
+                    return {"token": None, "error": str(e)}
+
+        return await asyncio.gather(*(run(token) for token in tokens))
+
     def refresh_token(self, refresh_token: str) -> RefreshToken | None:
         refresh_token: RefreshToken = self.token_repository.refresh_token(refresh_token)
         return refresh_token.to_dict() if refresh_token else None
+
+    async def refresh_token_async(self, refresh_token: str) -> RefreshToken | None:
+        refresh_token: RefreshToken = await self.token_repository.refresh_token_async(
+            refresh_token
+        )
+        return refresh_token.to_dict() if refresh_token else None
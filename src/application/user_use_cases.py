@@ -1,23 +1,39 @@
+import time
+from typing import Iterator
 from ..domain.entities.user import User
 from ..domain.entities.token import Token
 from ..domain.repositories.user_repository import UserRepository
+from .password_reset_dispatcher import PasswordResetDispatcher
+
+# Límite de Firebase Auth por página
+MAX_USERS_PAGE_SIZE = 1000
 
 
 class UserUseCases:
     """Use cases for managing users, coordinating between service and repository layers."""
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_reset_dispatcher: PasswordResetDispatcher | None = None,
+        email_precheck: bool = False,
+    ):
         self.user_repository = user_repository
+        self.password_reset_dispatcher = password_reset_dispatcher
+        # Sin pre-check, login y recuperación de contraseña van directo a
+        # Firebase, que ya responde EMAIL_NOT_FOUND para emails desconocidos.
+        self.email_precheck = email_precheck
 
     def create_user(self, email: str, password: str, alias: str | None = None) -> dict:
-        """Create a new user."""
+        """
+        Create a new user. There is no pre-flight email lookup: Firebase
+        rejects duplicates atomically and the repository reports them as
+        "User with this email already exists".
+        """
         if not User.validate_email(email):
             raise ValueError("Invalid email format")
         if not User.validate_password(password):
             raise ValueError("Invalid password format (minimum 8 characters)")
-        existing_user = self.user_repository.get_user_by_email(email)
-        if existing_user:
-            raise ValueError("User with this email already exists")
 
         created_user = self.user_repository.create_user(email, password, alias)
         return created_user.to_dict_no_password()
@@ -28,17 +44,120 @@ class UserUseCases:
             raise ValueError("Invalid email format")
         if not User.validate_password(password):
             raise ValueError("Invalid password format (minimum 8 characters)")
-        existing_user = self.user_repository.get_user_by_email(email)
-        if not existing_user:
+        if self.email_precheck and not self.user_repository.get_user_by_email(email):
             raise ValueError("No user found with this email")
 
         logged_user_token: Token = self.user_repository.login_user(email, password)
         return logged_user_token.to_dict() if logged_user_token else None
 
+    async def login_user_async(self, email: str, password: str) -> dict | None:
+        """Log in a user without blocking the event loop."""
+        if not User.validate_email(email):
+            raise ValueError("Invalid email format")
+        if not User.validate_password(password):
+            raise ValueError("Invalid password format (minimum 8 characters)")
+        if (
+            self.email_precheck
+            and not await self.user_repository.get_user_by_email_async(email)
+        ):
+            raise ValueError("No user found with this email")
+
+        logged_user_token: Token = await self.user_repository.login_user_async(
+            email, password
+        )
+        return logged_user_token.to_dict() if logged_user_token else None
+
+    def import_users(self, records: list[dict]) -> dict:
+        """
+        Validate ``{"email", "password", "alias"}`` records with the User
+        rules and create the valid ones in bulk. Returns a report with one
+        error per rejected record (by its position in ``records``), one
+        warning per account created without its profile, and the import
+        throughput.
+        """
+        started = time.perf_counter()
+        errors = {}
+        valid_positions, users, seen_emails = [], [], set()
+        for position, record in enumerate(records):
+            error = self._import_record_error(record, seen_emails)
+            if error:
+                errors[position] = error
+                continue
+            seen_emails.add(record["email"].lower())
+            valid_positions.append(position)
+            users.append(
+                User(
+                    email=record["email"],
+                    password=record["password"],
+                    alias=record.get("alias"),
+                )
+            )
+
+        failures = self.user_repository.import_users(users) if users else {}
+        warnings = {}
+        for index, reason in failures.items():
+            if users[index].id:
+                warnings[valid_positions[index]] = reason
+            else:
+                errors[valid_positions[index]] = reason
+
+        elapsed = time.perf_counter() - started
+        imported = sum(1 for user in users if user.id)
+        return {
+            "total": len(records),
+            "imported": imported,
+            "failed": len(errors),
+            "errors": [
+                {
+                    "index": position,
+                    "email": records[position].get("email"),
+                    "error": errors[position],
+                }
+                for position in sorted(errors)
+            ],
+            "warnings": [
+                {
+                    "index": position,
+                    "email": records[position].get("email"),
+                    "warning": warnings[position],
+                }
+                for position in sorted(warnings)
+            ],
+            "elapsed_seconds": round(elapsed, 3),
+            "users_per_second": round(imported / elapsed, 1) if elapsed else 0.0,
+        }
+
+    @staticmethod
+    def _import_record_error(record: dict, seen_emails: set) -> str | None:
+        email = record.get("email") or ""
+        if not User.validate_email(email):
+            return "Invalid email format"
+        if not User.validate_password(record.get("password") or ""):
+            return "Invalid password format (minimum 8 characters)"
+        alias = record.get("alias")
+        if alias is not None and not User.validate_alias(alias):
+            return "Invalid alias format (3-30 characters)"
+        if email.lower() in seen_emails:
+            return "Duplicate email in import"
+        return None
+
     def get_user(self, user_id: str) -> dict | None:
         user = self.user_repository.get_user(user_id)
         return user.to_dict_no_password() if user else None
 
+    async def get_user_async(self, user_id: str) -> dict | None:
+        user = await self.user_repository.get_user_async(user_id)
+        return user.to_dict_no_password() if user else None
+
+    def get_users(self, user_ids: list[str]) -> list[dict | None]:
+        """Users aligned with ``user_ids``, with None for unknown uids."""
+        if len(user_ids) > MAX_USERS_PAGE_SIZE:
+            raise ValueError(f"Too many user ids (maximum {MAX_USERS_PAGE_SIZE})")
+        if not user_ids:
+            return []
+        users = self.user_repository.get_users(user_ids)
+        return [user.to_dict_no_password() if user else None for user in users]
+
     def get_user_by_email(self, email: str) -> User | None:
         """Get user by email."""
         return self.user_repository.get_user_by_email(email)
@@ -61,27 +180,67 @@ class UserUseCases:
         self._handle_update_input(user_data)
         user = User(**user_data)
 
-        existing_user = self.user_repository.get_user(user.id)
+        # El diff se calcula sobre el estado real: con la cache, otra réplica
+        # pudo cambiar el usuario y una escritura "sin cambios" se perdería.
+        existing_user = self.user_repository.get_user_uncached(user.id)
         if not existing_user:
             raise ValueError("User not found")
-        if (
-            existing_user.email != user.email
-            and self.user_repository.get_user_by_email(user.email)
-        ):
+
+        changes = self._changed_fields(existing_user, user)
+        if not changes:
+            return existing_user.to_dict_no_password()
+        if "email" in changes and self.user_repository.get_user_by_email(user.email):
             raise ValueError("Email already in use")
 
-        updated_user = self.user_repository.update_user(user)
+        updated_user = self.user_repository.update_user_fields(user.id, changes)
 
         return updated_user.to_dict_no_password() if updated_user else None
 
+    @staticmethod
+    def _changed_fields(existing_user: User, user: User) -> dict:
+        """Fields of ``user`` that were given and differ from the stored user."""
+        changes = {}
+        if user.email and user.email != existing_user.email:
+            changes["email"] = user.email
+        if user.alias is not None and user.alias != existing_user.alias:
+            changes["alias"] = user.alias
+        if user.password:
+            changes["password"] = user.password
+        return changes
+
     def send_password_reset_email(self, email: str) -> dict:
         if not User.validate_email(email):
             raise ValueError("Invalid email format")
-        if not self.user_repository.get_user_by_email(email):
+        if self.email_precheck and not self.user_repository.get_user_by_email(email):
             raise ValueError("No user found with this email")
 
         return self.user_repository.send_password_reset_email(email)
 
+    async def send_password_reset_email_async(self, email: str) -> dict:
+        if not User.validate_email(email):
+            raise ValueError("Invalid email format")
+        if (
+            self.email_precheck
+            and not await self.user_repository.get_user_by_email_async(email)
+        ):
+            raise ValueError("No user found with this email")
+
+        return await self.user_repository.send_password_reset_email_async(email)
+
+    def queue_password_reset_email(self, email: str) -> dict:
+        """
+        Validate the email and hand it to the dispatch queue without waiting
+        for Firebase. Unknown emails are dropped by the worker, so the answer
+        is the same whether or not an account exists.
+        """
+        if self.password_reset_dispatcher is None:
+            return self.send_password_reset_email(email)
+        if not User.validate_email(email):
+            raise ValueError("Invalid email format")
+
+        self.password_reset_dispatcher.enqueue(email)
+        return {"success": True, "response": email}
+
     def delete_user(self, user_id: str) -> None:
         """Delete a user by ID."""
         existing_user = self.user_repository.get_user(user_id)
@@ -90,6 +249,45 @@ class UserUseCases:
 
         self.user_repository.delete_user(user_id)
 
+    def delete_users(self, user_ids: list[str]) -> dict:
+        """
+        Delete many users without per-user pre-checks. Returns one
+        ``{"user_id", "deleted", "error"}`` outcome per distinct uid, in input
+        order.
+        """
+        unique_ids = list(dict.fromkeys(user_id for user_id in user_ids if user_id))
+        failures = self.user_repository.delete_users(unique_ids) if unique_ids else {}
+        results = [
+            {
+                "user_id": user_id,
+                "deleted": user_id not in failures,
+                "error": failures.get(user_id),
+            }
+            for user_id in unique_ids
+        ]
+        return {
+            "total": len(unique_ids),
+            "deleted": len(unique_ids) - len(failures),
+            "failed": len(failures),
+            "results": results,
+        }
+
     def list_users(self) -> list[dict]:
         users = self.user_repository.list_users()
         return [user.to_dict_no_password() for user in users]
+
+    def export_users(self) -> Iterator[list[dict]]:
+        """Yield all users page by page, so callers can stream them."""
+        for users in self.user_repository.iter_user_pages():
+            yield [user.to_dict_no_password() for user in users]
+
+    def list_users_page(self, first: int = 100, after: str | None = None) -> dict:
+        """One page of users; pass ``next_page_token`` as ``after`` for the next."""
+        if not 1 <= first <= MAX_USERS_PAGE_SIZE:
+            raise ValueError(f"first must be between 1 and {MAX_USERS_PAGE_SIZE}")
+
+        users, next_page_token = self.user_repository.list_users_page(first, after)
+        return {
+            "users": [user.to_dict_no_password() for user in users],
+            "next_page_token": next_page_token,
+        }
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 from ..entities.token import Token
@@ -10,6 +11,14 @@ class TokenRepository(ABC):
     def verify_token(self, id_token: str) -> Optional[Token]:
         pass
 
+    async def verify_token_async(self, id_token: str) -> Optional[Token]:
+        """Verify a token without blocking the event loop."""
+        return await asyncio.to_thread(self.verify_token, id_token)
+
     @abstractmethod
     def refresh_token(self, refresh_token: str) -> RefreshToken:
         pass
+
+    async def refresh_token_async(self, refresh_token: str) -> RefreshToken:
+        """Refresh a token without blocking the event loop."""
+        return await asyncio.to_thread(self.refresh_token, refresh_token)
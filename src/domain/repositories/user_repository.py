@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, Optional
 from ..entities.user import User
 from ..entities.token import Token
 
@@ -10,32 +11,112 @@ class UserRepository(ABC):
     def create_user(
         self, email: str, password: str, alias: Optional[str] = None
     ) -> User:
+        """Raise ValueError("User with this email already exists") on duplicates."""
         pass
 
     @abstractmethod
     def login_user(self, email: str, password: str) -> Optional[Token]:
         pass
 
+    async def login_user_async(self, email: str, password: str) -> Optional[Token]:
+        """Log in without blocking the event loop."""
+        return await asyncio.to_thread(self.login_user, email, password)
+
     @abstractmethod
     def get_user(self, user_id: str) -> Optional[User]:
         pass
 
+    async def get_user_async(self, user_id: str) -> Optional[User]:
+        return await asyncio.to_thread(self.get_user, user_id)
+
+    def get_user_uncached(self, user_id: str) -> Optional[User]:
+        """Like ``get_user`` but never served from a cache; read before writes."""
+        return self.get_user(user_id)
+
+    def get_users(self, user_ids: list[str]) -> list[Optional[User]]:
+        """Users aligned with ``user_ids``; None where a uid is unknown."""
+        users = []
+        for user_id in user_ids:
+            try:
+                users.append(self.get_user(user_id))
+            except ValueError:
+                users.append(None)
+        return users
+
     @abstractmethod
     def get_user_by_email(self, email: str) -> Optional[User]:
         pass
 
+    async def get_user_by_email_async(self, email: str) -> Optional[User]:
+        return await asyncio.to_thread(self.get_user_by_email, email)
+
     @abstractmethod
     def update_user(self, user: User) -> User:
         pass
 
+    def update_user_fields(self, user_id: str, changes: dict) -> User:
+        """
+        Update only the given fields ("email", "alias", "password") and return
+        the updated user. Implementations should skip backends none of the
+        changed fields live in.
+        """
+        current = self.get_user(user_id)
+        return self.update_user(
+            User(
+                id=user_id,
+                email=changes.get("email", current.email),
+                password=changes.get("password", ""),
+                alias=changes.get("alias", current.alias),
+            )
+        )
+
+    def import_users(self, users: list[User]) -> dict[int, str]:
+        """
+        Create many users at once (each with email, password and optional
+        alias); set ``id`` on the ones created. Returns the problems as
+        {position in ``users``: reason}; a reason for a user whose ``id`` was
+        set is a warning (the account exists, e.g. without its profile).
+        """
+        failures = {}
+        for index, user in enumerate(users):
+            try:
+                user.id = self.create_user(user.email, user.password, user.alias).id
+            except ValueError as e:
+                failures[index] = str(e)
+        return failures
+
     @abstractmethod
     def send_password_reset_email(self, email: str) -> dict:
         pass
 
+    async def send_password_reset_email_async(self, email: str) -> dict:
+        return await asyncio.to_thread(self.send_password_reset_email, email)
+
     @abstractmethod
     def delete_user(self, user_id: str) -> None:
         pass
 
+    def delete_users(self, user_ids: list[str]) -> dict[str, str]:
+        """Delete many users; returns the failures as {uid: reason}."""
+        failures = {}
+        for user_id in user_ids:
+            try:
+                self.delete_user(user_id)
+            except ValueError as e:
+                failures[user_id] = str(e)
+        return failures
+
     @abstractmethod
     def list_users(self) -> list[User]:
         pass
+
+    def iter_user_pages(self) -> Iterator[list[User]]:
+        """Yield every user, one page at a time."""
+        yield self.list_users()
+
+    @abstractmethod
+    def list_users_page(
+        self, max_results: int, page_token: Optional[str] = None
+    ) -> tuple[list[User], Optional[str]]:
+        """Return one page of users and the token of the next page (None at the end)."""
+        pass
@@ -0,0 +1,90 @@
+import os
+import time
+from typing import Optional
+import firebase_admin
+import jwt
+from firebase_admin import auth
+from .public_key_cache import PublicKeyCache
+
+ID_TOKEN_ISSUER_PREFIX = "https://securetoken.google.com/"
+
+
+class UnknownKeyIdError(auth.InvalidIdTokenError):
+    """
+    The token's "kid" is not among the loaded public keys. The keys may not
+    have loaded yet or may be about to rotate, so unlike other invalid tokens
+    this rejection must not be remembered.
+    """
+
+
+class IdTokenVerifier:
+    """
+    Verifies Firebase ID tokens against locally cached, already parsed public
+    keys. Raises the same firebase_admin errors as ``auth.verify_id_token``.
+    """
+
+    def __init__(
+        self,
+        key_cache: Optional[PublicKeyCache] = None,
+        project_id: Optional[str] = None,
+        clock_skew_seconds: int = 0,
+    ):
+        self.key_cache = key_cache or PublicKeyCache()
+        self._project_id = project_id
+        self.clock_skew_seconds = clock_skew_seconds
+
+    @property
+    def project_id(self) -> str:
+        if not self._project_id:
+            self._project_id = (
+                firebase_admin.get_app().project_id
+                if firebase_admin._apps
+                else os.getenv("GOOGLE_CLOUD_PROJECT")
+            )
+        if not self._project_id:
+            raise ValueError("Firebase project ID is required to verify ID tokens")
+        return self._project_id
+
+    def verify(self, id_token: str) -> dict:
+        """Verify signature and claims of an ID token and return its claims."""
+        if os.getenv("FIREBASE_AUTH_EMULATOR_HOST"):
+            # Emulator tokens are unsigned; let the SDK handle them.
+            return auth.verify_id_token(id_token)
+
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except jwt.InvalidTokenError as e:
+            raise auth.InvalidIdTokenError(str(e), cause=e)
+        if header.get("alg") != "RS256":
+            raise auth.InvalidIdTokenError(
+                f'Incorrect algorithm. Expected "RS256" but got "{header.get("alg")}"'
+            )
+        kid = header.get("kid")
+        public_key = self.key_cache.get(kid) if kid else None
+        if public_key is None:
+            raise UnknownKeyIdError(f'Unknown "kid" claim: {kid}')
+
+        try:
+            claims = jwt.decode(
+                id_token,
+                public_key,
+                algorithms=["RS256"],
+                audience=self.project_id,
+                issuer=ID_TOKEN_ISSUER_PREFIX + self.project_id,
+                leeway=self.clock_skew_seconds,
+                options={"require": ["exp", "iat", "aud", "iss", "sub"]},
+            )
+        except jwt.ExpiredSignatureError as e:
+            raise auth.ExpiredIdTokenError(str(e), cause=e)
+        except jwt.InvalidTokenError as e:
+            raise auth.InvalidIdTokenError(str(e), cause=e)
+
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise auth.InvalidIdTokenError('Invalid "sub" (subject) claim')
+        auth_time = claims.get("auth_time")
+        if auth_time is not None and auth_time > time.time() + self.clock_skew_seconds:
+            raise auth.InvalidIdTokenError('"auth_time" claim is in the future')
+
+        claims["uid"] = subject
+        return claims
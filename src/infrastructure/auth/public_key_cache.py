@@ -0,0 +1,152 @@
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Optional
+from cryptography import x509
+from ..rest.http_client import get_http_client
+
+ID_TOKEN_CERT_URI = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/"
+    "securetoken@system.gserviceaccount.com"
+)
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def _fetch_certificates(url: str) -> tuple[dict, Optional[int]]:
+    """Download the x509 certificates and the max-age advertised for them."""
+    response = get_http_client().get(url)
+    if response.status_code != 200:
+        raise ValueError(f"Failed to fetch public keys (HTTP {response.status_code})")
+    match = _MAX_AGE_PATTERN.search(response.headers.get("Cache-Control", ""))
+    return response.json(), int(match.group(1)) if match else None
+
+
+class PublicKeyCache:
+    """
+    Parsed public keys used to check ID token signatures, indexed by ``kid``.
+
+    A background thread refreshes the keys before the Cache-Control max-age
+    runs out. If a refresh fails the previous keys keep being served and the
+    refresh is retried with backoff, so verifications never wait on the network
+    once the first set of keys has been loaded.
+    """
+
+    def __init__(
+        self,
+        cert_url: str = ID_TOKEN_CERT_URI,
+        fetch: Callable[[str], tuple[dict, Optional[int]]] = _fetch_certificates,
+        refresh_ratio: float = 0.8,
+        default_max_age: int = 3600,
+        min_retry_seconds: float = 5.0,
+        max_retry_seconds: float = 300.0,
+        initial_load_timeout: float = 10.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.cert_url = cert_url
+        self._fetch = fetch
+        self.refresh_ratio = refresh_ratio
+        self.default_max_age = default_max_age
+        self.min_retry_seconds = min_retry_seconds
+        self.max_retry_seconds = max_retry_seconds
+        self.initial_load_timeout = initial_load_timeout
+        self._clock = clock
+        self._keys: dict[str, Any] = {}
+        self._expires_at = 0.0
+        self._next_refresh_at = 0.0
+        self._failures = 0
+        self._loaded = threading.Event()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._start_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.unknown_kid_lookups = 0
+
+    def start(self) -> None:
+        """Start the background refresher (idempotent)."""
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="public-key-refresher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+
+    def get(self, kid: str) -> Optional[Any]:
+        """Return the parsed public key for ``kid``, or None if it is unknown."""
+        if not self._loaded.is_set():
+            # Only the very first verification of the process can get here.
+            self.start()
+            self._loaded.wait(self.initial_load_timeout)
+        key = self._keys.get(kid)
+        if key is None:
+            # Keys may have rotated since the last refresh; ask for an early one.
+            self.unknown_kid_lookups += 1
+            self._wakeup.set()
+        return key
+
+    def known_kids(self) -> frozenset:
+        return frozenset(self._keys)
+
+    def is_loaded(self) -> bool:
+        return self._loaded.is_set()
+
+    def refresh(self) -> bool:
+        """Fetch and parse the certificates. Returns False if the refresh failed."""
+        try:
+            certificates, max_age = self._fetch(self.cert_url)
+            keys = {
+                kid: x509.load_pem_x509_certificate(pem.encode("utf-8")).public_key()
+                for kid, pem in certificates.items()
+            }
+            if not keys:
+                raise ValueError("No public keys returned")
+        except Exception:
+            self.refresh_failures += 1
+            self._failures += 1
+            backoff = min(
+                self.max_retry_seconds,
+                self.min_retry_seconds * 2 ** (self._failures - 1),
+            )
+            self._next_refresh_at = self._clock() + random.uniform(backoff / 2, backoff)
+            return False
+
+        now = self._clock()
+        max_age = max_age if max_age is not None else self.default_max_age
+        # Swap the whole dict so readers never see a partially built key set.
+        self._keys = keys
+        self._expires_at = now + max_age
+        self._next_refresh_at = now + max_age * self.refresh_ratio
+        self._failures = 0
+        self.refreshes += 1
+        self._loaded.set()
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            if self._clock() >= self._next_refresh_at:
+                self.refresh()
+            self._wakeup.wait(max(0.0, self._next_refresh_at - self._clock()))
+            if self._wakeup.is_set():
+                self._wakeup.clear()
+                # Unknown kid: refresh early, but never more than once per retry window.
+                self._next_refresh_at = min(
+                    self._next_refresh_at, self._clock() + self.min_retry_seconds
+                )
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._keys),
+            "expires_in": max(0.0, self._expires_at - self._clock()),
+            "stale": bool(self._keys) and self._clock() >= self._expires_at,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "unknown_kid_lookups": self.unknown_kid_lookups,
+        }
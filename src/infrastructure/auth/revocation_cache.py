@@ -0,0 +1,177 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+from firebase_admin import auth
+
+# auth.get_users accepts at most 100 identifiers per call.
+MAX_USERS_PER_LOOKUP = 100
+
+
+@dataclass
+class RevocationState:
+    exists: bool
+    disabled: bool
+    tokens_valid_after: int  # milliseconds since the epoch
+    fetched_at: float
+    last_used: float
+
+
+def _fetch_users(uids: list[str]) -> dict[str, tuple[bool, int]]:
+    """Return ``uid -> (disabled, tokens_valid_after_ms)`` for the existing users."""
+    result = auth.get_users([auth.UidIdentifier(uid) for uid in uids])
+    return {
+        user.uid: (user.disabled, user.tokens_valid_after_timestamp)
+        for user in result.users
+    }
+
+
+class RevocationCache:
+    """
+    Local copy of each user's ``tokens_valid_after`` and disabled flag, used to
+    give ``check_revoked=True`` semantics without an Admin API call per request.
+
+    Entries are trusted for ``ttl`` seconds. A background thread refreshes the
+    entries of recently seen users in bulk (100 uids per lookup) so hot users
+    never reach the network on the request path. ``invalidate`` drops an entry
+    right away, e.g. after this service updates or deletes the user.
+    """
+
+    def __init__(
+        self,
+        fetch_users: Callable[[list[str]], dict] = _fetch_users,
+        ttl: float = 30.0,
+        idle_ttl: float = 600.0,
+        max_entries: int = 100000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._fetch_users = fetch_users
+        self.ttl = ttl
+        self.idle_ttl = idle_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[str, RevocationState] = {}
+        self._invalidated_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+        self.bulk_refreshes = 0
+        self.refresh_failures = 0
+
+    def start(self) -> None:
+        """Start the background bulk refresher (idempotent)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="revocation-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def is_fresh(self, uid: str) -> bool:
+        entry = self._entries.get(uid)
+        return entry is not None and self._clock() - entry.fetched_at < self.ttl
+
+    def check(self, uid: str, issued_at: int) -> None:
+        """
+        Raise if a token for ``uid`` issued at ``issued_at`` (seconds) has been
+        revoked, or if the user is disabled or no longer exists.
+        """
+        entry = self._entries.get(uid)
+        if entry is not None and self._clock() - entry.fetched_at < self.ttl:
+            self.hits += 1
+        else:
+            self.misses += 1
+            entry = self.refresh([uid])[uid]
+        entry.last_used = self._clock()
+
+        if not entry.exists:
+            raise auth.UserNotFoundError("User not found")
+        if entry.disabled:
+            raise auth.UserDisabledError("User disabled")
+        if issued_at * 1000 < entry.tokens_valid_after:
+            raise auth.RevokedIdTokenError("The Firebase ID token has been revoked.")
+
+    def invalidate(self, uid: str) -> None:
+        with self._lock:
+            self._entries.pop(uid, None)
+            self._invalidated_at[uid] = self._clock()
+
+    def refresh(self, uids: Iterable[str]) -> dict[str, RevocationState]:
+        """Reload the state of ``uids`` with as few Admin API lookups as possible."""
+        uids = list(dict.fromkeys(uids))
+        states = {}
+        for start in range(0, len(uids), MAX_USERS_PER_LOOKUP):
+            chunk = uids[start : start + MAX_USERS_PER_LOOKUP]
+            requested_at = self._clock()
+            found = self._fetch_users(chunk)
+            now = self._clock()
+            with self._lock:
+                for uid in chunk:
+                    previous = self._entries.get(uid)
+                    disabled, valid_after = found.get(uid, (False, 0))
+                    states[uid] = RevocationState(
+                        exists=uid in found,
+                        disabled=disabled,
+                        tokens_valid_after=valid_after,
+                        fetched_at=now,
+                        last_used=previous.last_used if previous else now,
+                    )
+                    # Do not cache a lookup that raced with an invalidation.
+                    if self._invalidated_at.get(uid, 0.0) < requested_at:
+                        self._entries[uid] = states[uid]
+                self._trim()
+        return states
+
+    def _trim(self) -> None:
+        if len(self._entries) <= self.max_entries:
+            return
+        by_last_use = sorted(self._entries.items(), key=lambda item: item[1].last_used)
+        for uid, _ in by_last_use[: len(self._entries) - self.max_entries]:
+            del self._entries[uid]
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.ttl / 2):
+            now = self._clock()
+            with self._lock:
+                for uid in [
+                    uid
+                    for uid, entry in self._entries.items()
+                    if now - entry.last_used > self.idle_ttl
+                ]:
+                    del self._entries[uid]
+                for uid in [
+                    uid
+                    for uid, invalidated_at in self._invalidated_at.items()
+                    if now - invalidated_at > self.ttl
+                ]:
+                    del self._invalidated_at[uid]
+                stale = [
+                    uid
+                    for uid, entry in self._entries.items()
+                    if now - entry.fetched_at >= self.ttl / 2
+                ]
+            if not stale:
+                continue
+            try:
+                self.refresh(stale)
+                self.bulk_refreshes += 1
+            except Exception:
+                # Keep serving the current entries; they expire after ttl.
+                self.refresh_failures += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "bulk_refreshes": self.bulk_refreshes,
+            "refresh_failures": self.refresh_failures,
+        }
@@ -0,0 +1,92 @@
+import base64
+import binascii
+import json
+import os
+import time
+from collections import Counter
+from typing import Callable, Optional
+from ..cache.lru_ttl_cache import LRUTTLCache
+from .public_key_cache import PublicKeyCache
+
+
+class TokenPrefilter:
+    """
+    Cheap structural checks run before any signature verification, plus a small
+    negative cache of recently rejected token digests. Garbage, expired and
+    replayed bad tokens are rejected in microseconds with the same messages the
+    full verification would produce.
+    """
+
+    def __init__(
+        self,
+        key_cache: PublicKeyCache,
+        rejected_cache: Optional[LRUTTLCache] = None,
+        clock_skew_seconds: int = 0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.key_cache = key_cache
+        # An empty cache is falsy (it has __len__), hence the explicit check.
+        self.rejected_cache = (
+            rejected_cache
+            if rejected_cache is not None
+            else LRUTTLCache(max_entries=10000, default_ttl=300)
+        )
+        self.clock_skew_seconds = clock_skew_seconds
+        self._clock = clock
+        self.rejections = Counter()
+
+    def check(self, id_token: str, cache_key: str) -> None:
+        """Raise ValueError if the token can be rejected without crypto."""
+        message = self.rejected_cache.get(cache_key)
+        if message is not None:
+            self.rejections["negative_cache"] += 1
+            raise ValueError(message)
+
+        segments = id_token.split(".")
+        if len(segments) != 3:
+            self._reject(cache_key, "segments")
+        header = self._decode_segment(segments[0], cache_key)
+        payload = self._decode_segment(segments[1], cache_key)
+
+        if not os.getenv("FIREBASE_AUTH_EMULATOR_HOST"):
+            if header.get("alg") != "RS256":
+                self._reject(cache_key, "alg")
+            kid = header.get("kid")
+            if not isinstance(kid, str):
+                self._reject(cache_key, "kid")
+            # Unknown kids are not remembered: the key set may be about to rotate.
+            if self.key_cache.is_loaded() and self.key_cache.get(kid) is None:
+                self.rejections["kid"] += 1
+                raise ValueError("Invalid token")
+
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            self._reject(cache_key, "exp")
+        if exp <= self._clock() - self.clock_skew_seconds:
+            self._reject(cache_key, "expired", "Expired token")
+
+    def remember_rejection(self, cache_key: str, message: str) -> None:
+        """Remember a token the full verification rejected."""
+        self.rejected_cache.set(cache_key, message)
+
+    def _decode_segment(self, segment: str, cache_key: str) -> dict:
+        try:
+            decoded = json.loads(
+                base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+            )
+        except (binascii.Error, ValueError):
+            self._reject(cache_key, "encoding")
+        if not isinstance(decoded, dict):
+            self._reject(cache_key, "encoding")
+        return decoded
+
+    def _reject(self, cache_key: str, reason: str, message: str = "Invalid token"):
+        self.rejections[reason] += 1
+        self.remember_rejection(cache_key, message)
+        raise ValueError(message)
+
+    def stats(self) -> dict:
+        return {
+            "rejections": dict(self.rejections),
+            "negative_cache": self.rejected_cache.stats(),
+        }
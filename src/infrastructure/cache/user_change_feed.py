@@ -0,0 +1,118 @@
+import datetime
+import threading
+import time
+import uuid
+from typing import Callable, List, Optional
+from google.cloud.firestore_v1.base_query import FieldFilter
+
+# Límite de escrituras por batch de Firestore
+MARKER_BATCH_SIZE = 500
+
+
+class UserChangeFeed:
+    """
+    Cross-replica invalidation channel. Every user change made by a replica is
+    written as a small marker document; every replica watches the marker
+    collection with ``on_snapshot`` and hands the changed uid to its
+    subscribers (caches) as soon as Firestore delivers the new marker, usually
+    well under a second.
+
+    Markers carry an ``expire_at`` timestamp so a Firestore TTL policy on that
+    field can delete them.
+    """
+
+    def __init__(
+        self,
+        db,
+        collection: str = "user_changes",
+        marker_ttl_seconds: float = 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db = db
+        self.collection = collection
+        self.marker_ttl_seconds = marker_ttl_seconds
+        self._clock = clock
+        self.origin = uuid.uuid4().hex
+        self._subscribers: List[Callable[[str], None]] = []
+        self._watch = None
+        self._lock = threading.Lock()
+        self.published = 0
+        self.publish_failures = 0
+        self.received = 0
+
+    def subscribe(self, callback: Callable[[str], None]) -> None:
+        """Register a callback invoked with the uid of every remote change."""
+        self._subscribers.append(callback)
+
+    def publish(self, user_id: str) -> None:
+        """Announce a change. Never raises: the write itself already succeeded."""
+        try:
+            self.db.collection(self.collection).add(self._marker(user_id))
+            with self._lock:
+                self.published += 1
+        except Exception:
+            with self._lock:
+                self.publish_failures += 1
+
+    def publish_many(self, user_ids: List[str]) -> None:
+        """Announce a bulk change with batched writes of 500 markers."""
+        markers = self.db.collection(self.collection)
+        for start in range(0, len(user_ids), MARKER_BATCH_SIZE):
+            group = user_ids[start : start + MARKER_BATCH_SIZE]
+            batch = self.db.batch()
+            for user_id in group:
+                batch.set(markers.document(), self._marker(user_id))
+            try:
+                batch.commit()
+                with self._lock:
+                    self.published += len(group)
+            except Exception:
+                with self._lock:
+                    self.publish_failures += len(group)
+
+    def _marker(self, user_id: str) -> dict:
+        now = self._clock()
+        return {
+            "uid": user_id,
+            "origin": self.origin,
+            "changed_at": now,
+            "expire_at": datetime.datetime.fromtimestamp(
+                now + self.marker_ttl_seconds, tz=datetime.timezone.utc
+            ),
+        }
+
+    def start(self) -> None:
+        if self._watch is not None:
+            return
+        query = self.db.collection(self.collection).where(
+            filter=FieldFilter("changed_at", ">", self._clock())
+        )
+        self._watch = query.on_snapshot(self._on_snapshot)
+
+    def stop(self) -> None:
+        if self._watch is not None:
+            self._watch.unsubscribe()
+            self._watch = None
+
+    def _on_snapshot(self, documents, changes, read_time) -> None:
+        for change in changes:
+            if change.type.name != "ADDED":
+                continue
+            marker = change.document.to_dict() or {}
+            user_id: Optional[str] = marker.get("uid")
+            # Local changes were already applied when they were made.
+            if not user_id or marker.get("origin") == self.origin:
+                continue
+            with self._lock:
+                self.received += 1
+            for callback in self._subscribers:
+                callback(user_id)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "watching": self._watch is not None,
+                "published": self.published,
+                "publish_failures": self.publish_failures,
+                "received": self.received,
+            }
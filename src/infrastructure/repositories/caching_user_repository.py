@@ -0,0 +1,172 @@
+from typing import Iterator, Optional, List
+from src.domain.repositories.user_repository import UserRepository
+from src.domain.entities.user import User
+from src.domain.entities.token import Token
+from ..cache.lru_ttl_cache import LRUTTLCache
+import copy
+import threading
+
+
+class CachingUserRepository(UserRepository):
+    """
+    Read-through cache in front of another UserRepository. Users are cached
+    by uid; an email index maps emails to uids and is checked against the
+    cached user's email on every read, so a stale index entry is a miss, never
+    a wrong answer. Writes made through this repository invalidate the user;
+    changes made elsewhere should call ``invalidate``. A read that was already
+    in flight when its user was invalidated is returned but not cached.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        max_entries: int = 10000,
+        ttl: float = 60.0,
+    ):
+        self.repository = repository
+        self.users = LRUTTLCache(max_entries=max_entries, default_ttl=ttl)
+        self.uids_by_email = LRUTTLCache(max_entries=max_entries, default_ttl=ttl)
+        # Generation of the last invalidation of each uid; reads remember the
+        # generation they started at and are not cached if it moved since.
+        self._invalidated_at = LRUTTLCache(max_entries=max_entries, default_ttl=ttl)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidated_at.set(user_id, self._generation)
+            self.users.pop(user_id)
+
+    def _remember(self, user: Optional[User], started_at: int) -> Optional[User]:
+        if user is None:
+            return user
+        with self._lock:
+            # Do not cache a read that raced with an invalidation.
+            if (self._invalidated_at.get(user.id) or 0) > started_at:
+                return user
+            self.users.set(user.id, copy.copy(user))
+            self.uids_by_email.set(_email_key(user.email), user.id)
+        return user
+
+    def _cached_by_email(self, email: str) -> Optional[User]:
+        user_id = self.uids_by_email.get(_email_key(email))
+        user = self.users.get(user_id) if user_id is not None else None
+        if user is None or _email_key(user.email) != _email_key(email):
+            return None
+        return copy.copy(user)
+
+    def create_user(
+        self, email: str, password: str, alias: Optional[str] = None
+    ) -> User:
+        self.uids_by_email.pop(_email_key(email))
+        return self.repository.create_user(email, password, alias)
+
+    def login_user(self, email: str, password: str) -> Optional[Token]:
+        return self.repository.login_user(email, password)
+
+    async def login_user_async(self, email: str, password: str) -> Optional[Token]:
+        return await self.repository.login_user_async(email, password)
+
+    def get_user(self, user_id: str) -> Optional[User]:
+        user = self.users.get(user_id)
+        if user is not None:
+            return copy.copy(user)
+        started_at = self._generation
+        return self._remember(self.repository.get_user(user_id), started_at)
+
+    def get_user_uncached(self, user_id: str) -> Optional[User]:
+        started_at = self._generation
+        return self._remember(self.repository.get_user_uncached(user_id), started_at)
+
+    async def get_user_async(self, user_id: str) -> Optional[User]:
+        user = self.users.get(user_id)
+        if user is not None:
+            return copy.copy(user)
+        started_at = self._generation
+        return self._remember(await self.repository.get_user_async(user_id), started_at)
+
+    def get_users(self, user_ids: List[str]) -> List[Optional[User]]:
+        found = {user_id: self.users.get(user_id) for user_id in user_ids}
+        missing = [user_id for user_id, user in found.items() if user is None]
+        if missing:
+            started_at = self._generation
+            for user_id, user in zip(missing, self.repository.get_users(missing)):
+                found[user_id] = self._remember(user, started_at)
+        return [
+            copy.copy(found[user_id]) if found[user_id] is not None else None
+            for user_id in user_ids
+        ]
+
+    def get_user_by_email(self, email: str) -> Optional[User]:
+        user = self._cached_by_email(email)
+        if user is not None:
+            return user
+        started_at = self._generation
+        return self._remember(self.repository.get_user_by_email(email), started_at)
+
+    async def get_user_by_email_async(self, email: str) -> Optional[User]:
+        user = self._cached_by_email(email)
+        if user is not None:
+            return user
+        started_at = self._generation
+        return self._remember(
+            await self.repository.get_user_by_email_async(email), started_at
+        )
+
+    def update_user(self, user: User) -> User:
+        self.invalidate(user.id)
+        try:
+            return self.repository.update_user(user)
+        finally:
+            # A read racing the write may have cached the old profile again.
+            self.invalidate(user.id)
+
+    def update_user_fields(self, user_id: str, changes: dict) -> User:
+        self.invalidate(user_id)
+        try:
+            return self.repository.update_user_fields(user_id, changes)
+        finally:
+            self.invalidate(user_id)
+
+    def import_users(self, users: list[User]) -> dict[int, str]:
+        return self.repository.import_users(users)
+
+    def send_password_reset_email(self, email: str) -> dict:
+        return self.repository.send_password_reset_email(email)
+
+    async def send_password_reset_email_async(self, email: str) -> dict:
+        return await self.repository.send_password_reset_email_async(email)
+
+    def delete_user(self, user_id: str) -> None:
+        self.invalidate(user_id)
+        try:
+            self.repository.delete_user(user_id)
+        finally:
+            self.invalidate(user_id)
+
+    def delete_users(self, user_ids: List[str]) -> dict[str, str]:
+        try:
+            return self.repository.delete_users(user_ids)
+        finally:
+            for user_id in user_ids:
+                self.invalidate(user_id)
+
+    def list_users(self) -> List[User]:
+        return self.repository.list_users()
+
+    def iter_user_pages(self) -> Iterator[List[User]]:
+        return self.repository.iter_user_pages()
+
+    def list_users_page(
+        self, max_results: int, page_token: Optional[str] = None
+    ) -> tuple[List[User], Optional[str]]:
+        return self.repository.list_users_page(max_results, page_token)
+
+    def stats(self) -> dict:
+        return {"users": self.users.stats(), "emails": self.uids_by_email.stats()}
+
+
+def _email_key(email: str) -> str:
+    # Firebase Auth compara emails sin distinguir mayúsculas
+    return email.strip().lower()
@@ -1,24 +1,95 @@
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from google.cloud.firestore_v1.base_query import FieldFilter
+from typing import Callable, Iterator, Optional, List
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.entities.user import User
 from src.domain.entities.token import Token
 from src.infrastructure.db.firebase import auth_client, db
-from ..rest.firebase_auth_api import FirebaseAuthAPI
+from ..rest.firebase_auth_api import (
+    AsyncFirebaseAuthAPI,
+    EmailNotFoundError,
+    FirebaseAuthAPI,
+)
+from dotenv import load_dotenv
+import asyncio
 import firebase_admin
+import hashlib
+import os
+import secrets
+
+load_dotenv()
+# Firebase Auth devuelve como máximo 1000 usuarios por página
+LIST_USERS_PAGE_SIZE = 1000
+list_users_pipelined = os.getenv("LIST_USERS_PIPELINED", "true").lower() == "true"
+user_lookup_workers = int(os.getenv("USER_LOOKUP_WORKERS", "16"))
+# Límites de auth.import_users y de los batches de Firestore
+IMPORT_USERS_CHUNK_SIZE = 1000
+FIRESTORE_BATCH_SIZE = 500
+import_hash_rounds = int(os.getenv("IMPORT_USERS_HASH_ROUNDS", "10000"))
+import_hash_workers = int(os.getenv("IMPORT_USERS_HASH_WORKERS", "4"))
+DELETE_USERS_CHUNK_SIZE = 1000
+GET_USERS_CHUNK_SIZE = 100
+# auth.delete_users está limitado por Firebase a ~1 petición por segundo
+delete_users_concurrency = int(os.getenv("DELETE_USERS_CONCURRENCY", "1"))
+
+# Lecturas de Firestore que se solapan con la llamada a Auth
+_lookup_executor = ThreadPoolExecutor(
+    max_workers=user_lookup_workers, thread_name_prefix="user-lookup"
+)
+# Borrado de perfiles en los borrados en bloque, solapado con Auth
+_profile_delete_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="user-profile-delete"
+)
+# Hashing PBKDF2 de las importaciones, aparte para no frenar las lecturas
+_hash_executor = ThreadPoolExecutor(
+    max_workers=import_hash_workers, thread_name_prefix="user-import-hash"
+)
 
 
 class FirebaseUserRepository(UserRepository):
     """Firebase implementation of UserRepository. Uses firebase_admin SDK"""
 
+    def __init__(self):
+        self._change_listeners: List[tuple[Callable, Optional[Callable]]] = []
+
+    def add_change_listener(
+        self,
+        listener: Callable[[str], None],
+        bulk_listener: Optional[Callable[[List[str]], None]] = None,
+    ) -> None:
+        """
+        Register a callback invoked with the uid of every updated/deleted user.
+        ``bulk_listener``, if given, receives the uids of a bulk change in one
+        call instead of ``listener`` being called once per uid.
+        """
+        self._change_listeners.append((listener, bulk_listener))
+
+    def _notify_change(self, user_id: str) -> None:
+        for listener, _ in self._change_listeners:
+            listener(user_id)
+
+    def _notify_changes(self, user_ids: List[str]) -> None:
+        if not user_ids:
+            return
+        for listener, bulk_listener in self._change_listeners:
+            if bulk_listener is not None:
+                bulk_listener(user_ids)
+            else:
+                for user_id in user_ids:
+                    listener(user_id)
+
     def create_user(
         self, email: str, password: str, alias: Optional[str] = None
     ) -> User:
         """Create a new user and store extra info in Firestore."""
-        user_auth = auth_client.create_user(
-            email=email,
-            password=password,
-            display_name=alias,
-        )
+        try:
+            user_auth = auth_client.create_user(
+                email=email,
+                password=password,
+                display_name=alias,
+            )
+        except firebase_admin._auth_utils.EmailAlreadyExistsError:
+            raise ValueError("User with this email already exists")
 
         # Guardar datos extra en Firestore
         user_data = {
@@ -38,55 +109,161 @@ class FirebaseUserRepository(UserRepository):
     def login_user(self, email: str, password: str) -> Optional[Token]:
         firebase_auth_api = FirebaseAuthAPI()
         try:
-            response = firebase_auth_api.login_user(email, password)
-            if response:
-                return Token(
-                    local_id=response.get("localId"),
-                    email=response.get("email"),
-                    alias=response.get("displayName"),
-                    id_token=response.get("idToken"),
-                    registered=response.get("registered"),
-                    refresh_token=response.get("refreshToken"),
-                    expires_in=response.get("expiresIn"),
-                )
+            return self._token_from_response(
+                firebase_auth_api.login_user(email, password)
+            )
+        except EmailNotFoundError as e:
+            raise ValueError(str(e))
         except ValueError as e:
             raise ValueError(f"Login failed: {str(e)}")
 
+    async def login_user_async(self, email: str, password: str) -> Optional[Token]:
+        firebase_auth_api = AsyncFirebaseAuthAPI()
+        try:
+            return self._token_from_response(
+                await firebase_auth_api.login_user(email, password)
+            )
+        except EmailNotFoundError as e:
+            raise ValueError(str(e))
+        except ValueError as e:
+            raise ValueError(f"Login failed: {str(e)}")
+
+    @staticmethod
+    def _token_from_response(response: Optional[dict]) -> Optional[Token]:
+        if response:
+            return Token(
+                local_id=response.get("localId"),
+                email=response.get("email"),
+                alias=response.get("displayName"),
+                id_token=response.get("idToken"),
+                registered=response.get("registered"),
+                refresh_token=response.get("refreshToken"),
+                expires_in=response.get("expiresIn"),
+            )
+        return None
+
     def get_user(self, user_id: str) -> Optional[User]:
         """Get user by ID from Firestore (extra info) + Auth (email)."""
         try:
+            # Both reads only need the uid, so they run concurrently.
+            profile = _lookup_executor.submit(self._profile_by_id, user_id)
             user_record = auth_client.get_user(user_id)
-            doc = db.collection("users").document(user_id).get()
-            alias = (
-                doc.to_dict().get("alias") if doc.exists else user_record.display_name
-            )
-            return User(
-                id=user_record.uid,
-                email=user_record.email,
-                password="",  # Firebase no expone password
-                alias=alias,
+            return self._to_user(user_record, profile.result())
+        except firebase_admin._auth_utils.UserNotFoundError:
+            raise ValueError("User not found")
+        except Exception as e:
+            raise ValueError(f"Error retrieving user: {str(e)}")
+
+    async def get_user_async(self, user_id: str) -> Optional[User]:
+        try:
+            user_record, profile = await asyncio.gather(
+                asyncio.to_thread(auth_client.get_user, user_id),
+                asyncio.to_thread(self._profile_by_id, user_id),
             )
+            return self._to_user(user_record, profile)
         except firebase_admin._auth_utils.UserNotFoundError:
             raise ValueError("User not found")
         except Exception as e:
             raise ValueError(f"Error retrieving user: {str(e)}")
 
+    def get_users(self, user_ids: List[str]) -> List[Optional[User]]:
+        """
+        Look users up in bulk: auth.get_users with up to 100 uids per call
+        (chunks run concurrently) and one Firestore get_all for the profiles,
+        issued alongside the Auth calls. Results follow ``user_ids``; unknown
+        or malformed uids are None.
+        """
+        unique_ids = list(dict.fromkeys(user_ids))
+        if not unique_ids:
+            return []
+        chunks = [
+            unique_ids[start : start + GET_USERS_CHUNK_SIZE]
+            for start in range(0, len(unique_ids), GET_USERS_CHUNK_SIZE)
+        ]
+        try:
+            profiles = _lookup_executor.submit(self._profiles_by_id, unique_ids)
+            records = {
+                record.uid: record
+                for chunk_records in _lookup_executor.map(self._get_records, chunks)
+                for record in chunk_records
+            }
+            profiles = profiles.result()
+        except Exception as e:
+            raise ValueError(f"Error retrieving users: {str(e)}")
+        return [
+            (
+                self._to_user(records[user_id], profiles.get(user_id))
+                if user_id in records
+                else None
+            )
+            for user_id in user_ids
+        ]
+
+    @staticmethod
+    def _get_records(user_ids: List[str]) -> list:
+        identifiers = []
+        for user_id in user_ids:
+            try:
+                identifiers.append(auth_client.UidIdentifier(user_id))
+            except ValueError:
+                continue  # uid mal formado: no puede existir
+        if not identifiers:
+            return []
+        return auth_client.get_users(identifiers).users
+
     def get_user_by_email(self, email: str) -> Optional[User]:
-        """Get user by email using Auth and Firestore."""
+        """
+        Get user by email using Auth and Firestore. The profile is looked up
+        by its email field while Auth resolves the uid; only when that guess
+        misses (no profile, or it belongs to another uid) is the profile read
+        again by uid.
+        """
+        candidate = _lookup_executor.submit(self._profile_by_email, email)
         try:
             user_record = auth_client.get_user_by_email(email)
-            doc = db.collection("users").document(user_record.uid).get()
-            alias = (
-                doc.to_dict().get("alias") if doc.exists else user_record.display_name
-            )
-            return User(
-                id=user_record.uid,
-                email=user_record.email,
-                password="",
-                alias=alias,
+        except firebase_admin._auth_utils.UserNotFoundError:
+            return None
+        profile = self._matching_profile(user_record.uid, candidate.result())
+        if profile is None:
+            profile = self._profile_by_id(user_record.uid)
+        return self._to_user(user_record, profile)
+
+    async def get_user_by_email_async(self, email: str) -> Optional[User]:
+        try:
+            user_record, candidate = await asyncio.gather(
+                asyncio.to_thread(auth_client.get_user_by_email, email),
+                asyncio.to_thread(self._profile_by_email, email),
             )
         except firebase_admin._auth_utils.UserNotFoundError:
             return None
+        profile = self._matching_profile(user_record.uid, candidate)
+        if profile is None:
+            profile = await asyncio.to_thread(self._profile_by_id, user_record.uid)
+        return self._to_user(user_record, profile)
+
+    @staticmethod
+    def _profile_by_id(user_id: str) -> Optional[dict]:
+        doc = db.collection("users").document(user_id).get()
+        return doc.to_dict() if doc.exists else None
+
+    @staticmethod
+    def _profile_by_email(email: str) -> Optional[tuple[str, dict]]:
+        query = (
+            db.collection("users")
+            .where(filter=FieldFilter("email", "==", email))
+            .limit(1)
+        )
+        for doc in query.stream():
+            return doc.id, doc.to_dict()
+        return None
+
+    @staticmethod
+    def _matching_profile(
+        user_id: str, candidate: Optional[tuple[str, dict]]
+    ) -> Optional[dict]:
+        if candidate is not None and candidate[0] == user_id:
+            return candidate[1]
+        return None
 
     def update_user(self, user: User) -> User:
         """Update user in Auth and Firestore."""
@@ -97,13 +274,14 @@ class FirebaseUserRepository(UserRepository):
                 display_name=user.alias if user.alias else None,
                 password=user.password if user.password else None,
             )
-
             if user.alias is None:
                 update_data = {"email": user.email}
             else:
                 update_data = {"email": user.email, "alias": user.alias}
 
             db.collection("users").document(user.id).update(update_data)
+            # Después de escribir: otra réplica podría releer el perfil viejo.
+            self._notify_change(user.id)
 
             return User(
                 id=user_record.uid,
@@ -116,33 +294,273 @@ class FirebaseUserRepository(UserRepository):
         except Exception as e:
             raise ValueError(f"Error updating user: {str(e)}")
 
+    def update_user_fields(self, user_id: str, changes: dict) -> User:
+        """
+        Write only what changed: Auth when the email, alias (display name) or
+        password changed, and one Firestore update with just the changed
+        profile fields. A password-only change never touches Firestore.
+        """
+        auth_fields = {
+            auth_name: changes[field]
+            for field, auth_name in (
+                ("email", "email"),
+                ("alias", "display_name"),
+                ("password", "password"),
+            )
+            if field in changes
+        }
+        profile_fields = {
+            field: changes[field] for field in ("email", "alias") if field in changes
+        }
+        try:
+            # Every updatable field lives in Auth, so Auth is always written.
+            user_record = auth_client.update_user(user_id, **auth_fields)
+            if profile_fields:
+                db.collection("users").document(user_id).update(profile_fields)
+            self._notify_change(user_id)
+            return User(
+                id=user_record.uid,
+                email=user_record.email,
+                password="",
+                alias=changes.get("alias", user_record.display_name),
+            )
+        except firebase_admin._auth_utils.UserNotFoundError:
+            raise ValueError("User not found")
+        except firebase_admin._auth_utils.EmailAlreadyExistsError:
+            raise ValueError("Email already in use")
+        except Exception as e:
+            raise ValueError(f"Error updating user: {str(e)}")
+
+    def import_users(self, users: List[User]) -> dict[int, str]:
+        """
+        Create accounts with auth.import_users, 1000 per call, using
+        PBKDF2-SHA256 hashes computed here (Firebase re-hashes them with its
+        own scrypt on first sign-in). auth.import_users does not check email
+        uniqueness, so the emails of each chunk are first looked up with
+        auth.get_users and existing accounts are rejected. Profiles of the
+        imported accounts are written with Firestore batched writes of 500.
+        """
+        failures = {}
+        hash_alg = auth_client.UserImportHash.pbkdf2_sha256(rounds=import_hash_rounds)
+        for start in range(0, len(users), IMPORT_USERS_CHUNK_SIZE):
+            chunk = users[start : start + IMPORT_USERS_CHUNK_SIZE]
+            try:
+                existing = self._existing_emails([user.email for user in chunk])
+            except Exception as e:
+                for offset in range(len(chunk)):
+                    failures[start + offset] = f"Import failed: {e}"
+                continue
+            pending = []
+            for offset, user in enumerate(chunk):
+                if user.email.lower() in existing:
+                    failures[start + offset] = "User with this email already exists"
+                else:
+                    pending.append((start + offset, user))
+            if not pending:
+                continue
+            # hashlib releases the GIL while hashing, so threads help here.
+            records = list(
+                _hash_executor.map(self._import_record, [user for _, user in pending])
+            )
+            try:
+                result = auth_client.import_users(records, hash_alg=hash_alg)
+                rejected = {error.index: error.reason for error in result.errors}
+            except Exception as e:
+                rejected = dict.fromkeys(range(len(records)), f"Import failed: {e}")
+            imported = []
+            for offset, ((index, user), record) in enumerate(zip(pending, records)):
+                if offset in rejected:
+                    failures[index] = rejected[offset]
+                else:
+                    user.id = record.uid
+                    imported.append((index, user))
+            failures.update(self._write_imported_profiles(imported))
+        return failures
+
+    @staticmethod
+    def _existing_emails(emails: List[str]) -> set[str]:
+        """Lower-cased emails that already have an account (100 per lookup)."""
+        groups = [
+            emails[start : start + GET_USERS_CHUNK_SIZE]
+            for start in range(0, len(emails), GET_USERS_CHUNK_SIZE)
+        ]
+
+        def lookup(group: List[str]) -> List[str]:
+            identifiers = [auth_client.EmailIdentifier(email) for email in group]
+            result = auth_client.get_users(identifiers)
+            return [record.email.lower() for record in result.users if record.email]
+
+        return {
+            email for found in _lookup_executor.map(lookup, groups) for email in found
+        }
+
+    @staticmethod
+    def _import_record(user: User):
+        salt = secrets.token_bytes(16)
+        password_hash = hashlib.pbkdf2_hmac(
+            "sha256", user.password.encode(), salt, import_hash_rounds
+        )
+        return auth_client.ImportUserRecord(
+            uid=secrets.token_urlsafe(21),
+            email=user.email,
+            display_name=user.alias,
+            password_hash=password_hash,
+            password_salt=salt,
+        )
+
+    @staticmethod
+    def _write_imported_profiles(imported: List[tuple[int, User]]) -> dict[int, str]:
+        failures = {}
+        users_collection = db.collection("users")
+        for start in range(0, len(imported), FIRESTORE_BATCH_SIZE):
+            group = imported[start : start + FIRESTORE_BATCH_SIZE]
+            batch = db.batch()
+            for _, user in group:
+                batch.set(
+                    users_collection.document(user.id),
+                    {"id": user.id, "email": user.email, "alias": user.alias},
+                )
+            try:
+                batch.commit()
+            except Exception as e:
+                # La cuenta existe aunque el perfil no se haya guardado: el
+                # usuario conserva su id y el motivo es solo un aviso.
+                for index, _ in group:
+                    failures[index] = f"Imported without profile: {e}"
+        return failures
+
     def send_password_reset_email(self, email: str) -> dict:
         """Send a password reset email using Firebase Auth REST API."""
         firebase_auth_api = FirebaseAuthAPI()
         return firebase_auth_api.send_password_reset_email(email)
 
+    async def send_password_reset_email_async(self, email: str) -> dict:
+        firebase_auth_api = AsyncFirebaseAuthAPI()
+        return await firebase_auth_api.send_password_reset_email(email)
+
     def delete_user(self, user_id: str) -> None:
         """Delete user from Auth and Firestore."""
         try:
             auth_client.delete_user(user_id)
+            self._notify_change(user_id)
             db.collection("users").document(user_id).delete()
         except firebase_admin._auth_utils.UserNotFoundError:
             raise ValueError("User not found")
 
+    def delete_users(self, user_ids: List[str]) -> dict[str, str]:
+        """
+        Delete users with auth.delete_users, 1000 uids per call, and their
+        profiles with Firestore batched deletes of 500. Auth chunks run
+        ``DELETE_USERS_CONCURRENCY`` at a time; the profiles of a deleted
+        chunk are removed on a separate pool while Auth deletes the next one.
+        Unknown uids count as deleted, as in auth.delete_users.
+        """
+        chunks = [
+            user_ids[start : start + DELETE_USERS_CHUNK_SIZE]
+            for start in range(0, len(user_ids), DELETE_USERS_CHUNK_SIZE)
+        ]
+        failures = {}
+        profile_deletes = []
+        with ThreadPoolExecutor(max_workers=delete_users_concurrency) as executor:
+            for chunk_failures, deleted in executor.map(self._delete_accounts, chunks):
+                failures.update(chunk_failures)
+                self._notify_changes(deleted)
+                for start in range(0, len(deleted), FIRESTORE_BATCH_SIZE):
+                    group = deleted[start : start + FIRESTORE_BATCH_SIZE]
+                    profile_deletes.append(
+                        _profile_delete_executor.submit(self._delete_profiles, group)
+                    )
+            for profile_delete in profile_deletes:
+                failures.update(profile_delete.result())
+        return failures
+
+    @staticmethod
+    def _delete_accounts(user_ids: List[str]) -> tuple[dict[str, str], List[str]]:
+        """Delete one chunk from Auth; returns (failures, deleted uids)."""
+        try:
+            result = auth_client.delete_users(user_ids)
+        except Exception as e:
+            return dict.fromkeys(user_ids, f"Error deleting user: {e}"), []
+        failures = {user_ids[error.index]: error.reason for error in result.errors}
+        return failures, [user_id for user_id in user_ids if user_id not in failures]
+
+    @staticmethod
+    def _delete_profiles(user_ids: List[str]) -> dict[str, str]:
+        users_collection = db.collection("users")
+        batch = db.batch()
+        for user_id in user_ids:
+            batch.delete(users_collection.document(user_id))
+        try:
+            batch.commit()
+            return {}
+        except Exception as e:
+            return dict.fromkeys(user_ids, f"Profile delete failed: {e}")
+
     def list_users(self) -> List[User]:
         """List all users from Auth, merge with Firestore data."""
         users = []
-        for user_record in auth_client.list_users().iterate_all():
-            doc = db.collection("users").document(user_record.uid).get()
-            alias = (
-                doc.to_dict().get("alias") if doc.exists else user_record.display_name
+        for page_users in self.iter_user_pages():
+            users.extend(page_users)
+        return users
+
+    def list_users_page(
+        self, max_results: int, page_token: Optional[str] = None
+    ) -> tuple[List[User], Optional[str]]:
+        """List one Auth page of users, merged with their Firestore profiles."""
+        try:
+            page = auth_client.list_users(
+                page_token=page_token, max_results=max_results
             )
-            users.append(
-                User(
-                    id=user_record.uid,
-                    email=user_record.email,
-                    password="",
-                    alias=alias,
+        except (ValueError, firebase_admin.exceptions.InvalidArgumentError):
+            raise ValueError("Invalid page token")
+        return self._with_profiles(page.users), page.next_page_token or None
+
+    def iter_user_pages(self) -> Iterator[List[User]]:
+        """
+        Yield the users one Auth page at a time, each page merged with its
+        profiles in a single batched Firestore read. When pipelined, the next
+        Auth page is fetched while the current Firestore batch is in flight.
+        """
+        page = auth_client.list_users(max_results=LIST_USERS_PAGE_SIZE)
+        if not list_users_pipelined:
+            while page is not None:
+                yield self._with_profiles(page.users)
+                page = page.get_next_page()
+            return
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while page is not None:
+                next_page = (
+                    executor.submit(page.get_next_page) if page.has_next_page else None
                 )
-            )
-        return users
+                yield self._with_profiles(page.users)
+                page = next_page.result() if next_page else None
+
+    def _with_profiles(self, user_records: list) -> List[User]:
+        if not user_records:
+            return []
+        profiles = self._profiles_by_id([record.uid for record in user_records])
+        return [
+            self._to_user(record, profiles.get(record.uid)) for record in user_records
+        ]
+
+    @staticmethod
+    def _profiles_by_id(user_ids: List[str]) -> dict[str, dict]:
+        users_collection = db.collection("users")
+        references = [users_collection.document(user_id) for user_id in user_ids]
+        return {
+            doc.id: doc.to_dict()
+            for doc in db.get_all(references, field_paths=["alias"])
+            if doc.exists
+        }
+
+    @staticmethod
+    def _to_user(user_record, profile: Optional[dict]) -> User:
+        alias = (
+            profile.get("alias") if profile is not None else user_record.display_name
+        )
+        return User(
+            id=user_record.uid,
+            email=user_record.email,
+            password="",  # Firebase no expone password
+            alias=alias,
+        )
@@ -1,17 +1,95 @@
 from ...domain.repositories.token_repository import TokenRepository
 from ...domain.entities.token import Token
 from ...domain.entities.refresh_token import RefreshToken
+from ..cache.lru_ttl_cache import LRUTTLCache, digest_key
+from ..auth.id_token_verifier import IdTokenVerifier, UnknownKeyIdError
+from ..auth.revocation_cache import RevocationCache
+from ..auth.token_prefilter import TokenPrefilter
 from typing import Optional
 from firebase_admin import auth
-from ..rest.firebase_auth_api import FirebaseAuthAPI
+from ..rest.firebase_auth_api import AsyncFirebaseAuthAPI, FirebaseAuthAPI
+from concurrent.futures import Future
+from dotenv import load_dotenv
+import asyncio
+import os
+import threading
+
+load_dotenv()
+token_cache_max_entries = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000"))
+token_cache_max_ttl = float(os.getenv("TOKEN_CACHE_MAX_TTL_SECONDS", "300"))
+token_check_revoked = os.getenv("TOKEN_CHECK_REVOKED", "true").lower() == "true"
+token_revocation_ttl = float(os.getenv("TOKEN_REVOCATION_TTL_SECONDS", "30"))
+token_refresh_grace = float(os.getenv("TOKEN_REFRESH_GRACE_SECONDS", "10"))
 
 
 class TokenAuthRepository(TokenRepository):
 
+    def __init__(
+        self,
+        verified_cache: Optional[LRUTTLCache] = None,
+        verifier: Optional[IdTokenVerifier] = None,
+        revocation_cache: Optional[RevocationCache] = None,
+        check_revoked: bool = token_check_revoked,
+        prefilter: Optional[TokenPrefilter] = None,
+        refreshed_cache: Optional[LRUTTLCache] = None,
+    ):
+        self.verifier = verifier or IdTokenVerifier()
+        self.prefilter = prefilter or TokenPrefilter(self.verifier.key_cache)
+        self.revocation_cache = revocation_cache
+        if self.revocation_cache is None and check_revoked:
+            self.revocation_cache = RevocationCache(ttl=token_revocation_ttl)
+        # Verified claims keyed by a digest of the ID token; entries never
+        # outlive the token's own "exp" claim.
+        # An empty cache is falsy (it has __len__), hence the explicit check.
+        self.verified_cache = (
+            verified_cache
+            if verified_cache is not None
+            else LRUTTLCache(
+                max_entries=token_cache_max_entries, default_ttl=token_cache_max_ttl
+            )
+        )
+        # Refreshes keyed by a digest of the refresh token: concurrent callers
+        # share one upstream request, late duplicates get the recent result.
+        self.refreshed_cache = (
+            refreshed_cache
+            if refreshed_cache is not None
+            else LRUTTLCache(max_entries=10000, default_ttl=token_refresh_grace)
+        )
+        self._refresh_lock = threading.Lock()
+        self._refresh_in_flight: dict[str, Future] = {}
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+        self.refresh_coalesced = 0
+
     def verify_token(self, id_token: str) -> Optional[Token]:
-        # Implement token verification logic here
+        cache_key = digest_key(id_token)
+        cached = self.verified_cache.get(cache_key)
+        if cached is None:
+            self.prefilter.check(id_token, cache_key)
+            cached = self._verify_signature(id_token, cache_key)
+        token_data, issued_at = cached
+        self._check_revoked(token_data["uid"], issued_at)
+        return dict(token_data)
+
+    async def verify_token_async(self, id_token: str) -> Optional[Token]:
+        # Cache hits are a dict lookup; only misses go to a worker thread.
+        cache_key = digest_key(id_token)
+        cached = self.verified_cache.get(cache_key)
+        if cached is None:
+            self.prefilter.check(id_token, cache_key)
+            cached = await asyncio.to_thread(
+                self._verify_signature, id_token, cache_key
+            )
+        token_data, issued_at = cached
+        uid = token_data["uid"]
+        if self.revocation_cache and not self.revocation_cache.is_fresh(uid):
+            await asyncio.to_thread(self._check_revoked, uid, issued_at)
+        else:
+            self._check_revoked(uid, issued_at)
+        return dict(token_data)
+
+    def _verify_signature(self, id_token: str, cache_key: str) -> tuple[dict, int]:
         try:
-            decoded_token = auth.verify_id_token(id_token)
+            decoded_token = self.verifier.verify(id_token)
             token_data = {
                 "uid": decoded_token.get("uid"),
                 "email": decoded_token.get("email"),
@@ -21,19 +99,112 @@ class TokenAuthRepository(TokenRepository):
                     "user_id": decoded_token.get("user_id"),
                 },
             }
-            return token_data
-
         except auth.ExpiredIdTokenError:
+            self.prefilter.remember_rejection(cache_key, "Expired token")
             raise ValueError("Expired token")
+        except UnknownKeyIdError:
+            # Not remembered: a valid token is rejected while keys are loading.
+            raise ValueError("Invalid token")
         except auth.InvalidIdTokenError:
+            self.prefilter.remember_rejection(cache_key, "Invalid token")
             raise ValueError("Invalid token")
         except Exception as e:
             raise ValueError(f"Error verifying token: {str(e)}")
 
+        verified = (token_data, decoded_token.get("iat", 0))
+        self.verified_cache.set(
+            cache_key, verified, expires_at=decoded_token.get("exp")
+        )
+        return verified
+
+    def _check_revoked(self, uid: str, issued_at: int) -> None:
+        if self.revocation_cache is None:
+            return
+        try:
+            self.revocation_cache.check(uid, issued_at)
+        except auth.RevokedIdTokenError:
+            raise ValueError("Revoked token")
+        except auth.UserDisabledError:
+            raise ValueError("User disabled")
+        except auth.UserNotFoundError:
+            raise ValueError("User not found")
+        except Exception as e:
+            raise ValueError(f"Error verifying token: {str(e)}")
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Forget the cached revocation state of a user that was changed here."""
+        if self.revocation_cache is not None:
+            self.revocation_cache.invalidate(user_id)
+
+    def cache_stats(self) -> dict:
+        """Hit/miss/eviction counters of the verified token cache."""
+        return self.verified_cache.stats()
+
+    def refresh_stats(self) -> dict:
+        return {
+            "in_flight": len(self._refresh_in_flight) + len(self._refresh_tasks),
+            "coalesced": self.refresh_coalesced,
+            "recent": self.refreshed_cache.stats(),
+        }
+
     def refresh_token(self, refresh_token: str) -> RefreshToken:
+        cache_key = digest_key(refresh_token)
+        refreshed = self.refreshed_cache.get(cache_key)
+        if refreshed is not None:
+            return refreshed
+        with self._refresh_lock:
+            future = self._refresh_in_flight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = self._refresh_in_flight[cache_key] = Future()
+            else:
+                self.refresh_coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            refreshed = self._refresh_upstream(refresh_token)
+            self.refreshed_cache.set(cache_key, refreshed)
+            future.set_result(refreshed)
+            return refreshed
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._refresh_lock:
+                del self._refresh_in_flight[cache_key]
+
+    async def refresh_token_async(self, refresh_token: str) -> RefreshToken:
+        cache_key = digest_key(refresh_token)
+        refreshed = self.refreshed_cache.get(cache_key)
+        if refreshed is not None:
+            return refreshed
+        task = self._refresh_tasks.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._refresh_upstream_async(refresh_token, cache_key)
+            )
+            self._refresh_tasks[cache_key] = task
+            task.add_done_callback(lambda _: self._refresh_tasks.pop(cache_key, None))
+        else:
+            self.refresh_coalesced += 1
+        # A cancelled caller must not cancel the request other callers share.
+        return await asyncio.shield(task)
+
+    def _refresh_upstream(self, refresh_token: str) -> RefreshToken:
         firebase_api = FirebaseAuthAPI()
         try:
             new_tokens = firebase_api.refresh_id_token(refresh_token)
             return new_tokens
         except ValueError as e:
             raise ValueError(f"Error refreshing token: {str(e)}")
+
+    async def _refresh_upstream_async(
+        self, refresh_token: str, cache_key: str
+    ) -> RefreshToken:
+        firebase_api = AsyncFirebaseAuthAPI()
+        try:
+            refreshed = await firebase_api.refresh_id_token(refresh_token)
+        except ValueError as e:
+            raise ValueError(f"Error refreshing token: {str(e)}")
+        self.refreshed_cache.set(cache_key, refreshed)
+        return refreshed
@@ -1,51 +1,243 @@
 from dotenv import load_dotenv
 from typing import Optional
 from src.domain.entities.refresh_token import RefreshToken
-import requests
+from .http_client import get_async_http_client, get_http_client
+from .resilience import NO_RETRY, CircuitBreaker, RetryPolicy, UpstreamUnavailableError
+import asyncio
+import httpx
 import os
 import json
+import time
 
 load_dotenv()
 firebase_api_key = os.getenv("API_KEY")
+connect_timeout = float(os.getenv("FIREBASE_CONNECT_TIMEOUT_SECONDS", "3"))
+sign_in_timeout = float(os.getenv("FIREBASE_SIGN_IN_TIMEOUT_SECONDS", "5"))
+password_reset_timeout = float(
+    os.getenv("FIREBASE_PASSWORD_RESET_TIMEOUT_SECONDS", "10")
+)
+refresh_timeout = float(os.getenv("FIREBASE_REFRESH_TIMEOUT_SECONDS", "5"))
+refresh_max_attempts = int(os.getenv("FIREBASE_REFRESH_MAX_ATTEMPTS", "3"))
+breaker_failure_rate = float(os.getenv("FIREBASE_BREAKER_FAILURE_RATE", "0.5"))
+breaker_min_calls = int(os.getenv("FIREBASE_BREAKER_MIN_CALLS", "20"))
+breaker_window = float(os.getenv("FIREBASE_BREAKER_WINDOW_SECONDS", "30"))
+breaker_open = float(os.getenv("FIREBASE_BREAKER_OPEN_SECONDS", "15"))
 
 
-class FirebaseAuthAPI:
-    """Class to interact with Firebase Authentication via REST API."""
+def _breaker(name: str) -> CircuitBreaker:
+    return CircuitBreaker(
+        name,
+        failure_threshold=breaker_failure_rate,
+        min_calls=breaker_min_calls,
+        window_seconds=breaker_window,
+        open_seconds=breaker_open,
+    )
+
+
+# Shared by every client instance so the whole process sees one health state
+# per upstream host.
+identity_toolkit_breaker = _breaker("identitytoolkit.googleapis.com")
+secure_token_breaker = _breaker("securetoken.googleapis.com")
+refresh_retry = RetryPolicy(max_attempts=refresh_max_attempts)
+
+
+class EmailNotFoundError(ValueError):
+    """Firebase answered EMAIL_NOT_FOUND: no account uses this email."""
+
+
+def _error_code(response: httpx.Response) -> str:
+    """Firebase error code, e.g. "EMAIL_NOT_FOUND" from "EMAIL_NOT_FOUND : ..."."""
+    try:
+        message = response.json()["error"]["message"]
+    except (ValueError, KeyError, TypeError):
+        return ""
+    return str(message).split(" ", 1)[0]
+
+
+def _is_upstream_failure(response: httpx.Response) -> bool:
+    return response.status_code >= 500 or response.status_code == 429
+
+
+class _FirebaseAuthEndpoints:
+    """Requests and response handling shared by the sync and async clients."""
 
     def __init__(self):
         self.api_key = firebase_api_key
         self.base_url = "https://identitytoolkit.googleapis.com/v1"
+        self.identity_toolkit_breaker = identity_toolkit_breaker
+        self.secure_token_breaker = secure_token_breaker
+        self.refresh_retry = refresh_retry
 
-    def login_user(self, email: str, password: str) -> Optional[dict]:
-        """Log in a user using email and password."""
+    @staticmethod
+    def _timeout(read_timeout: float) -> httpx.Timeout:
+        return httpx.Timeout(read_timeout, connect=connect_timeout)
 
+    def _login_request(self, email: str, password: str) -> tuple[str, dict]:
         url = f"{self.base_url}/accounts:signInWithPassword?key={self.api_key}"
         payload = {"email": email, "password": password, "returnSecureToken": True}
-        response = requests.post(url, json=payload)
+        return url, {"json": payload, "timeout": self._timeout(sign_in_timeout)}
+
+    @staticmethod
+    def _login_result(response: httpx.Response) -> Optional[dict]:
         if response.status_code == 200:
             return response.json()  # Contains idToken, refreshToken, etc.
-        else:
-            raise ValueError("Invalid login credentials")
-
-    def send_password_reset_email(self, email: str) -> dict:
-        """Send a password reset email to the user."""
+        code = _error_code(response)
+        if code == "EMAIL_NOT_FOUND":
+            raise EmailNotFoundError("No user found with this email")
+        if code == "USER_DISABLED":
+            raise ValueError("User disabled")
+        raise ValueError("Invalid login credentials")
 
+    def _password_reset_request(self, email: str) -> tuple[str, dict]:
         url = f"{self.base_url}/accounts:sendOobCode?key={self.api_key}"
         payload = {"requestType": "PASSWORD_RESET", "email": email}
-        response = requests.post(url, json=payload)
+        return url, {"json": payload, "timeout": self._timeout(password_reset_timeout)}
+
+    @staticmethod
+    def _password_reset_result(response: httpx.Response) -> dict:
         if response.status_code == 200:
             return {"success": True, "response": response.json().get("email")}
+        if _error_code(response) == "EMAIL_NOT_FOUND":
+            raise EmailNotFoundError("No user found with this email")
         raise ValueError("Failed to send password reset email")
 
-    def refresh_id_token(self, refresh_token: str) -> Optional[RefreshToken]:
-        """Refresh the ID token using the refresh token."""
-
+    def _refresh_request(self, refresh_token: str) -> tuple[str, dict]:
         url = f"https://securetoken.googleapis.com/v1/token?key={self.api_key}"
         payload = {"grant_type": "refresh_token", "refresh_token": refresh_token}
-        response = requests.post(url, data=payload)
+        return url, {"data": payload, "timeout": self._timeout(refresh_timeout)}
+
+    @staticmethod
+    def _refresh_result(response: httpx.Response) -> Optional[RefreshToken]:
         if response.status_code == 200:
             return RefreshToken(
                 **response.json()
             )  # Contains new idToken, refreshToken, etc.
+        raise ValueError("Failed to refresh ID token")
+
+    @staticmethod
+    def _unavailable(
+        breaker: CircuitBreaker,
+        error: Optional[Exception],
+        response: Optional[httpx.Response],
+    ) -> UpstreamUnavailableError:
+        if error is not None:
+            detail = type(error).__name__
         else:
-            raise ValueError("Failed to refresh ID token")
+            detail = f"HTTP {response.status_code}"
+        return UpstreamUnavailableError(f"{breaker.name} request failed ({detail})")
+
+
+class FirebaseAuthAPI(_FirebaseAuthEndpoints):
+    """Class to interact with Firebase Authentication via REST API."""
+
+    def __init__(self, client: Optional[httpx.Client] = None):
+        super().__init__()
+        self.client = client or get_http_client()
+
+    def login_user(self, email: str, password: str) -> Optional[dict]:
+        """Log in a user using email and password."""
+        url, kwargs = self._login_request(email, password)
+        response = self._post(self.identity_toolkit_breaker, NO_RETRY, url, kwargs)
+        return self._login_result(response)
+
+    def send_password_reset_email(self, email: str) -> dict:
+        """Send a password reset email to the user."""
+        url, kwargs = self._password_reset_request(email)
+        response = self._post(self.identity_toolkit_breaker, NO_RETRY, url, kwargs)
+        return self._password_reset_result(response)
+
+    def refresh_id_token(self, refresh_token: str) -> Optional[RefreshToken]:
+        """Refresh the ID token using the refresh token."""
+        url, kwargs = self._refresh_request(refresh_token)
+        response = self._post(
+            self.secure_token_breaker, self.refresh_retry, url, kwargs
+        )
+        return self._refresh_result(response)
+
+    def _post(
+        self, breaker: CircuitBreaker, retry: RetryPolicy, url: str, kwargs: dict
+    ) -> httpx.Response:
+        """POST through the breaker, retrying HTTP errors and 5xx/429 answers."""
+        delays = retry.delays()
+        while True:
+            breaker.before_call()
+            error, response = None, None
+            try:
+                response = self.client.post(url, **kwargs)
+            except httpx.HTTPError as e:
+                # Timeouts, connection errors, undecodable bodies, redirect loops
+                error = e
+            except BaseException:
+                # Cancelled or unexpected: no outcome, but free a half-open trial.
+                breaker.abandon_call()
+                raise
+            if response is not None and not _is_upstream_failure(response):
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            delay = next(delays, None)
+            if delay is None:
+                raise self._unavailable(breaker, error, response)
+            time.sleep(delay)
+
+
+class AsyncFirebaseAuthAPI(_FirebaseAuthEndpoints):
+    """Async counterpart of FirebaseAuthAPI; calls never block the event loop."""
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        super().__init__()
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or get_async_http_client()
+
+    async def login_user(self, email: str, password: str) -> Optional[dict]:
+        """Log in a user using email and password."""
+        url, kwargs = self._login_request(email, password)
+        response = await self._post(
+            self.identity_toolkit_breaker, NO_RETRY, url, kwargs
+        )
+        return self._login_result(response)
+
+    async def send_password_reset_email(self, email: str) -> dict:
+        """Send a password reset email to the user."""
+        url, kwargs = self._password_reset_request(email)
+        response = await self._post(
+            self.identity_toolkit_breaker, NO_RETRY, url, kwargs
+        )
+        return self._password_reset_result(response)
+
+    async def refresh_id_token(self, refresh_token: str) -> Optional[RefreshToken]:
+        """Refresh the ID token using the refresh token."""
+        url, kwargs = self._refresh_request(refresh_token)
+        response = await self._post(
+            self.secure_token_breaker, self.refresh_retry, url, kwargs
+        )
+        return self._refresh_result(response)
+
+    async def _post(
+        self, breaker: CircuitBreaker, retry: RetryPolicy, url: str, kwargs: dict
+    ) -> httpx.Response:
+        """POST through the breaker, retrying HTTP errors and 5xx/429 answers."""
+        delays = retry.delays()
+        while True:
+            breaker.before_call()
+            error, response = None, None
+            try:
+                response = await self.client.post(url, **kwargs)
+            except httpx.HTTPError as e:
+                # Timeouts, connection errors, undecodable bodies, redirect loops
+                error = e
+            except BaseException:
+                # Cancelled or unexpected: no outcome, but free a half-open trial.
+                breaker.abandon_call()
+                raise
+            if response is not None and not _is_upstream_failure(response):
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            delay = next(delays, None)
+            if delay is None:
+                raise self._unavailable(breaker, error, response)
+            await asyncio.sleep(delay)
@@ -0,0 +1,65 @@
+from dotenv import load_dotenv
+from typing import Optional
+import threading
+import httpx
+import os
+
+load_dotenv()
+http2_enabled = os.getenv("FIREBASE_HTTP2", "true").lower() == "true"
+max_connections = int(os.getenv("FIREBASE_HTTP_MAX_CONNECTIONS", "100"))
+max_keepalive_connections = int(os.getenv("FIREBASE_HTTP_MAX_KEEPALIVE", "20"))
+keepalive_expiry = float(os.getenv("FIREBASE_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+
+_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_client_lock = threading.Lock()
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Process-wide HTTP client for Google APIs. Connections are pooled and kept
+    alive, so TCP and TLS handshakes are paid once instead of on every call.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=http2_enabled, limits=_limits(), timeout=10.0
+                )
+    return _client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Async counterpart of ``get_http_client``, shared by the event loop."""
+    global _async_client
+    if _async_client is None:
+        with _client_lock:
+            if _async_client is None:
+                _async_client = httpx.AsyncClient(
+                    http2=http2_enabled, limits=_limits(), timeout=10.0
+                )
+    return _async_client
+
+
+def close_http_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+async def close_async_http_client() -> None:
+    global _async_client
+    client, _async_client = _async_client, None
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,161 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Iterator
+
+
+class UpstreamUnavailableError(Exception):
+    """
+    An upstream service timed out, failed or is being short-circuited. It is
+    deliberately not a ValueError so the repositories' input-error wrappers
+    let it through unchanged.
+    """
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker. Outcomes of the calls made during the last
+    ``window_seconds`` are kept; once at least ``min_calls`` were made and the
+    failure ratio reaches ``failure_threshold`` the breaker opens and calls
+    fail fast for ``open_seconds``. After that a single trial call is let
+    through (half-open): success closes the breaker, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: float = 0.5,
+        min_calls: int = 20,
+        window_seconds: float = 30.0,
+        open_seconds: float = 15.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and self._clock() - self._opened_at >= self.open_seconds
+        ):
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise UpstreamUnavailableError instead of calling an unhealthy upstream."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            self.rejected += 1
+        raise UpstreamUnavailableError(f"{self.name} is temporarily unavailable")
+
+    def abandon_call(self) -> None:
+        """
+        The call ended without an outcome (e.g. it was cancelled). Nothing is
+        recorded, but a half-open trial slot is freed for the next caller.
+        """
+        with self._lock:
+            if self._current_state() == self.HALF_OPEN:
+                self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._current_state() == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+            self._record(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._current_state() == self.HALF_OPEN:
+                self._open()
+                return
+            self._record(False)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if (
+                self._state == self.CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_threshold
+            ):
+                self._open()
+
+    def _record(self, ok: bool) -> None:
+        now = self._clock()
+        self._outcomes.append((now, ok))
+        while self._outcomes and self._outcomes[0][0] <= now - self.window_seconds:
+            self._outcomes.popleft()
+
+    def _open(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = self._clock()
+        self._trial_in_flight = False
+        self._outcomes.clear()
+        self.times_opened += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            state = self._current_state()
+            calls = len(self._outcomes)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            return {
+                "state": state,
+                "calls": calls,
+                "failures": failures,
+                "failure_rate": failures / calls if calls else 0.0,
+                "rejected": self.rejected,
+                "times_opened": self.times_opened,
+            }
+
+
+class RetryPolicy:
+    """
+    Bounded retries with "full jitter" exponential backoff: the n-th delay is
+    drawn uniformly from [0, min(max_delay, base_delay * 2**n)]. Only meant
+    for idempotent calls.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        rng: Callable[[float, float], float] = random.uniform,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = rng
+
+    def delays(self) -> Iterator[float]:
+        """Delays to sleep before each retry (``max_attempts - 1`` of them)."""
+        for attempt in range(self.max_attempts - 1):
+            yield self._rng(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
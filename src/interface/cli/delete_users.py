@@ -0,0 +1,36 @@
+"""
+Bulk-delete users (Auth accounts and Firestore profiles) and print the
+per-uid outcomes as JSON.
+
+    python -m src.interface.cli.delete_users uids.txt
+    cat uids.txt | python -m src.interface.cli.delete_users -
+
+The input has one uid per line. The exit code is 1 when any uid failed.
+"""
+
+import argparse
+import json
+import sys
+from ...adapters.firebase_adapter import firebase_adapter
+
+
+def read_user_ids(path: str) -> list[str]:
+    if path == "-":
+        return [line.strip() for line in sys.stdin if line.strip()]
+    with open(path, encoding="utf-8") as file:
+        return [line.strip() for line in file if line.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk-delete Firebase users.")
+    parser.add_argument("path", help="file with one uid per line, or - for stdin")
+    args = parser.parse_args(argv)
+
+    report = firebase_adapter.user_use_cases.delete_users(read_user_ids(args.path))
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
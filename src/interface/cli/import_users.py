@@ -0,0 +1,42 @@
+"""
+Bulk-import users from a file and print the import report as JSON.
+
+    python -m src.interface.cli.import_users users.csv
+
+Accepted formats (by extension): .csv with an ``email,password,alias``
+header, .json with an array of objects, .ndjson/.jsonl with one object per
+line. The exit code is 1 when any record failed.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from ...adapters.firebase_adapter import firebase_adapter
+
+
+def read_records(path: str) -> list[dict]:
+    with open(path, encoding="utf-8", newline="") as file:
+        if path.endswith(".csv"):
+            return [
+                {**row, "alias": row.get("alias") or None}
+                for row in csv.DictReader(file)
+            ]
+        if path.endswith((".ndjson", ".jsonl")):
+            return [json.loads(line) for line in file if line.strip()]
+        return json.load(file)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk-import users into Firebase.")
+    parser.add_argument("path", help="CSV, JSON or NDJSON file with the users")
+    args = parser.parse_args(argv)
+
+    report = firebase_adapter.user_use_cases.import_users(read_records(args.path))
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
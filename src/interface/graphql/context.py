@@ -1,13 +1,85 @@
+import asyncio
 import strawberry
 from strawberry.types import Info
 from graphql import GraphQLError
 from fastapi import Request
 
 
+class RequestAuth:
+    """
+    Bearer token of the current request. It is verified lazily, the first
+    time a protected resolver asks for it, and at most once per request; the
+    outcome (claims or error) is reused by every later resolver.
+    """
+
+    def __init__(self, auth_header: list[str], token_repository):
+        self.auth_header = auth_header
+        self.token_repository = token_repository
+        self._outcome: tuple[dict | None, GraphQLError | None] | None = None
+        self._pending: asyncio.Future | None = None
+
+    def verify(self) -> dict:
+        if self._outcome is None:
+            try:
+                token = self._bearer_token()
+                self._outcome = (self.token_repository.verify_token(token), None)
+            except Exception as e:
+                self._outcome = (None, self._as_graphql_error(e))
+        return self._unwrap()
+
+    async def verify_async(self) -> dict:
+        if self._outcome is None:
+            # Concurrent resolvers of the same request share one verification.
+            if self._pending is None:
+                self._pending = asyncio.ensure_future(self._verify_once_async())
+            # Shielded: a cancelled resolver must not cancel its siblings.
+            await asyncio.shield(self._pending)
+        return self._unwrap()
+
+    async def _verify_once_async(self) -> None:
+        try:
+            token = self._bearer_token()
+            verified_token = await self.token_repository.verify_token_async(token)
+            self._outcome = (verified_token, None)
+        except Exception as e:
+            self._outcome = (None, self._as_graphql_error(e))
+
+    @staticmethod
+    def _as_graphql_error(error: Exception) -> GraphQLError:
+        if isinstance(error, GraphQLError):
+            return error
+        return GraphQLError(f"{str(error)}", extensions={"code": "UNAUTHORIZED"})
+
+    def _bearer_token(self) -> str:
+        if self.auth_header[0].lower() != "bearer":
+            raise GraphQLError(
+                "Invalid authorization header",
+                extensions={"code": "UNAUTHORIZED"},
+            )
+        token = self.auth_header[1] if len(self.auth_header) > 1 else ""
+        if not token:
+            raise GraphQLError(
+                "Authorization required", extensions={"code": "UNAUTHORIZED"}
+            )
+        return token
+
+    def _unwrap(self) -> dict:
+        verified_token, error = self._outcome
+        if error is not None:
+            raise error
+        return verified_token
+
+
 async def get_context(request: Request):
+    # Importado aquí para que el módulo no necesite credenciales de Firebase
+    from ...adapters.firebase_adapter import firebase_adapter
+
     auth_header = request.headers.get("Authorization")
     if auth_header:
         header_parts = auth_header.split(" ")
-        return {"auth_header": header_parts}
     else:
-        return {"auth_header": ["", ""]}  # Default empty header parts
+        header_parts = ["", ""]  # Default empty header parts
+    return {
+        "auth_header": header_parts,
+        "auth": RequestAuth(header_parts, firebase_adapter.token_repository),
+    }
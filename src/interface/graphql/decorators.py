@@ -1,33 +1,31 @@
+import inspect
 import strawberry
 from strawberry.types import Info
 from graphql import GraphQLError
-from ...infrastructure.repositories.token_auth_repository import TokenAuthRepository
 from functools import wraps
 
-token_repository = TokenAuthRepository()
-
 
 def login_required(resolver):
+    """
+    Require a verified bearer token. The token is verified through the
+    request's ``auth`` context entry, so it is checked at most once per
+    request however many protected resolvers run. Async resolvers get an
+    async wrapper that verifies without blocking the event loop.
+    """
+    if inspect.iscoroutinefunction(resolver):
+
+        @wraps(resolver)
+        async def async_wrapper(*args, info: Info, **kwargs):
+            verified_token = await info.context["auth"].verify_async()
+            info.context["verified_token"] = verified_token
+            return await resolver(*args, info=info, **kwargs)
+
+        return async_wrapper
+
     @wraps(resolver)
     def wrapper(*args, info: Info, **kwargs):
-        context = info.context
-        auth_header = context.get("auth_header")
-        if auth_header[0].lower() != "bearer":
-            raise GraphQLError(
-                "Invalid authorization header",
-                extensions={"code": "UNAUTHORIZED"},
-            )
-        token = auth_header[1]
-        if not token:
-            raise GraphQLError(
-                "Authorization required", extensions={"code": "UNAUTHORIZED"}
-            )
-        try:
-            verified_token = token_repository.verify_token(token)
-            context["verified_token"] = verified_token
-        except Exception as e:
-            raise GraphQLError(f"{str(e)}", extensions={"code": "UNAUTHORIZED"})
-
+        verified_token = info.context["auth"].verify()
+        info.context["verified_token"] = verified_token
         return resolver(*args, info=info, **kwargs)
 
     return wrapper
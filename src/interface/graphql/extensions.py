@@ -0,0 +1,24 @@
+from typing import Iterator
+from graphql import ExecutionResult as GraphQLExecutionResult
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionResult
+from ...infrastructure.rest.resilience import UpstreamUnavailableError
+
+
+class UpstreamErrorCodes(SchemaExtension):
+    """
+    Tag errors caused by an unavailable upstream with the UPSTREAM_UNAVAILABLE
+    code, so clients can tell an outage (retry later) from a bad request.
+    """
+
+    def on_operation(self) -> Iterator[None]:
+        yield
+        result = self.execution_context.result
+        if not isinstance(result, (GraphQLExecutionResult, ExecutionResult)):
+            return
+        for error in result.errors or []:
+            if isinstance(error.original_error, UpstreamUnavailableError):
+                error.extensions = {
+                    **(error.extensions or {}),
+                    "code": "UPSTREAM_UNAVAILABLE",
+                }
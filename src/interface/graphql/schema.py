@@ -1,37 +1,64 @@
+import asyncio
 import strawberry
 from strawberry.types import Info
-from src.adapters.firebase_adapter import FirebaseAdapter
+from src.adapters.firebase_adapter import firebase_adapter
 from .decorators import login_required
+from .extensions import UpstreamErrorCodes
 from src.interface.graphql.types import (
     UserType,
+    UserPageType,
     UserInput,
     TokenType,
     PasswordResetResponse,
     userInfoType,
     decodedTokenType,
     TokenRefreshType,
+    TokenVerificationResultType,
+    TokenRefreshResultType,
 )
 
 # Inyección de dependencias
-firebase_adapter = FirebaseAdapter()
 user_use_cases = firebase_adapter.user_use_cases
 token_use_cases = firebase_adapter.token_use_cases
 
 
+def _to_decoded_token_type(token_data: dict) -> decodedTokenType:
+    return decodedTokenType(
+        uid=token_data["uid"],
+        email=token_data.get("email"),
+        email_verified=token_data.get("email_verified"),
+        user_info=userInfoType(**token_data.get("user_info")),
+    )
+
+
 @strawberry.type
 class Query:
     @strawberry.field
-    def get_user(self, user_id: str) -> UserType | None:
-        user_data = user_use_cases.get_user(user_id)
+    async def get_user(self, user_id: str) -> UserType | None:
+        user_data = await user_use_cases.get_user_async(user_id)
         if user_data:
             return UserType(**user_data)
         return None
 
     @strawberry.field
+    async def get_users(self, user_ids: list[str]) -> list[UserType | None]:
+        users_data = await asyncio.to_thread(user_use_cases.get_users, user_ids)
+        return [UserType(**user) if user else None for user in users_data]
+
+    @strawberry.field(deprecation_reason="Use users(first:, after:) instead")
     def list_users(self) -> list[UserType]:
         users_data = user_use_cases.list_users()
         return [UserType(**user) for user in users_data]
 
+    @strawberry.field
+    async def users(self, first: int = 100, after: str | None = None) -> UserPageType:
+        page = await asyncio.to_thread(user_use_cases.list_users_page, first, after)
+        return UserPageType(
+            users=[UserType(**user) for user in page["users"]],
+            next_page_token=page["next_page_token"],
+            has_next_page=page["next_page_token"] is not None,
+        )
+
 
 @strawberry.type
 class Mutation:
@@ -43,15 +70,15 @@ class Mutation:
         return UserType(**user_data)
 
     @strawberry.mutation
-    def login_user(self, email: str, password: str) -> TokenType | None:
-        login_data = user_use_cases.login_user(email, password)
+    async def login_user(self, email: str, password: str) -> TokenType | None:
+        login_data = await user_use_cases.login_user_async(email, password)
         if login_data:
             return TokenType(**login_data)
         return None
 
     @strawberry.mutation
     @login_required
-    def update_user(self, info: Info, user_input: UserInput) -> UserType | None:
+    async def update_user(self, info: Info, user_input: UserInput) -> UserType | None:
         decoded_token = info.context.get("verified_token")
         user_id = decoded_token.get("uid")
         user_data = {
@@ -60,44 +87,69 @@ class Mutation:
             "password": user_input.password,
             "alias": user_input.alias,
         }
-        updated_user = user_use_cases.update_user(user_data)
+        updated_user = await asyncio.to_thread(user_use_cases.update_user, user_data)
         if updated_user:
             return UserType(**updated_user)
         return None
 
     @strawberry.mutation
-    def send_password_reset_email(self, email: str) -> PasswordResetResponse:
-        reset_confirmation = user_use_cases.send_password_reset_email(email)
+    async def send_password_reset_email(self, email: str) -> PasswordResetResponse:
+        reset_confirmation = user_use_cases.queue_password_reset_email(email)
         return PasswordResetResponse(**reset_confirmation)
 
     @strawberry.mutation
     @login_required
-    def delete_user(self, info: Info) -> bool:
+    async def delete_user(self, info: Info) -> bool:
         try:
             user_id = info.context.get("verified_token").get("uid")
-            user_use_cases.delete_user(user_id)
+            await asyncio.to_thread(user_use_cases.delete_user, user_id)
             return True
         except Exception:
             return False
 
     @strawberry.mutation
-    def verify_token(self, id_token: str) -> decodedTokenType | None:
-        token_data = token_use_cases.verify_token(id_token)
+    async def verify_token(self, id_token: str) -> decodedTokenType | None:
+        token_data = await token_use_cases.verify_token_async(id_token)
         if token_data:
-            return decodedTokenType(
-                uid=token_data["uid"],
-                email=token_data.get("email"),
-                email_verified=token_data.get("email_verified"),
-                user_info=userInfoType(**token_data.get("user_info")),
-            )
+            return _to_decoded_token_type(token_data)
         return None
 
     @strawberry.mutation
-    def refresh_token(self, refresh_token: str) -> TokenRefreshType | None:
-        new_token_data = token_use_cases.refresh_token(refresh_token)
+    async def verify_tokens(
+        self, id_tokens: list[str]
+    ) -> list[TokenVerificationResultType]:
+        results = await token_use_cases.verify_tokens_async(id_tokens)
+        return [
+            TokenVerificationResultType(
+                token=(
+                    _to_decoded_token_type(result["token"]) if result["token"] else None
+                ),
+                error=result["error"],
+            )
+            for result in results
+        ]
+
+    @strawberry.mutation
+    async def refresh_token(self, refresh_token: str) -> TokenRefreshType | None:
+        new_token_data = await token_use_cases.refresh_token_async(refresh_token)
         if new_token_data:
             return TokenRefreshType(**new_token_data)
         return None
 
+    @strawberry.mutation
+    async def refresh_tokens(
+        self, refresh_tokens: list[str]
+    ) -> list[TokenRefreshResultType]:
+        results = await token_use_cases.refresh_tokens_async(refresh_tokens)
+        return [
+            TokenRefreshResultType(
+                token=TokenRefreshType(**result["token"]) if result["token"] else None,
+                error=result["error"],
+            )
+            for result in results
+        ]
+
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+schema = strawberry.Schema(
+    query=Query, mutation=Mutation, extensions=[UpstreamErrorCodes]
+)
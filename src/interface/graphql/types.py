@@ -9,6 +9,13 @@ class UserType:
     photo_url: str | None = None
 
 
+@strawberry.type
+class UserPageType:
+    users: list[UserType]
+    next_page_token: str | None = None
+    has_next_page: bool = False
+
+
 @strawberry.input
 class UserInput:
     email: str | None = None
@@ -52,6 +59,18 @@ class decodedTokenType:
     user_info: userInfoType
 
 
+@strawberry.type
+class TokenVerificationResultType:
+    token: decodedTokenType | None = None
+    error: str | None = None
+
+
+@strawberry.type
+class TokenRefreshResultType:
+    token: TokenRefreshType | None = None
+    error: str | None = None
+
+
 @strawberry.type
 class PasswordResetResponse:
     success: bool
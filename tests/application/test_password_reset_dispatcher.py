@@ -0,0 +1,96 @@
+import pytest
+from unittest.mock import Mock
+from src.application.password_reset_dispatcher import PasswordResetDispatcher
+from src.domain.repositories.user_repository import UserRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPasswordResetDispatcher:
+    """Test cases for PasswordResetDispatcher."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.repository = Mock(spec=UserRepository)
+        self.clock = FakeClock()
+        self.sleeps = []
+        self.dispatcher = PasswordResetDispatcher(
+            self.repository,
+            workers=2,
+            max_attempts=3,
+            retry_delay=1.0,
+            dedupe_seconds=60,
+            max_queue_size=2,
+            clock=self.clock,
+            sleep=self.sleeps.append,
+        )
+
+    def test_enqueue_deduplicates_within_window(self):
+        """Test repeat requests for the same email are dropped inside the window."""
+        assert self.dispatcher.enqueue("test@example.com") is True
+        assert self.dispatcher.enqueue("Test@Example.com ") is False
+
+        self.clock.now = 61
+        assert self.dispatcher.enqueue("test@example.com") is True
+        assert self.dispatcher.stats()["deduplicated"] == 1
+
+    def test_enqueue_full_queue(self):
+        """Test a full queue rejects new requests with ValueError."""
+        self.dispatcher.enqueue("a@example.com")
+        self.dispatcher.enqueue("b@example.com")
+
+        with pytest.raises(ValueError, match="Too many password reset requests"):
+            self.dispatcher.enqueue("c@example.com")
+
+    def test_workers_drain_the_queue(self):
+        """Test queued emails are sent by the workers before they stop."""
+        # Arrange
+        self.dispatcher.enqueue("a@example.com")
+        self.dispatcher.enqueue("b@example.com")
+
+        # Act
+        self.dispatcher.start()
+        self.dispatcher.stop()
+
+        # Assert
+        sent = {
+            call.args[0]
+            for call in self.repository.send_password_reset_email.call_args_list
+        }
+        assert sent == {"a@example.com", "b@example.com"}
+        stats = self.dispatcher.stats()
+        assert stats["sent"] == 2
+        assert stats["queue_depth"] == 0
+
+    def test_transient_failures_are_retried_with_backoff(self):
+        """Test non-ValueError failures are retried with exponential backoff."""
+        self.repository.send_password_reset_email.side_effect = [
+            ConnectionError("timed out"),
+            ConnectionError("timed out"),
+            {"success": True, "response": "test@example.com"},
+        ]
+
+        self.dispatcher._deliver("test@example.com")
+
+        assert self.repository.send_password_reset_email.call_count == 3
+        assert self.sleeps == [1.0, 2.0]
+        assert self.dispatcher.stats()["sent"] == 1
+
+    def test_rejected_emails_are_not_retried(self):
+        """Test a ValueError from Firebase is a permanent failure."""
+        self.repository.send_password_reset_email.side_effect = ValueError(
+            "Failed to send password reset email"
+        )
+
+        self.dispatcher._deliver("nobody@example.com")
+
+        self.repository.send_password_reset_email.assert_called_once()
+        stats = self.dispatcher.stats()
+        assert stats["failed"] == 1
+        assert stats["last_error"] == "Failed to send password reset email"
@@ -1,9 +1,11 @@
+import asyncio
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 from src.application.token_use_cases import TokenUseCases
 from src.domain.entities.token import Token
 from src.domain.entities.refresh_token import RefreshToken
 from src.domain.repositories.token_repository import TokenRepository
+from src.infrastructure.rest.resilience import UpstreamUnavailableError
 
 
 class TestTokenUseCases:
@@ -49,6 +51,37 @@ class TestTokenUseCases:
         assert result is None
         self.repository.verify_token.assert_called_once_with(id_token)
 
+    def test_verify_tokens_batch_too_large(self):
+        """Test batches above the maximum size raise ValueError."""
+        # Arrange
+        use_cases = TokenUseCases(self.repository, max_batch_size=2)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Too many tokens"):
+            asyncio.run(use_cases.verify_tokens_async(["a", "b", "c"]))
+
+        self.repository.verify_token_async.assert_not_called()
+
+    def test_verify_tokens_async_preserves_order_and_errors(self):
+        """Test async batch verification keeps input order and per-token errors."""
+
+        # Arrange
+        async def verify(id_token):
+            if id_token == "bad_token":
+                raise ValueError("Expired token")
+            return {"uid": f"uid_{id_token}"}
+
+        self.repository.verify_token_async = AsyncMock(side_effect=verify)
+
+        # Act
+        result = asyncio.run(self.use_cases.verify_tokens_async(["bad_token", "b"]))
+
+        # Assert
+        assert result == [
+            {"token": None, "error": "Expired token"},
+            {"token": {"uid": "uid_b"}, "error": None},
+        ]
+
     def test_refresh_token_valid(self):
         """Test refreshing a valid token."""
         # Arrange
@@ -83,3 +116,94 @@ class TestTokenUseCases:
         # Assert
         assert result is None
         self.repository.refresh_token.assert_called_once_with(refresh_token_str)
+
+    def test_refresh_token_async_valid(self):
+        """Test refreshing a token through the async path."""
+        # Arrange
+        expected_refresh_token = RefreshToken(
+            access_token="new_access_token",
+            expires_in="3600",
+            token_type="refresh_token",
+            refresh_token="new_refresh_token",
+            id_token="new_id_token",
+            user_id="123",
+            project_id="project_123",
+        )
+        self.repository.refresh_token_async.return_value = expected_refresh_token
+
+        # Act
+        result = asyncio.run(self.use_cases.refresh_token_async("valid_refresh_token"))
+
+        # Assert
+        assert result == expected_refresh_token.to_dict()
+        self.repository.refresh_token_async.assert_awaited_once_with(
+            "valid_refresh_token"
+        )
+
+    def test_refresh_tokens_async_preserves_order_and_errors(self):
+        """Test batch refresh keeps input order and per-token errors."""
+
+        # Arrange
+        async def refresh(refresh_token):
+            if refresh_token == "bad_refresh_token":
+                raise ValueError("Error refreshing token: Failed to refresh ID token")
+            return RefreshToken(
+                access_token="access",
+                expires_in="3600",
+                token_type="Bearer",
+                refresh_token=refresh_token,
+                id_token=f"id_{refresh_token}",
+                user_id="123",
+                project_id="project_123",
+            )
+
+        self.repository.refresh_token_async = AsyncMock(side_effect=refresh)
+
+        # Act
+        result = asyncio.run(
+            self.use_cases.refresh_tokens_async(["r1", "bad_refresh_token"])
+        )
+
+        # Assert
+        assert result[0]["token"]["id_token"] == "id_r1"
+        assert result[0]["error"] is None
+        assert result[1] == {
+            "token": None,
+            "error": "Error refreshing token: Failed to refresh ID token",
+        }
+
+    def test_refresh_tokens_async_upstream_failure_is_per_item(self):
+        """Test an upstream outage on one refresh does not fail the batch."""
+
+        # Arrange
+        async def refresh(refresh_token):
+            if refresh_token == "r2":
+                raise UpstreamUnavailableError("securetoken is temporarily unavailable")
+            return RefreshToken(
+                access_token="access",
+                expires_in="3600",
+                token_type="Bearer",
+                refresh_token=refresh_token,
+                id_token=f"id_{refresh_token}",
+                user_id="123",
+                project_id="project_123",
+            )
+
+        self.repository.refresh_token_async = AsyncMock(side_effect=refresh)
+
+        # Act
+        result = asyncio.run(self.use_cases.refresh_tokens_async(["r1", "r2"]))
+
+        # Assert
+        assert result[0]["token"]["id_token"] == "id_r1"
+        assert result[1] == {
+            "token": None,
+            "error": "securetoken is temporarily unavailable",
+        }
+
+    def test_refresh_tokens_async_batch_too_large(self):
+        """Test batch refresh rejects batches over the limit."""
+        use_cases = TokenUseCases(self.repository, max_batch_size=1)
+
+        with pytest.raises(ValueError, match="Too many tokens"):
+            asyncio.run(use_cases.refresh_tokens_async(["r1", "r2"]))
@@ -1,5 +1,7 @@
+import asyncio
 import pytest
 from unittest.mock import Mock
+from src.application.password_reset_dispatcher import PasswordResetDispatcher
 from src.application.user_use_cases import UserUseCases
 from src.domain.entities.user import User
 from src.domain.entities.token import Token
@@ -22,7 +24,6 @@ class TestUserUseCases:
         alias = "testuser"
         expected_user = User(id="user_123", email=email, password=password, alias=alias)
 
-        self.repository.get_user_by_email.return_value = None
         self.repository.create_user.return_value = expected_user
 
         # Act
@@ -30,7 +31,7 @@ class TestUserUseCases:
 
         # Assert
         assert result == expected_user.to_dict_no_password()
-        self.repository.get_user_by_email.assert_called_once_with(email)
+        self.repository.get_user_by_email.assert_not_called()
         self.repository.create_user.assert_called_once_with(email, password, alias)
 
     def test_create_user_already_exists(self):
@@ -38,21 +39,16 @@ class TestUserUseCases:
         # Arrange
         email = "existing@example.com"
         password = "password123"
-        existing_user = User(
-            id="user_456",
-            email=email,
-            password="existing_password",
-            alias="existing_user",
+        self.repository.create_user.side_effect = ValueError(
+            "User with this email already exists"
         )
 
-        self.repository.get_user_by_email.return_value = existing_user
-
         # Act & Assert
         with pytest.raises(ValueError, match="User with this email already exists"):
             self.use_cases.create_user(email, password)
 
-        self.repository.get_user_by_email.assert_called_once_with(email)
-        self.repository.create_user.assert_not_called()
+        self.repository.get_user_by_email.assert_not_called()
+        self.repository.create_user.assert_called_once_with(email, password, None)
 
     def test_login_user_success(self):
         """Test logging in a user successfully."""
@@ -83,7 +79,7 @@ class TestUserUseCases:
 
         # Assert
         assert result == expected_token.to_dict()
-        self.repository.get_user_by_email.assert_called_once_with(email)
+        self.repository.get_user_by_email.assert_not_called()
         self.repository.login_user.assert_called_once_with(email, password)
 
     def test_login_user_not_found(self):
@@ -92,13 +88,30 @@ class TestUserUseCases:
         email = "nonexistent@example.com"
         password = "password123"
 
-        self.repository.get_user_by_email.return_value = None
+        self.repository.login_user.side_effect = ValueError(
+            "No user found with this email"
+        )
 
         # Act & Assert
         with pytest.raises(ValueError, match="No user found with this email"):
             self.use_cases.login_user(email, password)
 
-        self.repository.get_user_by_email.assert_called_once_with(email)
+        self.repository.get_user_by_email.assert_not_called()
+        self.repository.login_user.assert_called_once_with(email, password)
+
+    def test_login_user_not_found_with_email_precheck(self):
+        """Test the pre-check mode looks the email up before signing in."""
+        # Arrange
+        use_cases = UserUseCases(self.repository, email_precheck=True)
+        self.repository.get_user_by_email.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="No user found with this email"):
+            use_cases.login_user("nonexistent@example.com", "password123")
+
+        self.repository.get_user_by_email.assert_called_once_with(
+            "nonexistent@example.com"
+        )
         self.repository.login_user.assert_not_called()
 
     def test_login_user_invalid_credentials(self):
@@ -121,9 +134,52 @@ class TestUserUseCases:
 
         # Assert
         assert result is None
-        self.repository.get_user_by_email.assert_called_once_with(email)
+        self.repository.get_user_by_email.assert_not_called()
         self.repository.login_user.assert_called_once_with(email, password)
 
+    def test_login_user_async_success(self):
+        """Test logging in through the async path."""
+        # Arrange
+        email = "test@example.com"
+        password = "password123"
+        expected_token = Token(
+            local_id="user_123",
+            email=email,
+            alias="testuser",
+            id_token="id_token_123",
+            registered=True,
+            refresh_token="refresh_token_456",
+            expires_in="3600",
+        )
+
+        self.repository.get_user_by_email_async.return_value = User(
+            id="user_123", email=email, password="", alias="testuser"
+        )
+        self.repository.login_user_async.return_value = expected_token
+
+        # Act
+        result = asyncio.run(self.use_cases.login_user_async(email, password))
+
+        # Assert
+        assert result == expected_token.to_dict()
+        self.repository.login_user_async.assert_awaited_once_with(email, password)
+        self.repository.login_user.assert_not_called()
+
+    def test_login_user_async_not_found(self):
+        """Test the async login path raises ValueError for unknown emails."""
+        # Arrange
+        self.repository.login_user_async.side_effect = ValueError(
+            "No user found with this email"
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="No user found with this email"):
+            asyncio.run(
+                self.use_cases.login_user_async("nobody@example.com", "password123")
+            )
+
+        self.repository.get_user_by_email_async.assert_not_awaited()
+
     def test_get_user_success(self):
         """Test getting a user by ID successfully."""
         # Arrange
@@ -144,6 +200,19 @@ class TestUserUseCases:
         assert result == expected_user.to_dict_no_password()
         self.repository.get_user.assert_called_once_with(user_id)
 
+    def test_get_user_async_success(self):
+        """Test getting a user by ID through the async path."""
+        # Arrange
+        expected_user = User(id="user_123", email="test@example.com", alias="testuser")
+        self.repository.get_user_async.return_value = expected_user
+
+        # Act
+        result = asyncio.run(self.use_cases.get_user_async("user_123"))
+
+        # Assert
+        assert result == expected_user.to_dict_no_password()
+        self.repository.get_user_async.assert_awaited_once_with("user_123")
+
     def test_get_user_not_found(self):
         """Test getting a user that doesn't exist returns None."""
         # Arrange
@@ -157,6 +226,32 @@ class TestUserUseCases:
         assert result is None
         self.repository.get_user.assert_called_once_with(user_id)
 
+    def test_get_users_aligned_with_input(self):
+        """Test the batch lookup keeps input order and returns None for misses."""
+        # Arrange
+        user = User(id="user_1", email="a@example.com", password="", alias="alice")
+        self.repository.get_users.return_value = [user, None, user]
+
+        # Act
+        result = self.use_cases.get_users(["user_1", "missing", "user_1"])
+
+        # Assert
+        self.repository.get_users.assert_called_once_with(
+            ["user_1", "missing", "user_1"]
+        )
+        assert result == [
+            user.to_dict_no_password(),
+            None,
+            user.to_dict_no_password(),
+        ]
+
+    def test_get_users_too_many_ids(self):
+        """Test the batch lookup rejects more ids than one request may ask for."""
+        with pytest.raises(ValueError, match="Too many user ids"):
+            self.use_cases.get_users([f"user_{i}" for i in range(1001)])
+
+        self.repository.get_users.assert_not_called()
+
     def test_get_user_by_email_success(self):
         """Test getting a user by email successfully."""
         # Arrange
@@ -198,17 +293,55 @@ class TestUserUseCases:
             alias="updated_user",
         )
 
-        self.repository.get_user.return_value = existing_user
+        self.repository.get_user_uncached.return_value = existing_user
         self.repository.get_user_by_email.return_value = None
-        self.repository.update_user.return_value = updated_user
+        self.repository.update_user_fields.return_value = updated_user
 
         # Act
         result = self.use_cases.update_user(user_data)
 
         # Assert
         assert result == updated_user.to_dict_no_password()
-        self.repository.get_user.assert_called_once_with("user_123")
-        self.repository.update_user.assert_called_once()
+        self.repository.get_user_uncached.assert_called_once_with("user_123")
+        self.repository.update_user_fields.assert_called_once_with(
+            "user_123", {"email": "updated@example.com", "alias": "updated_user"}
+        )
+
+    def test_update_user_alias_only_skips_email_lookup(self):
+        """Test an unchanged email is neither checked nor written."""
+        # Arrange
+        existing_user = User(id="user_123", email="same@example.com", alias="old")
+        updated_user = User(id="user_123", email="same@example.com", alias="new")
+        self.repository.get_user_uncached.return_value = existing_user
+        self.repository.update_user_fields.return_value = updated_user
+
+        # Act
+        result = self.use_cases.update_user(
+            {"id": "user_123", "email": "same@example.com", "alias": "new"}
+        )
+
+        # Assert
+        assert result == updated_user.to_dict_no_password()
+        self.repository.get_user_by_email.assert_not_called()
+        self.repository.update_user_fields.assert_called_once_with(
+            "user_123", {"alias": "new"}
+        )
+
+    def test_update_user_without_changes_writes_nothing(self):
+        """Test an update that changes nothing returns the stored user."""
+        # Arrange
+        existing_user = User(id="user_123", email="same@example.com", alias="same")
+        self.repository.get_user_uncached.return_value = existing_user
+
+        # Act
+        result = self.use_cases.update_user(
+            {"id": "user_123", "email": "same@example.com", "alias": "same"}
+        )
+
+        # Assert
+        assert result == existing_user.to_dict_no_password()
+        self.repository.update_user_fields.assert_not_called()
+        self.repository.update_user.assert_not_called()
 
     def test_update_user_not_found(self):
         """Test updating a user that doesn't exist raises ValueError."""
@@ -219,14 +352,14 @@ class TestUserUseCases:
             "alias": "testuser",
         }
 
-        self.repository.get_user.return_value = None
+        self.repository.get_user_uncached.return_value = None
 
         # Act & Assert
         with pytest.raises(ValueError, match="User not found"):
             self.use_cases.update_user(user_data)
 
-        self.repository.get_user.assert_called_once_with("nonexistent_user")
-        self.repository.update_user.assert_not_called()
+        self.repository.get_user_uncached.assert_called_once_with("nonexistent_user")
+        self.repository.update_user_fields.assert_not_called()
 
     def test_update_user_email_already_in_use(self):
         """Test updating a user with an email already in use raises ValueError."""
@@ -249,15 +382,15 @@ class TestUserUseCases:
             alias="other_user",
         )
 
-        self.repository.get_user.return_value = existing_user
+        self.repository.get_user_uncached.return_value = existing_user
         self.repository.get_user_by_email.return_value = other_user
 
         # Act & Assert
         with pytest.raises(ValueError, match="Email already in use"):
             self.use_cases.update_user(user_data)
 
-        self.repository.get_user.assert_called_once_with("user_123")
-        self.repository.update_user.assert_not_called()
+        self.repository.get_user_uncached.assert_called_once_with("user_123")
+        self.repository.update_user_fields.assert_not_called()
 
     def test_send_password_reset_email_success(self):
         """Test sending password reset email successfully."""
@@ -279,9 +412,51 @@ class TestUserUseCases:
 
         # Assert
         assert result == expected_result
-        self.repository.get_user_by_email.assert_called_once_with(email)
+        self.repository.get_user_by_email.assert_not_called()
         self.repository.send_password_reset_email.assert_called_once_with(email)
 
+    def test_send_password_reset_email_async_success(self):
+        """Test sending a password reset email through the async path."""
+        # Arrange
+        email = "test@example.com"
+        expected_result = {"success": True, "response": email}
+        self.repository.get_user_by_email_async.return_value = User(
+            id="user_123", email=email, password="", alias="testuser"
+        )
+        self.repository.send_password_reset_email_async.return_value = expected_result
+
+        # Act
+        result = asyncio.run(self.use_cases.send_password_reset_email_async(email))
+
+        # Assert
+        assert result == expected_result
+        self.repository.send_password_reset_email_async.assert_awaited_once_with(email)
+
+    def test_queue_password_reset_email(self):
+        """Test queueing a reset email validates it and returns without sending."""
+        # Arrange
+        dispatcher = Mock(spec=PasswordResetDispatcher)
+        use_cases = UserUseCases(self.repository, dispatcher)
+
+        # Act
+        result = use_cases.queue_password_reset_email("test@example.com")
+
+        # Assert
+        assert result == {"success": True, "response": "test@example.com"}
+        dispatcher.enqueue.assert_called_once_with("test@example.com")
+        self.repository.get_user_by_email.assert_not_called()
+        self.repository.send_password_reset_email.assert_not_called()
+
+    def test_queue_password_reset_email_invalid_format(self):
+        """Test invalid emails are rejected before they reach the queue."""
+        dispatcher = Mock(spec=PasswordResetDispatcher)
+        use_cases = UserUseCases(self.repository, dispatcher)
+
+        with pytest.raises(ValueError, match="Invalid email format"):
+            use_cases.queue_password_reset_email("invalid-email")
+
+        dispatcher.enqueue.assert_not_called()
+
     def test_send_password_reset_email_invalid_format(self):
         """Test sending password reset email with invalid format raises ValueError."""
         # Arrange
@@ -298,14 +473,15 @@ class TestUserUseCases:
         """Test sending password reset email for non-existent user raises ValueError."""
         # Arrange
         email = "nonexistent@example.com"
-        self.repository.get_user_by_email.return_value = None
+        self.repository.send_password_reset_email.side_effect = ValueError(
+            "No user found with this email"
+        )
 
         # Act & Assert
         with pytest.raises(ValueError, match="No user found with this email"):
             self.use_cases.send_password_reset_email(email)
 
-        self.repository.get_user_by_email.assert_called_once_with(email)
-        self.repository.send_password_reset_email.assert_not_called()
+        self.repository.get_user_by_email.assert_not_called()
 
     def test_delete_user_success(self):
         """Test deleting a user successfully."""
@@ -433,3 +609,151 @@ class TestUserUseCases:
 
         self.repository.get_user_by_email.assert_not_called()
         self.repository.login_user.assert_not_called()
+
+    def test_list_users_page(self):
+        """Test listing one page of users returns the next page token."""
+        # Arrange
+        users = [User(id="user_1", email="user1@example.com", alias="user1")]
+        self.repository.list_users_page.return_value = (users, "token_2")
+
+        # Act
+        result = self.use_cases.list_users_page(first=1, after="token_1")
+
+        # Assert
+        assert result == {
+            "users": [users[0].to_dict_no_password()],
+            "next_page_token": "token_2",
+        }
+        self.repository.list_users_page.assert_called_once_with(1, "token_1")
+
+    def test_list_users_page_invalid_size(self):
+        """Test page sizes outside Firebase's limits are rejected."""
+        with pytest.raises(ValueError, match="first must be between 1 and 1000"):
+            self.use_cases.list_users_page(first=1001)
+
+        self.repository.list_users_page.assert_not_called()
+
+    def test_export_users_yields_pages(self):
+        """Test exporting users yields one list of dicts per repository page."""
+        # Arrange
+        first_page = [User(id="user_1", email="user1@example.com")]
+        second_page = [User(id="user_2", email="user2@example.com", alias="user2")]
+        self.repository.iter_user_pages.return_value = iter([first_page, second_page])
+
+        # Act
+        result = list(self.use_cases.export_users())
+
+        # Assert
+        assert result == [
+            [first_page[0].to_dict_no_password()],
+            [second_page[0].to_dict_no_password()],
+        ]
+
+    def test_import_users_reports_per_record_errors(self):
+        """Test bulk import validates records and maps repository failures back."""
+        # Arrange
+        records = [
+            {"email": "a@example.com", "password": "password123", "alias": "alice"},
+            {"email": "invalid-email", "password": "password123"},
+            {"email": "b@example.com", "password": "short"},
+            {"email": "c@example.com", "password": "password123"},
+            {"email": "A@example.com", "password": "password123"},
+            {"email": "taken@example.com", "password": "password123"},
+        ]
+
+        def import_users(users):
+            for index, user in enumerate(users):
+                if index != 2:
+                    user.id = f"user_{index}"
+            return {2: "User with this email already exists"}
+
+        self.repository.import_users.side_effect = import_users
+
+        # Act
+        report = self.use_cases.import_users(records)
+
+        # Assert
+        imported_users = self.repository.import_users.call_args.args[0]
+        assert [user.email for user in imported_users] == [
+            "a@example.com",
+            "c@example.com",
+            "taken@example.com",
+        ]
+        assert report["total"] == 6
+        assert report["imported"] == 2
+        assert report["failed"] == 4
+        assert report["errors"] == [
+            {"index": 1, "email": "invalid-email", "error": "Invalid email format"},
+            {
+                "index": 2,
+                "email": "b@example.com",
+                "error": "Invalid password format (minimum 8 characters)",
+            },
+            {
+                "index": 4,
+                "email": "A@example.com",
+                "error": "Duplicate email in import",
+            },
+            {
+                "index": 5,
+                "email": "taken@example.com",
+                "error": "User with this email already exists",
+            },
+        ]
+        assert report["warnings"] == []
+        assert report["users_per_second"] >= 0
+
+    def test_import_users_reports_missing_profile_as_warning(self):
+        """Test an account created without its profile counts as imported."""
+        # Arrange
+        records = [{"email": "a@example.com", "password": "password123"}]
+
+        def import_users(users):
+            users[0].id = "user_1"
+            return {0: "Imported without profile: deadline exceeded"}
+
+        self.repository.import_users.side_effect = import_users
+
+        # Act
+        report = self.use_cases.import_users(records)
+
+        # Assert
+        assert report["imported"] == 1
+        assert report["failed"] == 0
+        assert report["errors"] == []
+        assert report["warnings"] == [
+            {
+                "index": 0,
+                "email": "a@example.com",
+                "warning": "Imported without profile: deadline exceeded",
+            }
+        ]
+
+    def test_import_users_all_invalid_skips_repository(self):
+        """Test nothing is sent to Firebase when no record is valid."""
+        report = self.use_cases.import_users([{"email": "bad", "password": "x"}])
+
+        assert report["imported"] == 0
+        assert report["failed"] == 1
+        self.repository.import_users.assert_not_called()
+
+    def test_delete_users_reports_outcome_per_uid(self):
+        """Test bulk delete dedupes uids and reports each outcome in order."""
+        # Arrange
+        self.repository.delete_users.return_value = {"user_2": "USER_NOT_DISABLED"}
+
+        # Act
+        report = self.use_cases.delete_users(["user_1", "user_2", "", "user_1"])
+
+        # Assert
+        self.repository.delete_users.assert_called_once_with(["user_1", "user_2"])
+        self.repository.get_user.assert_not_called()
+        assert report == {
+            "total": 2,
+            "deleted": 1,
+            "failed": 1,
+            "results": [
+                {"user_id": "user_1", "deleted": True, "error": None},
+                {"user_id": "user_2", "deleted": False, "error": "USER_NOT_DISABLED"},
+            ],
+        }
@@ -0,0 +1 @@
+"""Test package for ID token verification."""
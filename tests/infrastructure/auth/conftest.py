@@ -0,0 +1,67 @@
+"""
+Fixtures to sign ID tokens with a throwaway RSA key pair.
+"""
+
+import datetime
+import time
+import jwt
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+PROJECT_ID = "test-project"
+
+
+@pytest.fixture(scope="session")
+def project_id():
+    """Firebase project the test tokens are issued for."""
+    return PROJECT_ID
+
+
+@pytest.fixture(scope="session")
+def signing_key():
+    """RSA private key used to sign test tokens."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="session")
+def certificate_pem(signing_key):
+    """Self-signed x509 certificate (PEM) for the signing key."""
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(signing_key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(signing_key, hashes.SHA256())
+    )
+    return certificate.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+
+
+@pytest.fixture
+def make_id_token(signing_key):
+    """Build a signed ID token; claims can be overridden per test."""
+
+    def _make(kid: str = "kid-1", **overrides) -> str:
+        now = int(time.time())
+        claims = {
+            "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+            "aud": PROJECT_ID,
+            "sub": "user_123",
+            "user_id": "user_123",
+            "email": "test@example.com",
+            "email_verified": True,
+            "auth_time": now - 10,
+            "iat": now - 10,
+            "exp": now + 3600,
+        }
+        claims.update(overrides)
+        return jwt.encode(claims, signing_key, algorithm="RS256", headers={"kid": kid})
+
+    return _make
@@ -0,0 +1,81 @@
+import time
+import pytest
+from firebase_admin import auth
+from src.infrastructure.auth.id_token_verifier import IdTokenVerifier, UnknownKeyIdError
+from src.infrastructure.auth.public_key_cache import PublicKeyCache
+
+
+class TestPublicKeyCache:
+    """Test cases for PublicKeyCache."""
+
+    def test_refresh_parses_keys_by_kid(self, certificate_pem):
+        """Test certificates are parsed once and indexed by kid."""
+        cache = PublicKeyCache(fetch=lambda url: ({"kid-1": certificate_pem}, 600))
+
+        assert cache.refresh() is True
+        assert cache.known_kids() == {"kid-1"}
+        assert cache.get("kid-1") is not None
+        assert cache.stats()["expires_in"] > 0
+
+    def test_failed_refresh_keeps_serving_old_keys(self, certificate_pem):
+        """Test stale keys are kept when a refresh fails."""
+        responses = [({"kid-1": certificate_pem}, 600)]
+
+        def fetch(url):
+            if responses:
+                return responses.pop()
+            raise ConnectionError("upstream down")
+
+        cache = PublicKeyCache(fetch=fetch)
+        cache.refresh()
+
+        assert cache.refresh() is False
+        assert cache.get("kid-1") is not None
+        assert cache.stats()["refresh_failures"] == 1
+
+    def test_unknown_kid_returns_none(self, certificate_pem):
+        """Test unknown kids are reported as missing."""
+        cache = PublicKeyCache(fetch=lambda url: ({"kid-1": certificate_pem}, 600))
+        cache.refresh()
+
+        assert cache.get("kid-2") is None
+        assert cache.stats()["unknown_kid_lookups"] == 1
+
+
+class TestIdTokenVerifier:
+    """Test cases for IdTokenVerifier."""
+
+    @pytest.fixture(autouse=True)
+    def verifier(self, certificate_pem, project_id):
+        cache = PublicKeyCache(fetch=lambda url: ({"kid-1": certificate_pem}, 600))
+        cache.refresh()
+        self.verifier = IdTokenVerifier(key_cache=cache, project_id=project_id)
+
+    def test_verify_valid_token(self, make_id_token):
+        """Test a correctly signed token returns its claims and uid."""
+        claims = self.verifier.verify(make_id_token())
+
+        assert claims["uid"] == "user_123"
+        assert claims["email"] == "test@example.com"
+
+    def test_verify_expired_token(self, make_id_token):
+        """Test expired tokens raise ExpiredIdTokenError."""
+        token = make_id_token(exp=int(time.time()) - 1)
+
+        with pytest.raises(auth.ExpiredIdTokenError):
+            self.verifier.verify(token)
+
+    def test_verify_wrong_audience(self, make_id_token):
+        """Test tokens for another project are rejected."""
+        with pytest.raises(auth.InvalidIdTokenError):
+            self.verifier.verify(make_id_token(aud="other-project"))
+
+    def test_verify_unknown_kid(self, make_id_token):
+        """Test tokens signed with an unknown key id are rejected."""
+        with pytest.raises(UnknownKeyIdError, match="kid"):
+            self.verifier.verify(make_id_token(kid="kid-2"))
+
+    def test_verify_malformed_token(self):
+        """Test malformed tokens are rejected."""
+        with pytest.raises(auth.InvalidIdTokenError):
+            self.verifier.verify("not-a-jwt")
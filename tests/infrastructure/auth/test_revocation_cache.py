@@ -0,0 +1,81 @@
+import pytest
+from firebase_admin import auth
+from src.infrastructure.auth.revocation_cache import RevocationCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRevocationCache:
+    """Test cases for RevocationCache."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.clock = FakeClock()
+        self.users = {"user_123": (False, 0)}
+        self.lookups = []
+
+        def fetch_users(uids):
+            self.lookups.append(list(uids))
+            return {uid: self.users[uid] for uid in uids if uid in self.users}
+
+        self.cache = RevocationCache(fetch_users=fetch_users, ttl=30, clock=self.clock)
+
+    def test_check_valid_token_is_cached(self):
+        """Test a valid token is accepted and the user state is reused."""
+        self.cache.check("user_123", issued_at=500)
+        self.cache.check("user_123", issued_at=500)
+
+        assert self.lookups == [["user_123"]]
+        assert self.cache.stats()["hits"] == 1
+
+    def test_check_revoked_token(self):
+        """Test tokens issued before tokens_valid_after are rejected."""
+        self.users["user_123"] = (False, 600 * 1000)
+
+        with pytest.raises(auth.RevokedIdTokenError):
+            self.cache.check("user_123", issued_at=500)
+
+    def test_check_disabled_user(self):
+        """Test tokens of disabled users are rejected."""
+        self.users["user_123"] = (True, 0)
+
+        with pytest.raises(auth.UserDisabledError):
+            self.cache.check("user_123", issued_at=500)
+
+    def test_check_deleted_user(self):
+        """Test tokens of users that no longer exist are rejected."""
+        with pytest.raises(auth.UserNotFoundError):
+            self.cache.check("ghost", issued_at=500)
+
+    def test_entry_expires_after_ttl(self):
+        """Test the user state is fetched again once the TTL elapses."""
+        self.cache.check("user_123", issued_at=500)
+        self.clock.now += 30
+
+        self.cache.check("user_123", issued_at=500)
+
+        assert len(self.lookups) == 2
+
+    def test_invalidate_forces_fresh_lookup(self):
+        """Test invalidation makes the next check see the latest state."""
+        self.cache.check("user_123", issued_at=500)
+        del self.users["user_123"]
+
+        self.cache.invalidate("user_123")
+
+        with pytest.raises(auth.UserNotFoundError):
+            self.cache.check("user_123", issued_at=500)
+
+    def test_refresh_is_chunked_in_bulk(self):
+        """Test bulk refreshes look up at most 100 uids per call."""
+        uids = [f"user_{i}" for i in range(250)]
+
+        self.cache.refresh(uids)
+
+        assert [len(chunk) for chunk in self.lookups] == [100, 100, 50]
@@ -0,0 +1,70 @@
+import time
+import pytest
+from src.infrastructure.auth.public_key_cache import PublicKeyCache
+from src.infrastructure.auth.token_prefilter import TokenPrefilter
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache, digest_key
+
+
+class TestTokenPrefilter:
+    """Test cases for TokenPrefilter."""
+
+    @pytest.fixture(autouse=True)
+    def prefilter(self, certificate_pem):
+        cache = PublicKeyCache(fetch=lambda url: ({"kid-1": certificate_pem}, 600))
+        cache.refresh()
+        self.prefilter = TokenPrefilter(cache)
+
+    def check(self, token: str) -> None:
+        self.prefilter.check(token, digest_key(token))
+
+    def test_injected_empty_cache_is_used(self):
+        """Test an injected (empty, hence falsy) negative cache is the one used."""
+        cache = LRUTTLCache(max_entries=10, default_ttl=60)
+        prefilter = TokenPrefilter(self.prefilter.key_cache, rejected_cache=cache)
+
+        with pytest.raises(ValueError, match="Invalid token"):
+            prefilter.check("abc", digest_key("abc"))
+
+        assert prefilter.rejected_cache is cache
+        assert cache.get(digest_key("abc")) == "Invalid token"
+
+    def test_valid_token_passes(self, make_id_token):
+        """Test well formed, unexpired tokens with a known kid pass."""
+        self.check(make_id_token())
+
+    @pytest.mark.parametrize("token", ["", "abc", "a.b", "a.b.c.d", "!!.??.sig"])
+    def test_malformed_tokens_are_rejected(self, token):
+        """Test tokens with a wrong segment count or encoding are rejected."""
+        with pytest.raises(ValueError, match="Invalid token"):
+            self.check(token)
+
+    def test_expired_token_is_rejected(self, make_id_token):
+        """Test tokens past their exp claim are rejected before crypto."""
+        with pytest.raises(ValueError, match="Expired token"):
+            self.check(make_id_token(exp=int(time.time()) - 10))
+
+    def test_unknown_kid_is_rejected_but_not_remembered(self, make_id_token):
+        """Test unknown kids are rejected without being negatively cached."""
+        token = make_id_token(kid="kid-2")
+
+        with pytest.raises(ValueError, match="Invalid token"):
+            self.check(token)
+
+        assert self.prefilter.rejected_cache.get(digest_key(token)) is None
+
+    def test_rejected_token_is_served_from_negative_cache(self):
+        """Test replayed bad tokens hit the negative cache."""
+        with pytest.raises(ValueError):
+            self.check("garbage")
+        with pytest.raises(ValueError):
+            self.check("garbage")
+
+        assert self.prefilter.stats()["rejections"]["negative_cache"] == 1
+
+    def test_remember_rejection(self, make_id_token):
+        """Test rejections from the full verification are remembered."""
+        token = make_id_token()
+        self.prefilter.remember_rejection(digest_key(token), "Invalid token")
+
+        with pytest.raises(ValueError, match="Invalid token"):
+            self.check(token)
@@ -0,0 +1,81 @@
+import pytest
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache, digest_key
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUTTLCache:
+    """Test cases for LRUTTLCache."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.clock = FakeClock()
+        self.cache = LRUTTLCache(max_entries=2, default_ttl=60, clock=self.clock)
+
+    def test_get_returns_stored_value(self):
+        """Test a stored value is returned and counted as a hit."""
+        self.cache.set("a", 1)
+
+        assert self.cache.get("a") == 1
+        assert self.cache.stats()["hits"] == 1
+
+    def test_get_missing_key_counts_miss(self):
+        """Test a missing key returns None and counts a miss."""
+        assert self.cache.get("missing") is None
+        assert self.cache.stats()["misses"] == 1
+
+    def test_entry_expires_after_ttl(self):
+        """Test entries are dropped once their TTL elapses."""
+        self.cache.set("a", 1, ttl=10)
+        self.clock.now += 10
+
+        assert self.cache.get("a") is None
+        assert self.cache.stats()["expirations"] == 1
+
+    def test_entry_expires_at_absolute_deadline(self):
+        """Test expires_at wins when it is sooner than the TTL."""
+        self.cache.set("a", 1, expires_at=self.clock.now + 5)
+        self.clock.now += 6
+
+        assert self.cache.get("a") is None
+
+    def test_already_expired_entry_is_not_stored(self):
+        """Test entries whose deadline has passed are ignored."""
+        self.cache.set("a", 1, expires_at=self.clock.now - 1)
+
+        assert len(self.cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the cache evicts the least recently used entry when full."""
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") == 1
+        assert self.cache.get("c") == 3
+        assert self.cache.stats()["evictions"] == 1
+
+    def test_pop_removes_entry(self):
+        """Test pop removes and returns the entry."""
+        self.cache.set("a", 1)
+
+        assert self.cache.pop("a") == 1
+        assert self.cache.get("a") is None
+
+    def test_invalid_max_entries(self):
+        """Test a non-positive capacity is rejected."""
+        with pytest.raises(ValueError):
+            LRUTTLCache(max_entries=0)
+
+    def test_digest_key_is_stable_and_hides_value(self):
+        """Test digest keys are deterministic and do not contain the secret."""
+        assert digest_key("secret") == digest_key("secret")
+        assert "secret" not in digest_key("secret")
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+from src.infrastructure.cache.user_change_feed import UserChangeFeed
+
+
+def added(marker: dict, change_type: str = "ADDED"):
+    return SimpleNamespace(
+        type=SimpleNamespace(name=change_type),
+        document=SimpleNamespace(to_dict=lambda: marker),
+    )
+
+
+class TestUserChangeFeed:
+    """Test cases for the Firestore-backed invalidation channel."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.db = Mock()
+        self.feed = UserChangeFeed(
+            self.db, collection="user_changes", clock=lambda: 100.0
+        )
+        self.invalidated = []
+        self.feed.subscribe(self.invalidated.append)
+
+    def test_publish_writes_a_marker(self):
+        """Test a local change is written as a marker document."""
+        self.feed.publish("user_123")
+
+        self.db.collection.assert_called_with("user_changes")
+        marker = self.db.collection.return_value.add.call_args.args[0]
+        assert marker["uid"] == "user_123"
+        assert marker["origin"] == self.feed.origin
+        assert marker["changed_at"] == 100.0
+        assert self.feed.stats()["published"] == 1
+
+    def test_publish_failure_is_swallowed(self):
+        """Test a failed marker write does not fail the user change."""
+        self.db.collection.return_value.add.side_effect = RuntimeError("unavailable")
+
+        self.feed.publish("user_123")
+
+        assert self.feed.stats()["publish_failures"] == 1
+
+    def test_publish_many_writes_batched_markers(self):
+        """Test a bulk change is published with one batch per 500 markers."""
+        batch = self.db.batch.return_value
+
+        self.feed.publish_many([f"user_{i}" for i in range(1200)])
+
+        assert self.db.batch.call_count == 3
+        assert batch.commit.call_count == 3
+        assert batch.set.call_count == 1200
+        marker = batch.set.call_args_list[0].args[1]
+        assert marker["uid"] == "user_0"
+        assert marker["origin"] == self.feed.origin
+        self.db.collection.return_value.add.assert_not_called()
+        assert self.feed.stats()["published"] == 1200
+
+    def test_publish_many_failure_is_swallowed(self):
+        """Test a failed marker batch only counts its markers as failures."""
+        self.db.batch.return_value.commit.side_effect = RuntimeError("unavailable")
+
+        self.feed.publish_many(["user_1", "user_2"])
+
+        assert self.feed.stats()["publish_failures"] == 2
+
+    def test_remote_changes_reach_subscribers(self):
+        """Test markers from other replicas invalidate the changed uid."""
+        self.feed._on_snapshot(
+            [],
+            [
+                added({"uid": "user_1", "origin": "other-replica"}),
+                added({"uid": "user_2", "origin": self.feed.origin}),
+                added({"uid": "user_3", "origin": "other-replica"}, "REMOVED"),
+            ],
+            None,
+        )
+
+        assert self.invalidated == ["user_1"]
+        assert self.feed.stats()["received"] == 1
+
+    def test_start_watches_new_markers_and_stop_unsubscribes(self):
+        """Test start installs one snapshot listener and stop removes it."""
+        query = self.db.collection.return_value.where.return_value
+
+        self.feed.start()
+        self.feed.start()
+        self.feed.stop()
+
+        query.on_snapshot.assert_called_once_with(self.feed._on_snapshot)
+        query.on_snapshot.return_value.unsubscribe.assert_called_once()
+        assert self.feed.stats()["watching"] is False
@@ -0,0 +1,177 @@
+import asyncio
+from unittest.mock import Mock
+from src.domain.entities.user import User
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.repositories.caching_user_repository import (
+    CachingUserRepository,
+)
+
+
+def make_user(email: str = "test@example.com", alias: str = "testuser") -> User:
+    return User(id="user_123", email=email, password="", alias=alias)
+
+
+class TestCachingUserRepository:
+    """Test cases for the read-through user cache."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.inner = Mock(spec=UserRepository)
+        self.repository = CachingUserRepository(self.inner, max_entries=100, ttl=60)
+
+    def test_get_user_is_cached(self):
+        """Test repeated lookups by uid hit Firebase once."""
+        self.inner.get_user.return_value = make_user()
+
+        first = self.repository.get_user("user_123")
+        second = self.repository.get_user("user_123")
+
+        assert first.email == second.email == "test@example.com"
+        self.inner.get_user.assert_called_once_with("user_123")
+        assert self.repository.stats()["users"]["hits"] == 1
+
+    def test_get_users_fetches_only_misses(self):
+        """Test a batch lookup serves cached users and asks for the rest once."""
+        self.inner.get_user.return_value = make_user()
+        self.repository.get_user("user_123")
+        self.inner.get_users.return_value = [None]
+
+        users = self.repository.get_users(["user_123", "missing", "user_123"])
+
+        self.inner.get_users.assert_called_once_with(["missing"])
+        assert [user.id if user else None for user in users] == [
+            "user_123",
+            None,
+            "user_123",
+        ]
+
+    def test_get_user_uncached_bypasses_and_refreshes_cache(self):
+        """Test the read used before writes always reaches the backend."""
+        self.inner.get_user.return_value = make_user(alias="stale")
+        self.repository.get_user("user_123")
+        self.inner.get_user_uncached.return_value = make_user(alias="fresh")
+
+        user = self.repository.get_user_uncached("user_123")
+
+        assert user.alias == "fresh"
+        assert self.repository.get_user("user_123").alias == "fresh"
+        self.inner.get_user.assert_called_once_with("user_123")
+
+    def test_read_racing_an_invalidation_is_not_cached(self):
+        """Test a change announced while a read is in flight is not undone."""
+
+        # Arrange: the feed invalidates the user while Firebase answers the old
+        # profile.
+        def stale_read(user_id):
+            self.repository.invalidate(user_id)
+            return make_user(alias="old")
+
+        self.inner.get_user.side_effect = stale_read
+
+        # Act
+        user = self.repository.get_user("user_123")
+        self.inner.get_user.side_effect = None
+        self.inner.get_user.return_value = make_user(alias="new")
+        again = self.repository.get_user("user_123")
+
+        # Assert
+        assert user.alias == "old"
+        assert again.alias == "new"
+        assert self.inner.get_user.call_count == 2
+
+    def test_read_after_an_invalidation_is_cached(self):
+        """Test reads started after the last invalidation are cached again."""
+        self.repository.invalidate("user_123")
+        self.inner.get_user.return_value = make_user()
+
+        self.repository.get_user("user_123")
+        self.repository.get_user("user_123")
+
+        self.inner.get_user.assert_called_once_with("user_123")
+
+    def test_lookup_by_uid_serves_lookup_by_email(self):
+        """Test a user cached by uid is also found by email, ignoring case."""
+        self.inner.get_user.return_value = make_user()
+        self.repository.get_user("user_123")
+
+        user = self.repository.get_user_by_email("Test@Example.com")
+
+        assert user.id == "user_123"
+        self.inner.get_user_by_email.assert_not_called()
+
+    def test_misses_are_not_cached(self):
+        """Test an unknown email is asked again, so a new signup is seen."""
+        self.inner.get_user_by_email.return_value = None
+
+        assert self.repository.get_user_by_email("new@example.com") is None
+        assert self.repository.get_user_by_email("new@example.com") is None
+
+        assert self.inner.get_user_by_email.call_count == 2
+
+    def test_cached_users_cannot_be_mutated_by_callers(self):
+        """Test callers get copies of the cached user."""
+        self.inner.get_user.return_value = make_user()
+
+        self.repository.get_user("user_123").alias = "changed"
+
+        assert self.repository.get_user("user_123").alias == "testuser"
+
+    def test_update_user_invalidates(self):
+        """Test updating a user drops it, including its old email."""
+        # Arrange
+        self.inner.get_user.return_value = make_user()
+        self.repository.get_user("user_123")
+        updated = make_user(email="new@example.com")
+        self.inner.update_user.return_value = updated
+        self.inner.get_user_by_email.return_value = None
+
+        # Act
+        self.repository.update_user(updated)
+
+        # Assert
+        assert self.repository.get_user_by_email("test@example.com") is None
+        self.inner.get_user_by_email.assert_called_once_with("test@example.com")
+
+    def test_update_user_fields_invalidates(self):
+        """Test a partial update drops the cached user."""
+        self.inner.get_user.return_value = make_user()
+        self.repository.get_user("user_123")
+        self.inner.update_user_fields.return_value = make_user(alias="new_alias")
+
+        self.repository.update_user_fields("user_123", {"alias": "new_alias"})
+        self.repository.get_user("user_123")
+
+        assert self.inner.get_user.call_count == 2
+
+    def test_delete_user_invalidates(self):
+        """Test deleting a user drops it from the cache."""
+        self.inner.get_user.return_value = make_user()
+        self.repository.get_user("user_123")
+
+        self.repository.delete_user("user_123")
+        self.repository.get_user("user_123")
+
+        self.inner.delete_user.assert_called_once_with("user_123")
+        assert self.inner.get_user.call_count == 2
+
+    def test_delete_users_invalidates_every_uid(self):
+        """Test a bulk delete drops all the given users from the cache."""
+        self.inner.get_user.return_value = make_user()
+        self.inner.delete_users.return_value = {}
+        self.repository.get_user("user_123")
+
+        self.repository.delete_users(["user_123", "user_456"])
+        self.repository.get_user("user_123")
+
+        self.inner.delete_users.assert_called_once_with(["user_123", "user_456"])
+        assert self.inner.get_user.call_count == 2
+
+    def test_get_user_by_email_async_is_cached(self):
+        """Test the async lookup reads through the same cache."""
+        self.inner.get_user_by_email_async.return_value = make_user()
+
+        asyncio.run(self.repository.get_user_by_email_async("test@example.com"))
+        user = asyncio.run(self.repository.get_user_async("user_123"))
+
+        assert user.email == "test@example.com"
+        self.inner.get_user_async.assert_not_awaited()
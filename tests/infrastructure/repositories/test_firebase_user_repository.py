@@ -0,0 +1,561 @@
+import asyncio
+import sys
+import threading
+import types
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from firebase_admin import _auth_utils, auth, exceptions
+from src.domain.entities.user import User
+
+FIREBASE_MODULE = "src.infrastructure.db.firebase"
+
+# The real module connects to Firebase on import; the repository only needs
+# the two names it imports, which every test replaces anyway.
+with patch.dict(sys.modules, {FIREBASE_MODULE: types.ModuleType(FIREBASE_MODULE)}):
+    sys.modules[FIREBASE_MODULE].auth_client = None
+    sys.modules[FIREBASE_MODULE].db = None
+    from src.infrastructure.repositories import firebase_user_repository
+
+FirebaseUserRepository = firebase_user_repository.FirebaseUserRepository
+
+
+def user_record(user_id: str, email: str | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        uid=user_id, email=email or f"{user_id}@example.com", display_name=user_id
+    )
+
+
+def profile(user_id: str, alias: str) -> SimpleNamespace:
+    return SimpleNamespace(id=user_id, exists=True, to_dict=lambda: {"alias": alias})
+
+
+class FirebaseStubs:
+    """Replaces the Firebase Auth client and Firestore with mocks."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.auth_client = Mock()
+        self.auth_client.UidIdentifier = auth.UidIdentifier
+        self.auth_client.EmailIdentifier = auth.EmailIdentifier
+        self.auth_client.ImportUserRecord = auth.ImportUserRecord
+        self.auth_client.UserImportHash = auth.UserImportHash
+        self.db = Mock()
+        self.db.collection.return_value.document.side_effect = (
+            lambda user_id: SimpleNamespace(id=user_id)
+        )
+        self.patches = [
+            patch.object(firebase_user_repository, "auth_client", self.auth_client),
+            patch.object(firebase_user_repository, "db", self.db),
+            patch.object(firebase_user_repository, "import_hash_rounds", 1),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        self.repository = FirebaseUserRepository()
+
+    def teardown_method(self):
+        for patcher in self.patches:
+            patcher.stop()
+
+
+class TestFirebaseUserRepositoryBulk(FirebaseStubs):
+    """Test cases for the bulk paths of FirebaseUserRepository."""
+
+    def test_get_users_chunks_and_keeps_input_order(self):
+        """Test uids are looked up 100 per call and returned in input order."""
+        # Arrange
+        requested = []
+
+        def get_users(identifiers):
+            requested.append([identifier.uid for identifier in identifiers])
+            return SimpleNamespace(
+                users=[
+                    user_record(identifier.uid)
+                    for identifier in identifiers
+                    if identifier.uid != "user_5"
+                ]
+            )
+
+        self.auth_client.get_users.side_effect = get_users
+        self.db.get_all.return_value = [profile("user_1", "alice")]
+        user_ids = [f"user_{i}" for i in range(250)]
+
+        # Act
+        users = self.repository.get_users(
+            ["user_249", "user_5"] + user_ids + ["x" * 200, "user_1"]
+        )
+
+        # Assert
+        assert sorted(len(chunk) for chunk in requested) == [50, 100, 100]
+        self.db.get_all.assert_called_once()
+        assert len(users) == 254
+        assert users[0].id == "user_249"
+        assert users[1] is None
+        assert users[3].id == "user_1"
+        assert users[3].alias == "alice"
+        assert users[4].alias == "user_2"
+        assert users[252] is None
+        assert users[253].id == "user_1"
+
+    def test_get_users_empty(self):
+        """Test an empty lookup makes no upstream calls."""
+        assert self.repository.get_users([]) == []
+
+        self.auth_client.get_users.assert_not_called()
+        self.db.get_all.assert_not_called()
+
+    def test_import_users_maps_chunk_errors_back_to_positions(self):
+        """Test existing emails, rejected records and profile failures by index."""
+        # Arrange
+        users = [
+            User(email=f"user{i}@example.com", password="password123") for i in range(5)
+        ]
+        self.auth_client.get_users.side_effect = lambda identifiers: (
+            SimpleNamespace(
+                users=[
+                    user_record("existing", identifier.email.upper())
+                    for identifier in identifiers
+                    if identifier.email == "user1@example.com"
+                ]
+            )
+        )
+        imported_records = []
+
+        def import_users(records, hash_alg):
+            imported_records.append([record.email for record in records])
+            errors = []
+            if records[0].email == "user2@example.com":
+                errors = [SimpleNamespace(index=0, reason="INVALID_EMAIL")]
+            return SimpleNamespace(errors=errors)
+
+        self.auth_client.import_users.side_effect = import_users
+        self.db.batch.return_value.commit.side_effect = [
+            None,
+            None,
+            RuntimeError("unavailable"),
+        ]
+
+        # Act
+        with patch.object(firebase_user_repository, "IMPORT_USERS_CHUNK_SIZE", 2):
+            failures = self.repository.import_users(users)
+
+        # Assert
+        assert imported_records == [
+            ["user0@example.com"],
+            ["user2@example.com", "user3@example.com"],
+            ["user4@example.com"],
+        ]
+        assert failures == {
+            1: "User with this email already exists",
+            2: "INVALID_EMAIL",
+            4: "Imported without profile: unavailable",
+        }
+        assert [bool(user.id) for user in users] == [True, False, False, True, True]
+
+    def test_delete_users_maps_error_index_to_uid(self):
+        """Test per-chunk Auth errors are reported against the right uids."""
+
+        # Arrange
+        def delete_users(user_ids):
+            if user_ids == ["user_2", "user_3"]:
+                raise RuntimeError("quota exceeded")
+            errors = []
+            if user_ids == ["user_0", "user_1"]:
+                errors = [SimpleNamespace(index=1, reason="USER_NOT_DISABLED")]
+            return SimpleNamespace(errors=errors)
+
+        self.auth_client.delete_users.side_effect = delete_users
+        single, bulk = Mock(), Mock()
+        self.repository.add_change_listener(single, bulk)
+
+        # Act
+        with patch.object(firebase_user_repository, "DELETE_USERS_CHUNK_SIZE", 2):
+            failures = self.repository.delete_users(
+                ["user_0", "user_1", "user_2", "user_3", "user_4"]
+            )
+
+        # Assert
+        assert failures == {
+            "user_1": "USER_NOT_DISABLED",
+            "user_2": "Error deleting user: quota exceeded",
+            "user_3": "Error deleting user: quota exceeded",
+        }
+        assert [call.args[0] for call in bulk.call_args_list] == [
+            ["user_0"],
+            ["user_4"],
+        ]
+        single.assert_not_called()
+        deleted_profiles = [
+            call.args[0].id for call in self.db.batch.return_value.delete.call_args_list
+        ]
+        assert sorted(deleted_profiles) == ["user_0", "user_4"]
+
+
+class TestFirebaseUserRepositoryUpdate(FirebaseStubs):
+    """Test cases for the partial and legacy user updates."""
+
+    def test_password_only_change_skips_firestore(self):
+        """Test a password change writes Auth only and still notifies."""
+        # Arrange
+        self.auth_client.update_user.return_value = user_record("user_1")
+        listener = Mock()
+        self.repository.add_change_listener(listener)
+
+        # Act
+        user = self.repository.update_user_fields("user_1", {"password": "new-pass1"})
+
+        # Assert
+        self.auth_client.update_user.assert_called_once_with(
+            "user_1", password="new-pass1"
+        )
+        self.db.collection.return_value.document.assert_not_called()
+        listener.assert_called_once_with("user_1")
+        assert user.alias == "user_1"
+
+    def test_profile_changes_write_only_changed_fields(self):
+        """Test email and alias go to Auth and to a single Firestore update."""
+        # Arrange
+        document = Mock()
+        self.db.collection.return_value.document.side_effect = None
+        self.db.collection.return_value.document.return_value = document
+        self.auth_client.update_user.return_value = user_record(
+            "user_1", "new@example.com"
+        )
+
+        # Act
+        user = self.repository.update_user_fields(
+            "user_1", {"email": "new@example.com", "alias": "newalias"}
+        )
+
+        # Assert
+        self.auth_client.update_user.assert_called_once_with(
+            "user_1", email="new@example.com", display_name="newalias"
+        )
+        document.update.assert_called_once_with(
+            {"email": "new@example.com", "alias": "newalias"}
+        )
+        assert user.email == "new@example.com"
+        assert user.alias == "newalias"
+
+    def test_email_taken_is_mapped(self):
+        """Test Firebase's duplicate-email error becomes "Email already in use"."""
+        self.auth_client.update_user.side_effect = _auth_utils.EmailAlreadyExistsError(
+            "taken", None, None
+        )
+
+        with pytest.raises(ValueError, match="Email already in use"):
+            self.repository.update_user_fields("user_1", {"email": "a@example.com"})
+
+        self.db.collection.return_value.document.assert_not_called()
+
+    def test_unknown_user_is_mapped(self):
+        """Test a missing account becomes "User not found"."""
+        self.auth_client.update_user.side_effect = _auth_utils.UserNotFoundError(
+            "missing"
+        )
+
+        with pytest.raises(ValueError, match="User not found"):
+            self.repository.update_user_fields("user_1", {"alias": "newalias"})
+
+    def test_legacy_update_notifies_after_the_profile_write(self):
+        """Test listeners run only once Firestore holds the new profile."""
+        # Arrange
+        document = Mock()
+        self.db.collection.return_value.document.side_effect = None
+        self.db.collection.return_value.document.return_value = document
+        self.auth_client.update_user.return_value = user_record("user_1")
+        written_when_notified = []
+        self.repository.add_change_listener(
+            lambda user_id: written_when_notified.append(document.update.called)
+        )
+
+        # Act
+        self.repository.update_user(
+            User(id="user_1", email="user_1@example.com", alias="newalias")
+        )
+
+        # Assert
+        assert written_when_notified == [True]
+
+
+def auth_page(user_ids: list[str], next_page=None) -> Mock:
+    page = Mock()
+    page.users = [user_record(user_id) for user_id in user_ids]
+    page.has_next_page = next_page is not None
+    page.get_next_page.return_value = next_page
+    return page
+
+
+class TestFirebaseUserRepositoryList(FirebaseStubs):
+    """Test cases for listing users page by page."""
+
+    def test_each_page_merges_profiles_in_one_batched_read(self):
+        """Test one get_all per Auth page, reading only the alias field."""
+        # Arrange
+        self.auth_client.list_users.return_value = auth_page(
+            ["user_1", "user_2"], auth_page(["user_3"])
+        )
+        self.db.get_all.side_effect = [[profile("user_1", "alice")], []]
+
+        # Act
+        users = self.repository.list_users()
+
+        # Assert
+        assert [user.id for user in users] == ["user_1", "user_2", "user_3"]
+        assert [user.alias for user in users] == ["alice", "user_2", "user_3"]
+        assert [
+            [reference.id for reference in call.args[0]]
+            for call in self.db.get_all.call_args_list
+        ] == [["user_1", "user_2"], ["user_3"]]
+        for call in self.db.get_all.call_args_list:
+            assert call.kwargs == {"field_paths": ["alias"]}
+
+    def test_next_page_is_fetched_while_profiles_are_read(self):
+        """Test the pipelined listing overlaps the next Auth page with get_all."""
+        # Arrange
+        next_page_requested = threading.Event()
+        first_page = auth_page(["user_1"], auth_page(["user_2"]))
+        first_page.get_next_page.side_effect = lambda: (
+            next_page_requested.set() or auth_page(["user_2"])
+        )
+        self.auth_client.list_users.return_value = first_page
+        overlapped = []
+
+        def get_all(references, field_paths):
+            if references[0].id == "user_1":
+                overlapped.append(next_page_requested.wait(timeout=5))
+            return []
+
+        self.db.get_all.side_effect = get_all
+
+        # Act
+        with patch.object(firebase_user_repository, "list_users_pipelined", True):
+            pages = list(self.repository.iter_user_pages())
+
+        # Assert
+        assert overlapped == [True]
+        assert [[user.id for user in page] for page in pages] == [
+            ["user_1"],
+            ["user_2"],
+        ]
+
+    def test_sequential_listing_when_not_pipelined(self):
+        """Test the fallback walks the same pages without a background fetch."""
+        # Arrange
+        self.auth_client.list_users.return_value = auth_page(["user_1"], auth_page([]))
+        self.db.get_all.return_value = []
+
+        # Act
+        with patch.object(firebase_user_repository, "list_users_pipelined", False):
+            pages = list(self.repository.iter_user_pages())
+
+        # Assert
+        assert [[user.id for user in page] for page in pages] == [["user_1"], []]
+        self.db.get_all.assert_called_once()
+
+    def test_page_maps_the_cursor_both_ways(self):
+        """Test the token is passed to Auth and its next token is returned."""
+        # Arrange
+        page = auth_page(["user_1"])
+        page.next_page_token = "next_abc"
+        self.auth_client.list_users.return_value = page
+        self.db.get_all.return_value = [profile("user_1", "alice")]
+
+        # Act
+        users, next_token = self.repository.list_users_page(10, "token_abc")
+
+        # Assert
+        self.auth_client.list_users.assert_called_once_with(
+            page_token="token_abc", max_results=10
+        )
+        assert [user.alias for user in users] == ["alice"]
+        assert next_token == "next_abc"
+
+    def test_last_page_has_no_cursor(self):
+        """Test Auth's empty next token becomes None."""
+        page = auth_page([])
+        page.next_page_token = ""
+        self.auth_client.list_users.return_value = page
+
+        users, next_token = self.repository.list_users_page(10)
+
+        assert users == []
+        assert next_token is None
+        self.db.get_all.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ValueError("Page token must be a non-empty string."),
+            exceptions.InvalidArgumentError("INVALID_PAGE_SELECTION"),
+        ],
+    )
+    def test_rejected_page_token_is_mapped(self, error):
+        """Test a malformed or unknown page token becomes "Invalid page token"."""
+        self.auth_client.list_users.side_effect = error
+
+        with pytest.raises(ValueError, match="Invalid page token"):
+            self.repository.list_users_page(10, "bogus")
+
+
+class TestFirebaseUserRepositoryLookup(FirebaseStubs):
+    """Test cases for the single-user lookups by uid and by email."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        super().setup_method()
+        self.profiles = {}
+        self.profiles_read_by_id = []
+
+        def document(user_id):
+            reference = Mock()
+            reference.get.side_effect = lambda: self.read_by_id(user_id)
+            return reference
+
+        users = self.db.collection.return_value
+        users.document.side_effect = document
+        self.email_query = users.where.return_value.limit.return_value
+
+    def read_by_id(self, user_id):
+        self.profiles_read_by_id.append(user_id)
+        if user_id in self.profiles:
+            return profile(user_id, self.profiles[user_id])
+        return SimpleNamespace(id=user_id, exists=False)
+
+    def test_get_user_reads_auth_and_profile(self):
+        """Test the Auth record and the profile are merged."""
+        self.auth_client.get_user.return_value = user_record("user_1")
+        self.profiles["user_1"] = "alice"
+
+        user = self.repository.get_user("user_1")
+
+        assert (user.id, user.email, user.alias) == (
+            "user_1",
+            "user_1@example.com",
+            "alice",
+        )
+        assert self.profiles_read_by_id == ["user_1"]
+
+    def test_get_user_reads_concurrently(self):
+        """Test the profile read is in flight while Auth is queried."""
+        # Arrange
+        profile_requested = threading.Event()
+        overlapped = []
+        self.profiles["user_1"] = "alice"
+
+        def get_user(user_id):
+            overlapped.append(profile_requested.wait(timeout=5))
+            return user_record(user_id)
+
+        def document(user_id):
+            profile_requested.set()
+            return Mock(get=Mock(return_value=profile(user_id, "alice")))
+
+        self.auth_client.get_user.side_effect = get_user
+        self.db.collection.return_value.document.side_effect = document
+
+        # Act
+        user = self.repository.get_user("user_1")
+
+        # Assert
+        assert overlapped == [True]
+        assert user.alias == "alice"
+
+    def test_get_user_not_found(self):
+        """Test a missing account becomes "User not found"."""
+        self.auth_client.get_user.side_effect = _auth_utils.UserNotFoundError("missing")
+
+        with pytest.raises(ValueError, match="User not found"):
+            self.repository.get_user("user_1")
+
+    def test_get_user_async_merges_profile(self):
+        """Test the async lookup returns the same merged user."""
+        self.auth_client.get_user.return_value = user_record("user_1")
+
+        user = asyncio.run(self.repository.get_user_async("user_1"))
+
+        assert user.id == "user_1"
+        assert user.alias == "user_1"  # no profile: Auth display_name
+
+    def test_by_email_uses_the_matching_profile(self):
+        """Test the speculative email query is used when its uid matches."""
+        self.auth_client.get_user_by_email.return_value = user_record("user_1")
+        self.email_query.stream.return_value = [profile("user_1", "alice")]
+
+        user = self.repository.get_user_by_email("user_1@example.com")
+
+        assert user.alias == "alice"
+        assert self.profiles_read_by_id == []
+
+    @pytest.mark.parametrize("candidates", [[profile("user_2", "bob")], []])
+    def test_by_email_falls_back_to_uid_read(self, candidates):
+        """Test a profile of another uid, or none, is re-read by Auth's uid."""
+        self.auth_client.get_user_by_email.return_value = user_record("user_1")
+        self.email_query.stream.return_value = candidates
+        self.profiles["user_1"] = "alice"
+
+        user = self.repository.get_user_by_email("user_1@example.com")
+
+        assert user.id == "user_1"
+        assert user.alias == "alice"
+        assert self.profiles_read_by_id == ["user_1"]
+
+    @pytest.mark.parametrize("candidates", [[profile("user_2", "bob")], []])
+    def test_by_email_async_falls_back_to_uid_read(self, candidates):
+        """Test the async lookup applies the same fallback."""
+        self.auth_client.get_user_by_email.return_value = user_record("user_1")
+        self.email_query.stream.return_value = candidates
+        self.profiles["user_1"] = "alice"
+
+        user = asyncio.run(self.repository.get_user_by_email_async("a@example.com"))
+
+        assert user.alias == "alice"
+        assert self.profiles_read_by_id == ["user_1"]
+
+    def test_by_email_unknown_returns_none(self):
+        """Test an email without an account returns None."""
+        self.auth_client.get_user_by_email.side_effect = _auth_utils.UserNotFoundError(
+            "missing"
+        )
+        self.email_query.stream.return_value = []
+
+        assert self.repository.get_user_by_email("nobody@example.com") is None
+
+
+class TestFirebaseUserRepositoryCreate(FirebaseStubs):
+    """Test cases for creating a user without a pre-flight email lookup."""
+
+    def test_create_writes_auth_then_profile(self):
+        """Test the account is created directly and its profile stored by uid."""
+        # Arrange
+        document = Mock()
+        self.db.collection.return_value.document.side_effect = None
+        self.db.collection.return_value.document.return_value = document
+        self.auth_client.create_user.return_value = user_record("user_1")
+
+        # Act
+        user = self.repository.create_user("user_1@example.com", "password123", "alice")
+
+        # Assert
+        self.auth_client.get_user_by_email.assert_not_called()
+        self.auth_client.create_user.assert_called_once_with(
+            email="user_1@example.com", password="password123", display_name="alice"
+        )
+        self.db.collection.return_value.document.assert_called_once_with("user_1")
+        document.set.assert_called_once_with(
+            {"id": "user_1", "email": "user_1@example.com", "alias": "alice"}
+        )
+        assert user.id == "user_1"
+        assert user.password == ""
+
+    def test_existing_email_is_mapped(self):
+        """Test Firebase's duplicate-email error keeps the old message."""
+        self.auth_client.create_user.side_effect = _auth_utils.EmailAlreadyExistsError(
+            "taken", None, None
+        )
+
+        with pytest.raises(ValueError, match="User with this email already exists"):
+            self.repository.create_user("user_1@example.com", "password123")
+
+        self.auth_client.get_user_by_email.assert_not_called()
+        self.db.collection.return_value.document.assert_not_called()
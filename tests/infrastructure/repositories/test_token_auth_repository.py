@@ -0,0 +1,285 @@
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from firebase_admin import auth
+from src.infrastructure.auth.id_token_verifier import (
+    IdTokenVerifier,
+    UnknownKeyIdError,
+)
+from src.infrastructure.auth.revocation_cache import RevocationCache
+from src.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from src.infrastructure.auth.token_prefilter import TokenPrefilter
+from src.infrastructure.repositories.token_auth_repository import TokenAuthRepository
+from src.domain.entities.refresh_token import RefreshToken
+
+REPOSITORY_MODULE = "src.infrastructure.repositories.token_auth_repository"
+
+
+def decoded_claims(exp_in: int = 3600) -> dict:
+    return {
+        "uid": "user_123",
+        "email": "test@example.com",
+        "email_verified": True,
+        "name": "testuser",
+        "user_id": "user_123",
+        "iat": int(time.time()),
+        "exp": time.time() + exp_in,
+    }
+
+
+class TestTokenAuthRepository:
+    """Test cases for TokenAuthRepository token verification."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.verifier = Mock(spec=IdTokenVerifier)
+        self.revocation_cache = Mock(spec=RevocationCache)
+        self.revocation_cache.is_fresh.return_value = True
+        self.prefilter = Mock(spec=TokenPrefilter)
+        self.repository = TokenAuthRepository(
+            verifier=self.verifier,
+            revocation_cache=self.revocation_cache,
+            prefilter=self.prefilter,
+        )
+
+    def test_verify_token_is_cached(self):
+        """Test repeated verifications of the same token hit the cache."""
+        self.verifier.verify.return_value = decoded_claims()
+
+        first = self.repository.verify_token("token_abc")
+        second = self.repository.verify_token("token_abc")
+
+        assert first == second
+        assert first["uid"] == "user_123"
+        self.verifier.verify.assert_called_once_with("token_abc")
+        assert self.repository.cache_stats()["hits"] == 1
+
+    def test_injected_empty_cache_is_used(self):
+        """Test an injected (empty, hence falsy) verified cache is kept."""
+        cache = LRUTTLCache(max_entries=10, default_ttl=60)
+
+        repository = TokenAuthRepository(
+            verified_cache=cache,
+            verifier=self.verifier,
+            prefilter=self.prefilter,
+            check_revoked=False,
+        )
+
+        assert repository.verified_cache is cache
+
+    def test_injected_empty_refreshed_cache_is_used(self):
+        """Test an injected (empty, hence falsy) refreshed-token cache is kept."""
+        cache = LRUTTLCache(max_entries=10, default_ttl=10)
+
+        repository = TokenAuthRepository(
+            refreshed_cache=cache,
+            verifier=self.verifier,
+            prefilter=self.prefilter,
+            check_revoked=False,
+        )
+
+        assert repository.refreshed_cache is cache
+
+    def test_cache_entry_does_not_outlive_token(self):
+        """Test tokens past their exp claim are not cached."""
+        self.verifier.verify.return_value = decoded_claims(exp_in=-1)
+
+        self.repository.verify_token("token_abc")
+        self.repository.verify_token("token_abc")
+
+        assert self.verifier.verify.call_count == 2
+
+    def test_verify_token_invalid(self):
+        """Test invalid tokens raise ValueError and are not cached."""
+        self.verifier.verify.side_effect = auth.InvalidIdTokenError("bad token")
+
+        with pytest.raises(ValueError, match="Invalid token"):
+            self.repository.verify_token("token_abc")
+
+        assert self.repository.cache_stats()["size"] == 0
+        self.prefilter.remember_rejection.assert_called_once()
+
+    def test_unknown_kid_is_not_remembered(self):
+        """Test a token rejected while the public keys are unavailable is retried."""
+        self.verifier.verify.side_effect = UnknownKeyIdError('Unknown "kid" claim')
+
+        with pytest.raises(ValueError, match="Invalid token"):
+            self.repository.verify_token("token_abc")
+
+        self.prefilter.remember_rejection.assert_not_called()
+
+        # The keys load and the same token now verifies.
+        self.verifier.verify.side_effect = None
+        self.verifier.verify.return_value = decoded_claims()
+        assert self.repository.verify_token("token_abc")["uid"] == "user_123"
+
+    def test_prefilter_rejection_skips_verifier(self):
+        """Test tokens rejected by the prefilter never reach the verifier."""
+        self.prefilter.check.side_effect = ValueError("Invalid token")
+
+        with pytest.raises(ValueError, match="Invalid token"):
+            self.repository.verify_token("garbage")
+
+        self.verifier.verify.assert_not_called()
+
+    def test_verify_token_async_uses_cache(self):
+        """Test the async path verifies once and then serves cache hits."""
+        self.verifier.verify.return_value = decoded_claims()
+
+        first = asyncio.run(self.repository.verify_token_async("token_abc"))
+        second = asyncio.run(self.repository.verify_token_async("token_abc"))
+
+        assert first == second
+        self.verifier.verify.assert_called_once_with("token_abc")
+
+    def test_verify_token_async_invalid(self):
+        """Test the async path maps verifier errors like the sync path."""
+        self.verifier.verify.side_effect = auth.ExpiredIdTokenError("expired", None)
+
+        with pytest.raises(ValueError, match="Expired token"):
+            asyncio.run(self.repository.verify_token_async("token_abc"))
+
+    def test_verify_token_checks_revocation_on_cache_hit(self):
+        """Test revoked tokens are rejected even when their signature is cached."""
+        self.verifier.verify.return_value = decoded_claims()
+        self.repository.verify_token("token_abc")
+        self.revocation_cache.check.side_effect = auth.RevokedIdTokenError("revoked")
+
+        with pytest.raises(ValueError, match="Revoked token"):
+            self.repository.verify_token("token_abc")
+
+    def test_verify_token_deleted_user(self):
+        """Test tokens of deleted users are rejected."""
+        self.verifier.verify.return_value = decoded_claims()
+        self.revocation_cache.check.side_effect = auth.UserNotFoundError("gone")
+
+        with pytest.raises(ValueError, match="User not found"):
+            self.repository.verify_token("token_abc")
+
+    def test_invalidate_user(self):
+        """Test invalidating a user drops its revocation state."""
+        self.repository.invalidate_user("user_123")
+
+        self.revocation_cache.invalidate.assert_called_once_with("user_123")
+
+    def test_revocation_check_can_be_disabled(self):
+        """Test no revocation cache is created when the check is disabled."""
+        repository = TokenAuthRepository(
+            verifier=self.verifier, check_revoked=False, prefilter=self.prefilter
+        )
+        self.verifier.verify.return_value = decoded_claims()
+
+        assert repository.verify_token("token_abc")["uid"] == "user_123"
+        assert repository.revocation_cache is None
+
+
+def refreshed_token() -> RefreshToken:
+    return RefreshToken(
+        access_token="new_access_token",
+        expires_in="3600",
+        token_type="Bearer",
+        refresh_token="new_refresh_token",
+        id_token="new_id_token",
+        user_id="user_123",
+        project_id="project_123",
+    )
+
+
+class TestTokenRefreshCoalescing:
+    """Test cases for single-flight token refresh."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.repository = TokenAuthRepository(
+            verifier=Mock(spec=IdTokenVerifier),
+            check_revoked=False,
+            prefilter=Mock(spec=TokenPrefilter),
+        )
+
+    def test_concurrent_refreshes_share_one_request(self):
+        """Test callers arriving while a refresh is in flight wait for it."""
+        # Arrange
+        release = threading.Event()
+        upstream_calls = []
+
+        def refresh_id_token(refresh_token):
+            upstream_calls.append(refresh_token)
+            release.wait(timeout=5)
+            return refreshed_token()
+
+        results = []
+        with patch(f"{REPOSITORY_MODULE}.FirebaseAuthAPI") as api_class:
+            api_class.return_value.refresh_id_token.side_effect = refresh_id_token
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        self.repository.refresh_token("refresh_abc")
+                    )
+                )
+                for _ in range(3)
+            ]
+
+            # Act
+            for thread in threads:
+                thread.start()
+            deadline = time.time() + 5
+            while self.repository.refresh_coalesced < 2 and time.time() < deadline:
+                time.sleep(0.001)
+            release.set()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        # Assert
+        assert upstream_calls == ["refresh_abc"]
+        assert len(results) == 3
+        assert all(result is results[0] for result in results)
+
+    def test_late_duplicates_get_the_recent_result(self):
+        """Test a refresh repeated within the grace window is not sent upstream."""
+        with patch(f"{REPOSITORY_MODULE}.FirebaseAuthAPI") as api_class:
+            api_class.return_value.refresh_id_token.return_value = refreshed_token()
+
+            first = self.repository.refresh_token("refresh_abc")
+            second = self.repository.refresh_token("refresh_abc")
+
+        assert first is second
+        api_class.return_value.refresh_id_token.assert_called_once_with("refresh_abc")
+
+    def test_failures_are_not_remembered(self):
+        """Test a failed refresh is retried by the next caller."""
+        with patch(f"{REPOSITORY_MODULE}.FirebaseAuthAPI") as api_class:
+            api_class.return_value.refresh_id_token.side_effect = [
+                ValueError("Failed to refresh ID token"),
+                refreshed_token(),
+            ]
+
+            with pytest.raises(ValueError, match="Error refreshing token"):
+                self.repository.refresh_token("refresh_abc")
+            result = self.repository.refresh_token("refresh_abc")
+
+        assert result.id_token == "new_id_token"
+        assert self.repository.refresh_stats()["in_flight"] == 0
+
+    def test_concurrent_async_refreshes_share_one_request(self):
+        """Test concurrent async callers share one upstream request."""
+        upstream_calls = []
+
+        async def refresh_id_token(refresh_token):
+            upstream_calls.append(refresh_token)
+            await asyncio.sleep(0.01)
+            return refreshed_token()
+
+        async def refresh_concurrently():
+            return await asyncio.gather(
+                *(self.repository.refresh_token_async("refresh_abc") for _ in range(5))
+            )
+
+        with patch(f"{REPOSITORY_MODULE}.AsyncFirebaseAuthAPI") as api_class:
+            api_class.return_value.refresh_id_token = refresh_id_token
+            results = asyncio.run(refresh_concurrently())
+
+        assert upstream_calls == ["refresh_abc"]
+        assert all(result is results[0] for result in results)
+        assert self.repository.refresh_stats()["coalesced"] == 4
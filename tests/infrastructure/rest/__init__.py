@@ -0,0 +1 @@
+"""Test package for Firebase REST clients."""
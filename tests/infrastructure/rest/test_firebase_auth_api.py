@@ -0,0 +1,271 @@
+import asyncio
+import httpx
+import pytest
+from src.domain.entities.refresh_token import RefreshToken
+from src.infrastructure.rest.firebase_auth_api import (
+    AsyncFirebaseAuthAPI,
+    EmailNotFoundError,
+    FirebaseAuthAPI,
+)
+from src.infrastructure.rest.http_client import get_http_client
+from src.infrastructure.rest.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    UpstreamUnavailableError,
+)
+
+
+def refresh_response() -> dict:
+    return {
+        "access_token": "new_access_token",
+        "expires_in": "3600",
+        "token_type": "Bearer",
+        "refresh_token": "new_refresh_token",
+        "id_token": "new_id_token",
+        "user_id": "user_123",
+        "project_id": "project_123",
+    }
+
+
+class TestFirebaseAuthAPI:
+    """Test cases for FirebaseAuthAPI over a mocked HTTP transport."""
+
+    def make_api(self, handler) -> FirebaseAuthAPI:
+        self.requests = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return handler(request)
+
+        api = FirebaseAuthAPI(
+            client=httpx.Client(transport=httpx.MockTransport(record))
+        )
+        api.identity_toolkit_breaker = CircuitBreaker("identitytoolkit", min_calls=2)
+        api.secure_token_breaker = CircuitBreaker("securetoken", min_calls=2)
+        api.refresh_retry = RetryPolicy(max_attempts=3, rng=lambda low, high: 0)
+        return api
+
+    def test_login_user_success(self):
+        """Test a successful sign-in returns the response payload."""
+        api = self.make_api(
+            lambda request: httpx.Response(200, json={"idToken": "abc"})
+        )
+
+        assert api.login_user("test@example.com", "password123") == {"idToken": "abc"}
+        assert "accounts:signInWithPassword" in str(self.requests[0].url)
+
+    def test_login_user_invalid_credentials(self):
+        """Test a rejected sign-in raises ValueError."""
+        api = self.make_api(lambda request: httpx.Response(400, json={}))
+
+        with pytest.raises(ValueError, match="Invalid login credentials"):
+            api.login_user("test@example.com", "wrong_password")
+
+    def test_refresh_id_token_posts_form_data(self):
+        """Test token refresh posts form data and builds a RefreshToken."""
+        api = self.make_api(
+            lambda request: httpx.Response(200, json=refresh_response())
+        )
+
+        result = api.refresh_id_token("refresh_abc")
+
+        assert isinstance(result, RefreshToken)
+        assert result.id_token == "new_id_token"
+        assert b"grant_type=refresh_token" in self.requests[0].content
+
+    def test_send_password_reset_email(self):
+        """Test a password reset request returns the confirmed email."""
+        api = self.make_api(
+            lambda request: httpx.Response(200, json={"email": "test@example.com"})
+        )
+
+        result = api.send_password_reset_email("test@example.com")
+
+        assert result == {"success": True, "response": "test@example.com"}
+
+    @pytest.mark.parametrize(
+        "code, error, message",
+        [
+            ("EMAIL_NOT_FOUND", EmailNotFoundError, "No user found with this email"),
+            ("USER_DISABLED", ValueError, "User disabled"),
+            ("INVALID_LOGIN_CREDENTIALS", ValueError, "Invalid login credentials"),
+            (
+                "TOO_MANY_ATTEMPTS_TRY_LATER : Access disabled",
+                ValueError,
+                "Invalid login credentials",
+            ),
+        ],
+    )
+    def test_login_user_maps_firebase_error_codes(self, code, error, message):
+        """Test sign-in errors are mapped from Firebase's error code."""
+        api = self.make_api(
+            lambda request: httpx.Response(400, json={"error": {"message": code}})
+        )
+
+        with pytest.raises(error, match=message):
+            api.login_user("test@example.com", "password123")
+
+    def test_send_password_reset_email_unknown_email(self):
+        """Test EMAIL_NOT_FOUND on reset maps to the existing message."""
+        api = self.make_api(
+            lambda request: httpx.Response(
+                400, json={"error": {"message": "EMAIL_NOT_FOUND"}}
+            )
+        )
+
+        with pytest.raises(EmailNotFoundError, match="No user found with this email"):
+            api.send_password_reset_email("nobody@example.com")
+
+    def test_default_client_is_shared(self):
+        """Test instances share one pooled client by default."""
+        assert FirebaseAuthAPI().client is get_http_client()
+        assert FirebaseAuthAPI().client is FirebaseAuthAPI().client
+
+    def test_refresh_id_token_retries_upstream_errors(self):
+        """Test refresh is retried after a 5xx answer and then succeeds."""
+        responses = iter(
+            [httpx.Response(503), httpx.Response(200, json=refresh_response())]
+        )
+        api = self.make_api(lambda request: next(responses))
+
+        result = api.refresh_id_token("valid_refresh_token")
+
+        assert isinstance(result, RefreshToken)
+        assert len(self.requests) == 2
+
+    def test_refresh_id_token_gives_up_after_max_attempts(self):
+        """Test persistent timeouts surface as UpstreamUnavailableError."""
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        api = self.make_api(handler)
+        api.secure_token_breaker = CircuitBreaker("securetoken")
+
+        with pytest.raises(UpstreamUnavailableError):
+            api.refresh_id_token("valid_refresh_token")
+
+        assert len(self.requests) == 3
+
+    def test_login_user_is_not_retried(self):
+        """Test sign-in is not retried and an outage is not reported as bad credentials."""
+        api = self.make_api(lambda request: httpx.Response(500))
+
+        with pytest.raises(UpstreamUnavailableError):
+            api.login_user("test@example.com", "password123")
+
+        assert len(self.requests) == 1
+
+    def test_open_breaker_fails_fast(self):
+        """Test an open breaker rejects calls without reaching the upstream."""
+        api = self.make_api(lambda request: httpx.Response(503))
+        for _ in range(2):
+            with pytest.raises(UpstreamUnavailableError):
+                api.send_password_reset_email("test@example.com")
+
+        with pytest.raises(UpstreamUnavailableError, match="temporarily unavailable"):
+            api.send_password_reset_email("test@example.com")
+
+        assert len(self.requests) == 2
+        assert api.identity_toolkit_breaker.stats()["state"] == "open"
+
+    def test_non_transport_http_errors_count_as_upstream_failures(self):
+        """Test httpx errors such as redirect loops surface as unavailability."""
+
+        def handler(request):
+            raise httpx.TooManyRedirects("loop", request=request)
+
+        api = self.make_api(handler)
+
+        with pytest.raises(UpstreamUnavailableError, match="TooManyRedirects"):
+            api.login_user("test@example.com", "password123")
+
+        assert api.identity_toolkit_breaker.stats()["failures"] == 1
+
+    def test_client_errors_do_not_trip_the_breaker(self):
+        """Test 4xx answers count as healthy upstream calls."""
+        api = self.make_api(lambda request: httpx.Response(400, json={}))
+        for _ in range(3):
+            with pytest.raises(ValueError, match="Invalid login credentials"):
+                api.login_user("test@example.com", "wrong_password")
+
+        assert api.identity_toolkit_breaker.stats()["failures"] == 0
+
+
+class TestAsyncFirebaseAuthAPI:
+    """Test cases for AsyncFirebaseAuthAPI over a mocked HTTP transport."""
+
+    def make_api(self, handler) -> AsyncFirebaseAuthAPI:
+        transport = httpx.MockTransport(handler)
+        api = AsyncFirebaseAuthAPI(client=httpx.AsyncClient(transport=transport))
+        api.identity_toolkit_breaker = CircuitBreaker("identitytoolkit")
+        api.secure_token_breaker = CircuitBreaker("securetoken")
+        api.refresh_retry = RetryPolicy(max_attempts=2, rng=lambda low, high: 0)
+        return api
+
+    def test_login_user_success(self):
+        """Test a successful async sign-in returns the response payload."""
+        api = self.make_api(
+            lambda request: httpx.Response(200, json={"idToken": "abc"})
+        )
+
+        result = asyncio.run(api.login_user("test@example.com", "password123"))
+
+        assert result == {"idToken": "abc"}
+
+    def test_refresh_id_token_failure(self):
+        """Test a rejected async refresh raises ValueError."""
+        api = self.make_api(lambda request: httpx.Response(400, json={}))
+
+        with pytest.raises(ValueError, match="Failed to refresh ID token"):
+            asyncio.run(api.refresh_id_token("bad_refresh_token"))
+
+    def test_refresh_id_token_retries_upstream_errors(self):
+        """Test async refresh retries a 429 answer."""
+        responses = iter(
+            [httpx.Response(429), httpx.Response(200, json=refresh_response())]
+        )
+        api = self.make_api(lambda request: next(responses))
+
+        result = asyncio.run(api.refresh_id_token("valid_refresh_token"))
+
+        assert isinstance(result, RefreshToken)
+
+    def test_cancelled_trial_call_does_not_wedge_the_breaker(self):
+        """Test cancelling the half-open trial lets the next call through."""
+        # Arrange
+        clock = [0.0]
+        breaker = CircuitBreaker(
+            "securetoken", min_calls=1, open_seconds=5, clock=lambda: clock[0]
+        )
+        breaker.record_failure()
+        clock[0] = 5
+        started = asyncio.Event()
+
+        async def hang(request):
+            started.set()
+            await asyncio.sleep(60)
+
+        async def healthy_handler(request):
+            return httpx.Response(200, json=refresh_response())
+
+        api = self.make_api(hang)
+        api.secure_token_breaker = breaker
+        api.refresh_retry = RetryPolicy(max_attempts=1)
+
+        async def cancel_trial():
+            task = asyncio.ensure_future(api.refresh_id_token("valid_refresh_token"))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        # Act
+        asyncio.run(cancel_trial())
+        healthy = self.make_api(healthy_handler)
+        healthy.secure_token_breaker = breaker
+        result = asyncio.run(healthy.refresh_id_token("valid_refresh_token"))
+
+        # Assert
+        assert isinstance(result, RefreshToken)
+        assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,133 @@
+import pytest
+from src.infrastructure.rest.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    UpstreamUnavailableError,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test cases for the failure-rate circuit breaker."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            "upstream",
+            failure_threshold=0.5,
+            min_calls=4,
+            window_seconds=10,
+            open_seconds=5,
+            clock=self.clock,
+        )
+
+    def test_stays_closed_below_min_calls(self):
+        """Test a few failures alone do not open the breaker."""
+        for _ in range(3):
+            self.breaker.record_failure()
+
+        self.breaker.before_call()
+        assert self.breaker.state == CircuitBreaker.CLOSED
+
+    def test_opens_when_failure_rate_reaches_threshold(self):
+        """Test the breaker opens and fails fast at the failure threshold."""
+        # Arrange
+        self.breaker.record_success()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        # Act & Assert
+        with pytest.raises(UpstreamUnavailableError):
+            self.breaker.before_call()
+        assert self.breaker.stats()["rejected"] == 1
+        assert self.breaker.stats()["times_opened"] == 1
+
+    def test_old_outcomes_leave_the_window(self):
+        """Test failures older than the window are forgotten."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 11
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_success()
+
+        assert self.breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_trial_success_closes(self):
+        """Test one trial call is allowed after the open period and can close it."""
+        # Arrange
+        for _ in range(4):
+            self.breaker.record_failure()
+        self.clock.now = 5
+
+        # Act
+        self.breaker.before_call()
+
+        # Assert
+        assert self.breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(UpstreamUnavailableError):
+            self.breaker.before_call()
+        self.breaker.record_success()
+        assert self.breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_trial_failure_reopens(self):
+        """Test a failed trial call re-opens the breaker."""
+        for _ in range(4):
+            self.breaker.record_failure()
+        self.clock.now = 5
+        self.breaker.before_call()
+
+        self.breaker.record_failure()
+
+        assert self.breaker.state == CircuitBreaker.OPEN
+        assert self.breaker.stats()["times_opened"] == 2
+
+    def test_abandoned_trial_frees_the_slot(self):
+        """Test a half-open trial that ends without an outcome lets another through."""
+        # Arrange
+        for _ in range(4):
+            self.breaker.record_failure()
+        self.clock.now = 5
+        self.breaker.before_call()
+
+        # Act
+        self.breaker.abandon_call()
+
+        # Assert
+        self.breaker.before_call()
+        assert self.breaker.state == CircuitBreaker.HALF_OPEN
+        self.breaker.record_success()
+        assert self.breaker.state == CircuitBreaker.CLOSED
+
+    def test_abandoned_call_records_nothing_when_closed(self):
+        """Test abandoning a call in the closed state leaves the counters alone."""
+        self.breaker.before_call()
+
+        self.breaker.abandon_call()
+
+        assert self.breaker.stats()["calls"] == 0
+        assert self.breaker.state == CircuitBreaker.CLOSED
+
+
+class TestRetryPolicy:
+    """Test cases for the jittered retry policy."""
+
+    def test_delays_are_bounded_exponential(self):
+        """Test the jitter upper bound doubles and is capped at max_delay."""
+        policy = RetryPolicy(
+            max_attempts=5, base_delay=0.5, max_delay=2.0, rng=lambda low, high: high
+        )
+
+        assert list(policy.delays()) == [0.5, 1.0, 2.0, 2.0]
+
+    def test_single_attempt_never_retries(self):
+        """Test max_attempts=1 yields no retry delays."""
+        assert list(RetryPolicy(max_attempts=1).delays()) == []
@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from graphql import GraphQLError
+from src.domain.repositories.token_repository import TokenRepository
+from src.interface.graphql.context import RequestAuth
+from src.interface.graphql.decorators import login_required
+
+
+@login_required
+async def protected_async(info):
+    return info.context["verified_token"]["uid"]
+
+
+@login_required
+def protected_sync(info):
+    return info.context["verified_token"]["uid"]
+
+
+class TestRequestAuth:
+    """Test cases for the per-request bearer token verification."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.repository = Mock(spec=TokenRepository)
+        self.repository.verify_token_async = AsyncMock(return_value={"uid": "user_123"})
+        self.repository.verify_token.return_value = {"uid": "user_123"}
+
+    def make_info(self, auth_header: list[str]) -> SimpleNamespace:
+        return SimpleNamespace(
+            context={"auth": RequestAuth(auth_header, self.repository)}
+        )
+
+    def test_concurrent_resolvers_share_one_verification(self):
+        """Test several protected resolvers of one request verify the token once."""
+        # Arrange
+        info = self.make_info(["Bearer", "token_abc"])
+
+        async def run_resolvers():
+            return await asyncio.gather(
+                protected_async(info=info),
+                protected_async(info=info),
+                protected_async(info=info),
+            )
+
+        # Act
+        uids = asyncio.run(run_resolvers())
+        uid = protected_sync(info=info)
+
+        # Assert
+        assert uids == ["user_123", "user_123", "user_123"]
+        assert uid == "user_123"
+        self.repository.verify_token_async.assert_awaited_once_with("token_abc")
+        self.repository.verify_token.assert_not_called()
+
+    def test_sync_resolvers_verify_once(self):
+        """Test the sync path also reuses the first verification."""
+        info = self.make_info(["Bearer", "token_abc"])
+
+        assert protected_sync(info=info) == "user_123"
+        assert protected_sync(info=info) == "user_123"
+
+        self.repository.verify_token.assert_called_once_with("token_abc")
+
+    def test_verification_error_is_memoised(self):
+        """Test a rejected token fails every resolver without being re-verified."""
+        # Arrange
+        self.repository.verify_token_async.side_effect = ValueError("Expired token")
+        info = self.make_info(["Bearer", "token_abc"])
+
+        # Act & Assert
+        for _ in range(2):
+            with pytest.raises(GraphQLError, match="Expired token") as error:
+                asyncio.run(protected_async(info=info))
+            assert error.value.extensions == {"code": "UNAUTHORIZED"}
+
+        self.repository.verify_token_async.assert_awaited_once_with("token_abc")
+
+    def test_bare_bearer_header_requires_authorization(self):
+        """Test a "Bearer" header without a token is rejected before verifying."""
+        info = self.make_info(["Bearer"])
+
+        with pytest.raises(GraphQLError, match="Authorization required"):
+            asyncio.run(protected_async(info=info))
+
+        self.repository.verify_token_async.assert_not_awaited()
+
+    def test_non_bearer_header_is_rejected(self):
+        """Test other authorization schemes are rejected."""
+        info = self.make_info(["Basic", "dXNlcjpwYXNz"])
+
+        with pytest.raises(GraphQLError, match="Invalid authorization header"):
+            protected_sync(info=info)
+
+        self.repository.verify_token.assert_not_called()
+
+    def test_cancelled_resolver_does_not_cancel_the_shared_verification(self):
+        """Test the other resolvers still get the claims when one is cancelled."""
+        # Arrange
+        release = asyncio.Event()
+
+        async def verify_token_async(token):
+            await release.wait()
+            return {"uid": "user_123"}
+
+        self.repository.verify_token_async.side_effect = verify_token_async
+        info = self.make_info(["Bearer", "token_abc"])
+
+        async def run_resolvers():
+            first = asyncio.ensure_future(protected_async(info=info))
+            second = asyncio.ensure_future(protected_async(info=info))
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(first, second, return_exceptions=True)
+
+        # Act
+        first, second = asyncio.run(run_resolvers())
+
+        # Assert
+        assert isinstance(first, asyncio.CancelledError)
+        assert second == "user_123"
+        self.repository.verify_token_async.assert_awaited_once_with("token_abc")